@@ -0,0 +1,60 @@
+"""
+Cache payload size and load time for 100,000 fractions, compared with pickle.
+
+Run from the repository root::
+
+    python benchmarks/bench_codec.py --values 100000 --repeat 5
+
+Each case is a list of fractions, as a computed result would be cached, and a list of
+rows holding a fraction, as a cached queryset's values would be.
+"""
+
+import argparse
+import os
+import pickle
+import random
+import sys
+import timeit
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djfractions.codec import FractionCacheSerializer, decode_fractions, encode_fractions  # noqa: E402
+
+
+def make_values(count):
+    rand = random.Random(0)
+    denominators = [2, 3, 4, 8, 16, 100]
+    return [Fraction(rand.randint(1, 64), rand.choice(denominators)) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = make_values(args.values)
+    rows = [{"id": i, "quantity": value} for i, value in enumerate(values)]
+    serializer = FractionCacheSerializer()
+    protocol = pickle.HIGHEST_PROTOCOL
+
+    cases = [
+        ("fractions pickle", values, lambda obj: pickle.dumps(obj, protocol), pickle.loads),
+        ("fractions encode_fractions", values, encode_fractions, decode_fractions),
+        ("fractions FractionCacheSerializer", values, serializer.dumps, serializer.loads),
+        ("rows pickle", rows, lambda obj: pickle.dumps(obj, protocol), pickle.loads),
+        ("rows FractionCacheSerializer", rows, serializer.dumps, serializer.loads),
+    ]
+
+    print("%d values, best of %d" % (args.values, args.repeat))
+    for name, obj, dumps, loads in cases:
+        data = dumps(obj)
+        assert loads(data) == obj
+        dump_time = min(timeit.repeat(lambda: dumps(obj), number=1, repeat=args.repeat))
+        load_time = min(timeit.repeat(lambda: loads(data), number=1, repeat=args.repeat))
+        print("%-36s %10d bytes %8.1f ms dumps %8.1f ms loads" % (name, len(data), dump_time * 1000, load_time * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Loading DecimalFractionField values from the database with the vendor specific converter
+compared with the generic from_db_value(), and with lazy=True, both without using the values
+and with each one converted by hash().
+
+Run from the repository root::
+
+    python benchmarks/bench_converters.py --rows 50000 --repeat 5
+
+SQLite runs in memory.  Add ``--postgresql NAME`` to also run against that PostgreSQL database,
+connection details other than the name are read from the usual PGHOST, PGUSER, and PGPASSWORD
+environment variables.  A temporary table is created and dropped.
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from django.conf import settings  # noqa: E402
+from django.db import connections  # noqa: E402
+
+from djfractions.models import DecimalFractionField  # noqa: E402
+from tests.models import TestModel  # noqa: E402
+
+FIELDS = ["defaults", "denominator_limited_to_ten", "coerce_thirds_true", "decimal_places_limited"]
+
+
+def make_rows(count):
+    rand = random.Random(0)
+    denominators = [2, 3, 4, 8, 16, 100]
+    rows = []
+    for i in range(count):
+        value = Decimal(rand.randint(1, 64)) / rand.choice(denominators)
+        rows.append(
+            TestModel(
+                defaults=round(value, 5),
+                denominator_limited_to_ten=round(value, 10),
+                coerce_thirds_true=round(value, 10),
+                decimal_places_limited=round(value, 10),
+            )
+        )
+    return rows
+
+
+def run(alias, rows, repeat):
+    connection = connections[alias]
+    with connection.schema_editor() as editor:
+        editor.create_model(TestModel)
+    try:
+        TestModel.objects.using(alias).bulk_create(rows, batch_size=1000)
+        queryset = TestModel.objects.using(alias).values_list(*FIELDS)
+        print("%s, %d rows of %d fields, best of %d" % (connection.vendor, len(rows), len(FIELDS), repeat))
+
+        def load():
+            return list(queryset.all())
+
+        db_converters = DecimalFractionField.db_converters
+        try:
+            DecimalFractionField.db_converters = {}
+            generic = min(timeit.repeat(load, number=1, repeat=repeat))
+            expected = load()
+        finally:
+            DecimalFractionField.db_converters = db_converters
+        specialized = min(timeit.repeat(load, number=1, repeat=repeat))
+        assert load() == expected
+
+        def load_and_use():
+            return [hash(row) for row in load()]
+
+        fields = [TestModel._meta.get_field(name) for name in FIELDS]
+        try:
+            for field in fields:
+                field.lazy = True
+            lazy = min(timeit.repeat(load, number=1, repeat=repeat))
+            lazy_used = min(timeit.repeat(load_and_use, number=1, repeat=repeat))
+            assert load() == expected
+        finally:
+            for field in fields:
+                field.lazy = False
+
+        for name, elapsed in (
+            ("from_db_value", generic),
+            ("vendor converter", specialized),
+            ("lazy, unused", lazy),
+            ("lazy, all used", lazy_used),
+        ):
+            print("  %-20s %8.1f ms %12.0f values/sec" % (name, elapsed * 1000, len(rows) * len(FIELDS) / elapsed))
+    finally:
+        with connection.schema_editor() as editor:
+            editor.delete_model(TestModel)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--postgresql", metavar="NAME", help="Also run against this PostgreSQL database")
+    args = parser.parse_args()
+
+    settings.DATABASES["default"]["NAME"] = ":memory:"
+    aliases = ["default"]
+    if args.postgresql:
+        settings.DATABASES["postgresql"] = {"ENGINE": "django.db.backends.postgresql", "NAME": args.postgresql}
+        # the connection settings are read once, make them read again to include the new database
+        connections.__dict__.pop("settings", None)
+        aliases.append("postgresql")
+
+    rows = make_rows(args.rows)
+    for alias in aliases:
+        run(alias, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
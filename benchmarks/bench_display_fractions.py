@@ -0,0 +1,63 @@
+"""
+Rendering a column of quantities with {% display_fraction %} in a {% for %} loop compared to
+rendering them all at once with {% display_fractions %}.
+
+Run from the repository root::
+
+    python benchmarks/bench_display_fractions.py --rows 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from django.template import Context, Template  # noqa: E402
+
+VALUES = [Decimal("0.5"), Decimal("1.25"), Decimal("0.33333"), Decimal("2.66667"), Decimal("0.125"), 4, 0.75]
+
+LOOP = Template(
+    "{% load fractions %}<table>{% for value in values %}<tr><td>{% display_fraction value %}</td></tr>{% endfor %}"
+    "</table>"
+)
+BATCH = Template(
+    "{% load fractions %}{% display_fractions values as rendered %}"
+    "<table>{% for html in rendered %}<tr><td>{{ html }}</td></tr>{% endfor %}</table>"
+)
+
+
+def best_of(template, values, repeat):
+    best = None
+    for i in range(repeat):
+        started = time.perf_counter()
+        output = template.render(Context({"values": values}))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    values = [rng.choice(VALUES) for i in range(args.rows)]
+    loop, loop_output = best_of(LOOP, values, args.repeat)
+    batch, batch_output = best_of(BATCH, values, args.repeat)
+    assert loop_output == batch_output
+
+    print("%-22s %10s" % ("template", "ms"))
+    print("%-22s %10.1f" % ("display_fraction loop", loop * 1000))
+    print("%-22s %10.1f" % ("display_fractions", batch * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Exporting a table with a DecimalFractionField as CSV by loading the whole queryset and formatting
+each value with get_fraction_parts() in a loop, compared with streaming it with
+djfractions.export.iter_csv().  Reports the time and the peak memory traced by tracemalloc.
+
+Run from the repository root::
+
+    python benchmarks/bench_export.py --rows 100000
+
+SQLite runs in memory, and does not have server-side cursors, so the streaming peak includes the
+chunks the driver buffers.
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from djfractions import get_fraction_parts  # noqa: E402
+from djfractions.export import iter_csv  # noqa: E402
+from tests.models import TestModel  # noqa: E402
+
+FIELDS = ["id", "defaults"]
+
+
+def make_rows(count):
+    rand = random.Random(0)
+    return [TestModel(defaults=Decimal(rand.randint(1, 64)) / rand.choice([2, 4, 8, 16])) for i in range(count)]
+
+
+def with_list(sink):
+    rows = list(TestModel.objects.order_by("pk"))
+    writer = csv.writer(sink)
+    writer.writerow(FIELDS)
+    for row in rows:
+        whole, numerator, denominator = get_fraction_parts(row.defaults)
+        if not numerator:
+            value = "%d" % whole
+        elif whole:
+            value = "%d %d/%d" % (whole, numerator, denominator)
+        else:
+            value = "%d/%d" % (numerator, denominator)
+        writer.writerow([row.id, value])
+
+
+def with_iter_csv(sink):
+    for chunk in iter_csv(TestModel.objects.order_by("pk"), FIELDS):
+        sink.write(chunk)
+
+
+class CountingSink:
+    """
+    Counts what is written rather than keeping it, as a response or file would.
+    """
+
+    def __init__(self):
+        self.written = 0
+
+    def write(self, value):
+        self.written += len(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    settings.DATABASES["default"]["NAME"] = ":memory:"
+    with connection.schema_editor() as editor:
+        editor.create_model(TestModel)
+    TestModel.objects.bulk_create(make_rows(args.rows), batch_size=500)
+
+    expected = io.StringIO()
+    with_iter_csv(expected)
+    check = io.StringIO()
+    with_list(check)
+    assert check.getvalue() == expected.getvalue()
+
+    print("%-16s %10s %12s %12s" % ("approach", "seconds", "rows/sec", "peak MB"))
+    for function in (with_list, with_iter_csv):
+        sink = CountingSink()
+        tracemalloc.start()
+        started = time.perf_counter()
+        function(sink)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("%-16s %10.3f %12.0f %12.1f" % (function.__name__, elapsed, args.rows / elapsed, peak / 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+FloatBackedFractionField compared with DecimalFractionField holding the same fractions: converting
+the stored values, with the float snapped to its fraction and, for comparison, converted with
+Fraction(float).limit_denominator(), and loading, sorting, summing, and filtering a table.
+
+Run from the repository root::
+
+    python benchmarks/bench_float_field.py --rows 50000 --repeat 5
+
+SQLite runs in memory.  Both models get an index on their value column.  SQLite stores decimals with
+REAL affinity as well, so the query timings show the converters rather than the column type, which is
+where PostgreSQL's double precision is faster than numeric.
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from decimal import Decimal
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Index, Sum  # noqa: E402
+
+from djfractions.models import DecimalFractionField, FloatBackedFractionField  # noqa: E402
+from tests.models import FloatBackedTestModel, TestModel  # noqa: E402
+
+DENOMINATORS = [2, 3, 4, 8, 16, 100]
+
+
+def make_fractions(count):
+    rand = random.Random(0)
+    return [Fraction(rand.randint(1, 640), rand.choice(DENOMINATORS)) for i in range(count)]
+
+
+def conversions(values):
+    decimal_field = DecimalFractionField(max_digits=10, decimal_places=5)
+    float_field = FloatBackedFractionField()
+    decimals = [decimal_field.get_prep_value(value).quantize(Decimal("0.00001")) for value in values]
+    floats = [float_field.get_prep_value(value) for value in values]
+    assert [float_field.from_db_value(value, None, None) for value in floats] == [
+        float_field.to_python(value) for value in floats
+    ]
+    return [
+        ("decimal, from_db_decimal", lambda: [decimal_field.from_db_decimal(value, None, None) for value in decimals]),
+        ("float, limit_denominator", lambda: [float_field.to_python(value) for value in floats]),
+        ("float, snapped", lambda: [float_field.from_db_value(value, None, None) for value in floats]),
+    ]
+
+
+def queries(model, field):
+    return [
+        ("load", lambda: list(model.objects.values_list(field, flat=True))),
+        ("order by", lambda: list(model.objects.order_by(field).values_list("pk", flat=True))),
+        ("sum", lambda: model.objects.aggregate(total=Sum(field))),
+        ("filter range", lambda: list(model.objects.filter(**{field + "__range": (1, 2)}).values_list("pk"))),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = make_fractions(args.rows)
+    print("%-28s %10s %14s" % ("conversion", "best sec", "values/sec"))
+    for name, function in conversions(values):
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print("%-28s %10.4f %14.0f" % (name, best, len(values) / best))
+
+    settings.DATABASES["default"]["NAME"] = ":memory:"
+    with connection.schema_editor() as editor:
+        editor.create_model(TestModel)
+        editor.create_model(FloatBackedTestModel)
+        editor.add_index(TestModel, Index(fields=["defaults"], name="bench_decimal_idx"))
+        editor.add_index(FloatBackedTestModel, Index(fields=["value"], name="bench_float_idx"))
+    TestModel.objects.bulk_create([TestModel(defaults=value) for value in values], batch_size=500)
+    FloatBackedTestModel.objects.bulk_create([FloatBackedTestModel(value=value) for value in values], batch_size=500)
+
+    print()
+    print("%-28s %12s %12s" % ("query", "decimal sec", "float sec"))
+    for (name, decimal_query), (_, float_query) in zip(
+        queries(TestModel, "defaults"), queries(FloatBackedTestModel, "value")
+    ):
+        decimal_best = min(timeit.repeat(decimal_query, number=1, repeat=args.repeat))
+        float_best = min(timeit.repeat(float_query, number=1, repeat=args.repeat))
+        print("%-28s %12.4f %12.4f" % (name, decimal_best, float_best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Server time to clean a formset of FractionFields when the text is submitted compared to the
+``numerator/denominator`` value which FractionInput's javascript submits.
+
+Run from the repository root::
+
+    python benchmarks/bench_fraction_input.py --rows 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(USE_I18N=False)
+django.setup()
+
+from django import forms  # noqa: E402
+
+from djfractions import try_parse_quantity  # noqa: E402
+from djfractions.forms import FractionField  # noqa: E402
+from djfractions.widgets import FractionInput  # noqa: E402
+
+QUANTITIES = ["1", "2", "1/2", "3/4", "2/3", "1 1/2", "2-1/4", "1 and 1/3", "0.5", "1.25"]
+
+
+class IngredientForm(forms.Form):
+    quantity = FractionField(widget=FractionInput)
+
+
+IngredientFormSet = forms.formset_factory(IngredientForm, extra=0)
+
+
+def make_data(rows, canonical, seed=0):
+    rng = random.Random(seed)
+    data = {"form-TOTAL_FORMS": str(rows), "form-INITIAL_FORMS": "0"}
+    for row in range(rows):
+        quantity = rng.choice(QUANTITIES)
+        data["form-%d-quantity" % row] = quantity
+        if canonical:
+            value = try_parse_quantity(quantity).value
+            data["form-%d-quantity_canonical" % row] = "%d/%d" % (value.numerator, value.denominator)
+    return data
+
+
+def best_of(data, repeat):
+    best = None
+    for i in range(repeat):
+        started = time.perf_counter()
+        formset = IngredientFormSet(data)
+        assert formset.is_valid()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("%-12s %10s %12s" % ("submitted", "ms", "us/row"))
+    for name, canonical in (("text", False), ("canonical", True)):
+        elapsed = best_of(make_data(args.rows, canonical), args.repeat)
+        print("%-12s %10.1f %12.1f" % (name, elapsed * 1000, elapsed * 1e6 / args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Finding every quantity in recipe like text with iter_quantities() compared with splitting the
+text into words and trying quantity_to_fraction() on each.
+
+Run from the repository root::
+
+    python benchmarks/bench_iter_quantities.py --documents 10000
+
+Splitting on whitespace also misses mixed numbers such as ``1 1/2``, which span two words.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djfractions import iter_quantities, quantity_to_fraction  # noqa: E402
+from djfractions.exceptions import InvalidFractionString  # noqa: E402
+
+QUANTITIES = ["1", "2", "12", "1/2", "3/4", "1 1/2", "2-1/4", "1 and 1/3", "0.5", ".25"]
+UNITS = ["cups", "tsp", "tbsp", "oz", "lb", "g", "cloves", "pinch"]
+WORDS = ["flour", "salt", "butter", "sugar", "milk", "then", "add", "stir", "until", "smooth", "bake", "for"]
+
+
+def make_documents(count, seed=0):
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        steps = []
+        for step in range(rng.randint(3, 12)):
+            words = [rng.choice(WORDS) for word in range(rng.randint(3, 10))]
+            steps.append(
+                "%s %s %s %s." % (" ".join(words[:2]), rng.choice(QUANTITIES), rng.choice(UNITS), " ".join(words[2:]))
+            )
+        documents.append("\n".join(steps))
+    return documents
+
+
+def with_split(documents):
+    found = 0
+    for document in documents:
+        for word in document.split():
+            try:
+                quantity_to_fraction(word)
+                found += 1
+            except (InvalidFractionString, ValueError, ZeroDivisionError):
+                pass
+    return found
+
+
+def with_iter_quantities(documents):
+    found = 0
+    for document in documents:
+        for quantity in iter_quantities(document):
+            found += 1
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=10000)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents)
+    megabytes = sum(len(document) for document in documents) / 1e6
+    print("%-22s %10s %12s %10s" % ("approach", "seconds", "quantities", "MB/sec"))
+    for function in (with_split, with_iter_quantities):
+        started = time.perf_counter()
+        found = function(documents)
+        elapsed = time.perf_counter() - started
+        print("%-22s %10.3f %12d %10.2f" % (function.__name__, elapsed, found, megabytes / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Encoding and decoding 100,000 fractions as JSON.
+
+Run from the repository root::
+
+    python benchmarks/bench_json.py --values 100000 --repeat 5
+
+The baseline is the usual ``default`` hook which formats each fraction with
+``get_fraction_parts()``.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from djfractions import get_fraction_parts  # noqa: E402
+from djfractions.serializers import (  # noqa: E402
+    FractionJSONDecoder,
+    FractionJSONEncoder,
+    StructuredFractionJSONEncoder,
+    fraction_from_json,
+    orjson_default,
+    orjson_structured_default,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parts_default(obj):
+    if isinstance(obj, Fraction):
+        whole, numerator, denominator = get_fraction_parts(obj, allow_mixed_numbers=False)
+        return "%d/%d" % (numerator, denominator)
+    raise TypeError
+
+
+def make_payload(count):
+    rand = random.Random(0)
+    denominators = [2, 3, 4, 8, 16, 100]
+    return [{"id": i, "quantity": Fraction(rand.randint(1, 64), rand.choice(denominators))} for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_payload(args.values)
+    text = json.dumps(payload, cls=FractionJSONEncoder)
+    structured_text = json.dumps(payload, cls=StructuredFractionJSONEncoder)
+
+    def decode_strings():
+        return [dict(row, quantity=fraction_from_json(row["quantity"])) for row in json.loads(text)]
+
+    cases = [
+        ("encode json default=get_fraction_parts", lambda: json.dumps(payload, default=parts_default)),
+        ("encode FractionJSONEncoder", lambda: json.dumps(payload, cls=FractionJSONEncoder)),
+        ("encode StructuredFractionJSONEncoder", lambda: json.dumps(payload, cls=StructuredFractionJSONEncoder)),
+        ("decode json + fraction_from_json", decode_strings),
+        ("decode FractionJSONDecoder", lambda: json.loads(structured_text, cls=FractionJSONDecoder)),
+    ]
+    if orjson is not None:
+        orjson_text = orjson.dumps(payload, default=orjson_default)
+        orjson_structured = orjson.dumps(payload, default=orjson_structured_default)
+        cases += [
+            ("encode orjson default=get_fraction_parts", lambda: orjson.dumps(payload, default=parts_default)),
+            ("encode orjson_default", lambda: orjson.dumps(payload, default=orjson_default)),
+            ("encode orjson_structured_default", lambda: orjson.dumps(payload, default=orjson_structured_default)),
+            (
+                "decode orjson + fraction_from_json",
+                lambda: [dict(row, quantity=fraction_from_json(row["quantity"])) for row in orjson.loads(orjson_text)],
+            ),
+            (
+                "decode orjson structured",
+                lambda: [
+                    dict(row, quantity=fraction_from_json(row["quantity"])) for row in orjson.loads(orjson_structured)
+                ],
+            ),
+        ]
+
+    print("%d values, best of %d" % (args.values, args.repeat))
+    for name, function in cases:
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print("%-42s %8.1f ms %12.0f values/sec" % (name, best * 1000, args.values / best))
+
+
+if __name__ == "__main__":
+    main()
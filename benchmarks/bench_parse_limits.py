@@ -0,0 +1,78 @@
+"""
+Worst case parsing cost for long quantity strings, with and without ParseLimits.
+
+Run from the repository root::
+
+    python benchmarks/bench_parse_limits.py --sizes 10 1000 100000 1000000
+
+Each input is a fraction, a decimal, and a mixed number with the given number of digits.
+With the default limits the time to reject an input stays flat as it grows.  Without them
+the time grows with the input, or Python's own int conversion limit stops it part way.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djfractions import ParseLimits, quantity_to_decimal, quantity_to_fraction  # noqa: E402
+from djfractions.exceptions import InvalidFractionString  # noqa: E402
+
+UNLIMITED = ParseLimits(max_length=None, max_digits=None, max_denominator=None, max_exponent=None)
+
+
+def make_inputs(size):
+    digits = "9" * size
+    return {
+        "fraction": "1/" + digits,
+        "decimal": "0." + digits,
+        "mixed": "1 7/" + digits,
+    }
+
+
+def time_call(function, value, limits, repeat=3):
+    best = None
+    for i in range(repeat):
+        started = time.perf_counter()
+        try:
+            function(value, limits=limits)
+            outcome = "ok"
+        except InvalidFractionString:
+            outcome = "limit"
+        except ValueError:
+            # python's int max str digits, and similar
+            outcome = "ValueError"
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print("%-10s %-9s %-22s %14s %11s" % ("digits", "input", "function", "limits", "no limits"))
+    for size in args.sizes:
+        for name, value in make_inputs(size).items():
+            for function in (quantity_to_fraction, quantity_to_decimal):
+                limited, limited_outcome = time_call(function, value, None)
+                unlimited, unlimited_outcome = time_call(function, value, UNLIMITED)
+                print(
+                    "%-10d %-9s %-22s %8.3f ms %-5s %8.3f ms %s"
+                    % (
+                        size,
+                        name,
+                        function.__name__,
+                        limited * 1000,
+                        limited_outcome,
+                        unlimited * 1000,
+                        unlimited_outcome,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
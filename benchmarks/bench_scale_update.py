@@ -0,0 +1,82 @@
+"""
+Scaling every DecimalFractionField value of a table by a Fraction, by loading each row, multiplying
+in Python and calling save(), with bulk_update(), and with one QuerySet.update() using
+F("defaults") * Fraction(3, 2).
+
+Run from the repository root::
+
+    python benchmarks/bench_scale_update.py --rows 20000
+
+SQLite runs in memory.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from fractions import Fraction
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from django.conf import settings  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.db.models import F  # noqa: E402
+
+from tests.models import TestModel  # noqa: E402
+
+SCALE = Fraction(3, 2)
+
+
+def make_rows(count):
+    rand = random.Random(0)
+    return [TestModel(defaults=Decimal(rand.randint(1, 64)) / rand.choice([2, 4, 8, 16])) for i in range(count)]
+
+
+def with_save():
+    with transaction.atomic():
+        for row in TestModel.objects.all():
+            row.defaults = row.defaults * SCALE
+            row.save(update_fields=["defaults"])
+
+
+def with_bulk_update():
+    rows = list(TestModel.objects.all())
+    for row in rows:
+        row.defaults = row.defaults * SCALE
+    TestModel.objects.bulk_update(rows, ["defaults"], batch_size=500)
+
+
+def with_update():
+    TestModel.objects.update(defaults=F("defaults") * SCALE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    settings.DATABASES["default"]["NAME"] = ":memory:"
+    with connection.schema_editor() as editor:
+        editor.create_model(TestModel)
+
+    rows = make_rows(args.rows)
+    expected = None
+    print("%-18s %10s %14s" % ("approach", "seconds", "rows/sec"))
+    for function in (with_save, with_bulk_update, with_update):
+        TestModel.objects.all().delete()
+        TestModel.objects.bulk_create(rows, batch_size=1000)
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+        values = list(TestModel.objects.order_by("defaults").values_list("defaults", flat=True))
+        assert expected is None or values == expected, function.__name__
+        expected = values
+        print("%-18s %10.3f %14.0f" % (function.__name__, elapsed, args.rows / elapsed))
+
+
+if __name__ == "__main__":
+    main()
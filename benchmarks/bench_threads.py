@@ -0,0 +1,105 @@
+"""
+Throughput of the parse, format and render paths from several threads at once.
+
+Run from the repository root::
+
+    python benchmarks/bench_threads.py --threads 1 2 4 8 --seconds 2
+
+On a standard CPython build the GIL keeps pure python work from scaling, so this
+mostly shows that the caches do not make things worse as threads are added.  On
+free-threaded builds it shows how well the sharded caches scale.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import runtests  # noqa: E402,F401 configures django settings
+
+from django.template import Context, Template  # noqa: E402
+
+from djfractions import (  # noqa: E402
+    format_fraction,
+    fraction_parts_cache,
+    get_fraction_parts,
+    quantity_to_fraction,
+)
+
+QUANTITIES = ["1", "1/2", "1 1/4", "2-3/4", "1 and 1/3", ".25", "3/8", "10", "2 2/3", "7/16"]
+VALUES = [Decimal("0.5"), Decimal("1.25"), 0.3333333333, 2.6666666667, Decimal("0.125"), 4, 0.75]
+TEMPLATE = Template("{% load fractions %}{% display_fraction value %}")
+
+
+def parse():
+    for quantity in QUANTITIES:
+        quantity_to_fraction(quantity)
+
+
+def parts():
+    for value in VALUES:
+        get_fraction_parts(value)
+
+
+def format_values():
+    for value in VALUES:
+        format_fraction(value, "unicode")
+
+
+def render():
+    for value in VALUES:
+        TEMPLATE.render(Context({"value": value}))
+
+
+WORKLOADS = {"parse": parse, "parts": parts, "format": format_values, "render": render}
+
+
+def run(workload, thread_count, seconds):
+    stop = threading.Event()
+    counts = [0] * thread_count
+
+    def worker(index):
+        while not stop.is_set():
+            workload()
+            counts[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(thread_count)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), nargs="+", default=sorted(WORKLOADS))
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("python %s, GIL %s" % (sys.version.split()[0], "enabled" if gil else "disabled"))
+    print("%-8s %8s %14s %8s" % ("workload", "threads", "batches/sec", "scaling"))
+    for name in args.workload:
+        baseline = None
+        for thread_count in args.threads:
+            rate = run(WORKLOADS[name], thread_count, args.seconds)
+            baseline = baseline or rate
+            print("%-8s %8d %14.0f %7.2fx" % (name, thread_count, rate, rate / baseline))
+    stats = fraction_parts_cache.stats()
+    print(
+        "get_fraction_parts cache: %d hits, %d misses, %.1f%% hit rate"
+        % (stats.hits, stats.misses, stats.hit_rate * 100)
+    )
+
+
+if __name__ == "__main__":
+    main()
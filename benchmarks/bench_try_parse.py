@@ -0,0 +1,72 @@
+"""
+Validating a column of quantity strings by catching exceptions from quantity_to_fraction()
+compared to collecting results from try_parse_quantities().
+
+Run from the repository root::
+
+    python benchmarks/bench_try_parse.py --cells 100000 --invalid 0.15
+
+The column is a mix of whole numbers, fractions, mixed numbers, and decimals, with the given
+share of cells replaced by junk such as ``n/a``, ``1/0``, or ``2 cups``.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djfractions import quantity_to_fraction, try_parse_quantities  # noqa: E402
+from djfractions.exceptions import InvalidFractionString  # noqa: E402
+
+VALID = ["1", "12", "1/2", "3/4", "2/3", "1 1/2", "2-1/4", "0.5", "1.25", "-1/8"]
+INVALID = ["n/a", "", "1/0", "one", "cups 2", "1 1 1/4", "??", "1/" + "9" * 40]
+
+
+def make_column(cells, invalid, seed=0):
+    rng = random.Random(seed)
+    return [rng.choice(INVALID) if rng.random() < invalid else rng.choice(VALID) for i in range(cells)]
+
+
+def with_exceptions(column):
+    errors = []
+    for row, cell in enumerate(column):
+        try:
+            quantity_to_fraction(cell)
+        except (InvalidFractionString, ValueError, ZeroDivisionError) as e:
+            errors.append((row, str(e)))
+    return errors
+
+
+def with_results(column):
+    return [(row, result.error) for row, result in enumerate(try_parse_quantities(column)) if not result.ok]
+
+
+def best_of(function, column, repeat):
+    best = None
+    for i in range(repeat):
+        started = time.perf_counter()
+        errors = function(column)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cells", type=int, default=100000)
+    parser.add_argument("--invalid", type=float, default=0.15, help="share of cells which are junk")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    column = make_column(args.cells, args.invalid)
+    print("%-24s %10s %10s %14s" % ("approach", "seconds", "errors", "cells/sec"))
+    for function in (with_exceptions, with_results):
+        elapsed, errors = best_of(function, column, args.repeat)
+        print("%-24s %10.3f %10d %14.0f" % (function.__name__, elapsed, errors, args.cells / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Parsing quantities which may contain unicode vulgar fraction characters, such as ``1½``, by passing them
+straight to quantity_to_fraction() compared with first replacing each character with its ascii fraction.
+
+Run from the repository root::
+
+    python benchmarks/bench_unicode_fractions.py --values 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djfractions import FRACTION_SLASH, UNICODE_FRACTIONS, quantity_to_fraction  # noqa: E402
+
+ASCII = ["1", "2", "12", "1/2", "3/4", "1 1/2", "2-1/4", "1 and 1/3", "0.5", ".25"]
+UNICODE = ["½", "1½", "2 ¾", "⅞", "1⅓", "5⁄16", "1 3⁄8"]
+
+
+def make_values(count, unicode_share, seed=0):
+    rng = random.Random(seed)
+    return [rng.choice(UNICODE if rng.random() < unicode_share else ASCII) for i in range(count)]
+
+
+def with_replace(values):
+    results = []
+    for value in values:
+        for (numerator, denominator), character in UNICODE_FRACTIONS.items():
+            value = value.replace(character, " %d/%d" % (numerator, denominator))
+        results.append(quantity_to_fraction(value.replace(FRACTION_SLASH, "/")))
+    return results
+
+
+def with_table(values):
+    return [quantity_to_fraction(value) for value in values]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=200000)
+    args = parser.parse_args()
+
+    print("%-14s %-14s %10s %14s" % ("unicode share", "approach", "seconds", "values/sec"))
+    for unicode_share in (0.0, 0.2, 1.0):
+        values = make_values(args.values, unicode_share)
+        expected = with_table(values)
+        for function in (with_replace, with_table):
+            started = time.perf_counter()
+            results = function(values)
+            elapsed = time.perf_counter() - started
+            assert results == expected, function.__name__
+            print("%-14s %-14s %10.3f %14.0f" % (unicode_share, function.__name__, elapsed, len(values) / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Parsing ingredient lines into a quantity and unit with UnitRegistry.parse(), compared with splitting
+the line with a regular expression and then calling quantity_to_fraction() and looking up the unit,
+and with the registry's units compiled as a plain alternation rather than a trie.
+
+Run from the repository root::
+
+    python benchmarks/bench_units.py --lines 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djfractions import _QUANTITY_PATTERN, _UNICODE_FRACTION_CHARACTERS, quantity_to_fraction  # noqa: E402
+from djfractions.units import UnitRegistry, unit_registry  # noqa: E402
+
+QUANTITIES = ["1", "2", "12", "1/2", "3/4", "1 1/2", "2-1/4", "1 and 1/3", "0.5", ".25"]
+UNITS = ["cups", "tsp", "tbsp.", "oz", "lbs", "g", "cloves", "pinch", "fl oz", "kilograms", ""]
+INGREDIENTS = ["flour", "salt", "butter", "sugar", "milk", "garlic", "olive oil", "eggs"]
+
+SPLIT = re.compile(r"\s*(-?[\d./]+(?:(?:\s+and\s+|\s*-\s*|\s+)\d+/\d+)?)\s*(fl oz|[a-zA-Z]+\.?)?\s*(.*)")
+
+
+def make_lines(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        ("%s %s %s" % (rng.choice(QUANTITIES), rng.choice(UNITS), rng.choice(INGREDIENTS))).replace("  ", " ")
+        for i in range(count)
+    ]
+
+
+def with_split(lines):
+    aliases = unit_registry.units
+    results = []
+    for line in lines:
+        quantity, unit, rest = SPLIT.match(line).groups()
+        unit_name = aliases.get(unit.rstrip(".").lower()) if unit else None
+        results.append((quantity_to_fraction(quantity), unit_name))
+    return results
+
+
+def with_registry(registry):
+    def parse(lines):
+        return [registry.parse(line)[:2] for line in lines]
+
+    return parse
+
+
+class AlternationRegistry(UnitRegistry):
+    """
+    The same registry with the units compiled as a plain alternation, longest first.
+    """
+
+    @property
+    def pattern(self):
+        if self._pattern is None:
+            alternation = "|".join(re.escape(alias) for alias in sorted(self._aliases, key=len, reverse=True))
+            self._pattern = re.compile(
+                r"[ \t]*("
+                + _QUANTITY_PATTERN
+                + r")(?![\d/\u2044%s]|[.,]\d)[ \t]*(?:(?i:(%s))(?!\w)\.?[ \t]*)?"
+                % (_UNICODE_FRACTION_CHARACTERS, alternation),
+                re.VERBOSE,
+            )
+        return self._pattern
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=200000)
+    args = parser.parse_args()
+
+    lines = make_lines(args.lines)
+    expected = with_registry(unit_registry)(lines)
+    print("%-24s %10s %14s" % ("approach", "seconds", "lines/sec"))
+    for name, function in (
+        ("split then parse", with_split),
+        ("registry, alternation", with_registry(AlternationRegistry())),
+        ("registry, trie", with_registry(unit_registry)),
+    ):
+        started = time.perf_counter()
+        results = function(lines)
+        elapsed = time.perf_counter() - started
+        assert results == expected, name
+        print("%-24s %10.3f %14.0f" % (name, elapsed, len(lines) / elapsed))
+
+
+if __name__ == "__main__":
+    main()
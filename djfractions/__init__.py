@@ -1,18 +1,32 @@
 __version__ = "5.0.0"
 
 import fractions
+import math
+import numbers
 import re
 from decimal import Decimal
-from typing import Any, Union
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
-from djfractions.exceptions import InvalidFractionString, NoHtmlUnicodeEntity
+from djfractions.cache import ShardedCache
+from djfractions.exceptions import InvalidFractionString, NoHtmlUnicodeEntity, ParseLimitExceeded
 
 __all__ = [
     "quantity_to_decimal",
+    "ParseLimits",
+    "check_quantity",
+    "ParseResult",
+    "try_parse_quantity",
+    "try_parse_quantities",
+    "iter_quantities",
     "is_number",
     "is_fraction",
     "get_fraction_parts",
+    "approximate_fraction",
     "get_fraction_unicode_entity",
+    "format_fraction",
+    "fraction_sum",
+    "fraction_mean",
+    "intern_fraction",
 ]
 
 # Aligns with https://docs.python.org/3/library/fractions.html#fractions.Fraction.limit_denominator
@@ -38,6 +52,167 @@ HTML_ENTITIES = [
     "&frac78;",
 ]
 
+# Unicode vulgar fraction characters, keyed by (numerator, denominator)
+UNICODE_FRACTIONS = {
+    (1, 2): "\u00bd",
+    (1, 3): "\u2153",
+    (2, 3): "\u2154",
+    (1, 4): "\u00bc",
+    (3, 4): "\u00be",
+    (1, 5): "\u2155",
+    (2, 5): "\u2156",
+    (3, 5): "\u2157",
+    (4, 5): "\u2158",
+    (1, 6): "\u2159",
+    (5, 6): "\u215a",
+    (1, 7): "\u2150",
+    (1, 8): "\u215b",
+    (3, 8): "\u215c",
+    (5, 8): "\u215d",
+    (7, 8): "\u215e",
+    (1, 9): "\u2151",
+    (1, 10): "\u2152",
+}
+
+# U+2044 FRACTION SLASH, used for fractions which have no single unicode character
+FRACTION_SLASH = "\u2044"
+
+# Results of get_fraction_parts(), keyed by its arguments.  The same handful of values
+# tend to be displayed over and over, so this skips the limit_denominator() and
+# coerce_to_thirds() work for them.
+fraction_parts_cache = ShardedCache(maxsize=8192)
+
+# Shared instances handed out by intern_fraction(), keyed by (numerator, denominator).
+fraction_pool = ShardedCache(maxsize=1024)
+
+
+class ParseLimits(NamedTuple):
+    """
+    Limits on the quantity strings accepted by :func:`quantity_to_fraction`, :func:`quantity_to_decimal`,
+    and the form fields, so that a huge input cannot tie up a worker converting big integers.
+    None turns a limit off.
+
+    :ivar int max_length: The most characters in the whole string
+    :ivar int max_digits: The most digits in a single run of digits, such as the numerator
+    :ivar int max_denominator: The largest denominator written after a ``/``
+    :ivar int max_exponent: The largest exponent, positive or negative, in scientific notation such as ``1e-5``
+    """
+
+    max_length: Optional[int] = 100
+    max_digits: Optional[int] = 30
+    max_denominator: Optional[int] = 10**12
+    max_exponent: Optional[int] = 100
+
+
+class ParseResult(NamedTuple):
+    """
+    The result of :func:`try_parse_quantity`.
+
+    :ivar value: The :class:`fractions.Fraction`, or None if the quantity could not be parsed
+    :ivar str error: None if the quantity was parsed.  Otherwise ``empty``, ``invalid``,
+        ``zero_denominator``, or the code of the :class:`ParseLimits` limit which was exceeded.
+    :ivar int position: The index in the string where the problem was found, or -1 if it was parsed.
+        For ``invalid`` this is the first character which cannot be part of a quantity, or 0 when
+        each character is fine but they are not arranged as a quantity, such as ``1 1 1/4``.
+    """
+
+    value: Optional[fractions.Fraction]
+    error: Optional[str] = None
+    position: int = -1
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# The limits used when none are passed in.  Assign a new ParseLimits() to change them everywhere.
+parse_limits = ParseLimits()
+
+# The forms accepted by _quantity_to_fraction(), in the order it tries them, for try_parse_quantity().
+# Numbers are the strings Fraction() accepts without a slash, which is_number() also accepts.  Fraction()
+# only accepts the underscores from python 3.11, so they are removed first.
+_NUMBER = re.compile(r"[-+]?(?=\d|\.\d)(?:\d+(?:_\d+)*)?(?:\.(?:\d+(?:_\d+)*)?)?(?:[eE][-+]?\d+(?:_\d+)*)?")
+_SIMPLE_FRACTION = re.compile(r"(-?\d+)/(\d+)")
+_MIXED_NUMBER = re.compile(r"-?(\d+)(?:\s+|\s*-?\s*|\s+and\s+)(\d+)/(\d+)")
+
+# The value of each unicode vulgar fraction character, looked up by _quantity_to_fraction(), so that
+# quantities such as ½, 1½, or 2 ¾ are read without first replacing each character in the string.
+_UNICODE_FRACTION_VALUES: Dict[str, fractions.Fraction] = {
+    character: fractions.Fraction(*parts) for parts, character in UNICODE_FRACTIONS.items()
+}
+# VULGAR FRACTION ZERO THIRDS, which is never written out by format_fraction()
+_UNICODE_FRACTION_VALUES["\u2189"] = fractions.Fraction(0)
+_UNICODE_FRACTION_CHARACTERS = "".join(_UNICODE_FRACTION_VALUES)
+_UNICODE_MIXED_NUMBER = re.compile(r"(-)?\s*(?:(\d+)(?:\s+and\s+|\s*-?\s*))?([%s])" % _UNICODE_FRACTION_CHARACTERS)
+
+# Characters which can be part of a quantity, used to find the position of an invalid one
+_QUANTITY_CHARACTERS = re.compile(r"(?:\d|\s|and|[-+/._eE\u2044%s])*" % _UNICODE_FRACTION_CHARACTERS)
+
+# Quantities within other text, for iter_quantities() and djfractions.units.  The same forms as
+# _quantity_to_fraction() but without exponents or underscores, and with only spaces and tabs around
+# separators so that a number at the end of one line and a fraction at the start of the next are not
+# read as a mixed number.  A fraction may also be a unicode vulgar fraction character, or be written with
+# U+2044 FRACTION SLASH.  The nine groups are turned into a value by _quantity_span_value().
+_QUANTITY_PATTERN = r"""
+    (-)?
+    (?:
+        (\d+)(?:
+            (?:[ \t]+and[ \t]+|[ \t]*-[ \t]*|[ \t]+)(\d+)[ \t]*[/\u2044][ \t]*(\d+)
+            |(?:[ \t]+and[ \t]+|[ \t]*-[ \t]*|[ \t]*)([%s])
+        )
+        |(\d+)[ \t]*[/\u2044][ \t]*(\d+)
+        |(\d+(?:\.\d+)?|\.\d+)
+        |([%s])
+    )
+""" % (_UNICODE_FRACTION_CHARACTERS, _UNICODE_FRACTION_CHARACTERS)
+# Numbers which run into letters, other numbers, dates such as 1/2/2024, versions such as 1.2.3, or
+# thousands separators are not matched, and a hyphen is only a sign when it does not follow a word.
+_QUANTITY_SPAN = re.compile(r"(?<![\w./\u2044])(?<!\d,)" + _QUANTITY_PATTERN + r"(?![\w/\u2044]|[.,]\d)", re.VERBOSE)
+
+# Runs of digits, which int() and Fraction() allow underscores in, the denominator after
+# a slash, and the exponent of scientific notation, for check_quantity()
+_DIGITS = re.compile(r"\d[\d_]*")
+_DENOMINATOR = re.compile(r"[/\u2044]\s*(\d+)")
+_EXPONENT = re.compile(r"[\d.][eE][-+]?(\d[\d_]*)")
+
+# Spelled out quantities such as "twenty five", "one and a half", or "three quarters", read by
+# _words_to_fraction().  Every word is looked up here as (kind, value) so a quantity is read in one
+# pass over its words.  "second" is left out as it is more often a unit of time than a denominator.
+_NUMBER_WORD, _ARTICLE_WORD, _SCALE_WORD, _DENOMINATOR_WORD, _AND_WORD = range(5)
+_WORDS: Dict[str, Tuple[int, int]] = {
+    "a": (_ARTICLE_WORD, 1),
+    "an": (_ARTICLE_WORD, 1),
+    "and": (_AND_WORD, 0),
+    "hundred": (_SCALE_WORD, 100),
+    "thousand": (_SCALE_WORD, 10**3),
+    "million": (_SCALE_WORD, 10**6),
+    "billion": (_SCALE_WORD, 10**9),
+    "half": (_DENOMINATOR_WORD, 2),
+    "halves": (_DENOMINATOR_WORD, 2),
+    "quarter": (_DENOMINATOR_WORD, 4),
+    "quarters": (_DENOMINATOR_WORD, 4),
+    "hundredth": (_DENOMINATOR_WORD, 100),
+    "hundredths": (_DENOMINATOR_WORD, 100),
+}
+for _value, _word in enumerate(
+    "zero one two three four five six seven eight nine ten eleven twelve thirteen fourteen fifteen sixteen "
+    "seventeen eighteen nineteen".split()
+):
+    _WORDS[_word] = (_NUMBER_WORD, _value)
+for _value, _word in enumerate("twenty thirty forty fifty sixty seventy eighty ninety".split(), 2):
+    _WORDS[_word] = (_NUMBER_WORD, _value * 10)
+for _value, _word in enumerate(
+    "third fourth fifth sixth seventh eighth ninth tenth eleventh twelfth thirteenth fourteenth fifteenth "
+    "sixteenth seventeenth eighteenth nineteenth twentieth".split(),
+    3,
+):
+    _WORDS[_word] = _WORDS[_word + "s"] = (_DENOMINATOR_WORD, _value)
+del _value, _word
+_WORD_SEPARATOR = re.compile(r"[\s-]+")
+
+# Output styles understood by format_fraction()
+FRACTION_STYLES = ("mixed", "improper", "html", "unicode")
+
 
 def is_number(s: Any) -> bool:
     """
@@ -88,19 +263,119 @@ def coerce_to_thirds(value: fractions.Fraction) -> fractions.Fraction:
     return value
 
 
-def quantity_to_decimal(quantity_string: str) -> Decimal:
+def _from_coprime_ints(numerator: int, denominator: int) -> fractions.Fraction:
+    # For a numerator and denominator which are already reduced, with the sign on the numerator.
+    # Setting the attributes directly, as Fraction._from_coprime_ints() does on python 3.12+,
+    # skips the type checks and gcd in Fraction.__new__().
+    value = object.__new__(fractions.Fraction)
+    value._numerator = numerator  # type: ignore[attr-defined]
+    value._denominator = denominator  # type: ignore[attr-defined]
+    return value
+
+
+def _may_be_thirds(numerator: int, denominator: int) -> bool:
+    """
+    Returns False when :func:`coerce_to_thirds` would certainly leave numerator / denominator unchanged,
+    without its float and Decimal work.  It rounds the value to hundredths, which gives floor(100 * value)
+    or one more, and only changes positive values ending in .3, .33, .6, or .67.
+    """
+    if numerator <= 0:
+        return False
+    if numerator > denominator << 40:
+        # large enough that float rounding could be off by more than a hundredth, let coerce_to_thirds decide
+        return True
+    return (100 * numerator // denominator) % 100 in (29, 30, 32, 33, 59, 60, 66, 67)
+
+
+def intern_fraction(value: fractions.Fraction) -> fractions.Fraction:
+    """
+    Returns a shared instance equal to value from :data:`fraction_pool`, adding value to the
+    pool if there is not one.  Fractions are immutable, so when the same few values are loaded
+    or parsed over and over, interning lets them all use one object.  Once the pool is full the
+    oldest entries are dropped to make room.
+
+    :param value: The :class:`fractions.Fraction` to intern
+    """
+    if type(value) is not fractions.Fraction:
+        return value
+    key = (value.numerator, value.denominator)
+    interned = fraction_pool.get(key)
+    if interned is None:
+        fraction_pool.set(key, value)
+        return value
+    return interned
+
+
+def check_quantity(quantity_string: str, limits: Optional[ParseLimits] = None) -> None:
+    """
+    Raise :class:`djfractions.exceptions.ParseLimitExceeded` if quantity_string is beyond the limits.
+    Only the length of the string and of its runs of digits are looked at, so the cost is bounded
+    by max_length and no large numbers are ever built.
+
+    :param quantity_string: The string to check
+    :param limits: The :class:`ParseLimits` to use.  Defaults to :data:`parse_limits`.
+    """
+    error = _find_limit_error(quantity_string, limits)
+    if error is not None:
+        code, limit, position = error
+        raise ParseLimitExceeded(_LIMIT_MESSAGES[code] % limit, code=code, limit=limit)
+
+
+_LIMIT_MESSAGES = {
+    "max_length": "Quantity is longer than %d characters",
+    "max_digits": "Quantity has a number with more than %d digits",
+    "max_denominator": "Quantity has a denominator larger than %d",
+    "max_exponent": "Quantity has an exponent larger than %d",
+}
+
+
+def _find_limit_error(quantity_string: str, limits: Optional[ParseLimits]) -> Optional[Tuple[str, int, int]]:
+    """
+    Returns (code, limit, position) for the first limit quantity_string is beyond, or None.
+    """
+    if limits is None:
+        limits = parse_limits
+    max_length, max_digits, max_denominator, max_exponent = limits
+
+    if max_length is not None and len(quantity_string) > max_length:
+        return ("max_length", max_length, max_length)
+    if max_digits is not None:
+        for match in _DIGITS.finditer(quantity_string):
+            if match.end() - match.start() > max_digits:
+                return ("max_digits", max_digits, match.start())
+    if max_denominator is not None:
+        for match in _DENOMINATOR.finditer(quantity_string):
+            digits = match.group(1).lstrip("0")
+            # compare lengths first so that a long denominator is never turned into an int
+            if len(digits) > len(str(max_denominator)) or int(digits or 0) > max_denominator:
+                return ("max_denominator", max_denominator, match.start(1))
+    if max_exponent is not None:
+        # Fraction("1e999999999") would build 10 ** 999999999
+        for match in _EXPONENT.finditer(quantity_string):
+            digits = match.group(1).replace("_", "").lstrip("0")
+            if len(digits) > len(str(max_exponent)) or int(digits or 0) > max_exponent:
+                return ("max_exponent", max_exponent, match.start(1))
+    return None
+
+
+def quantity_to_decimal(quantity_string: str, limits: Optional[ParseLimits] = None) -> Decimal:
     """
     Take a quantity string and return a decimal.
 
     Handles one hundred, two hundred, three hundred twenty five,
-    1, 1 1/4, 1 and 1/4, 1.25, .25.  Negative values should have
-    the negative sign first, such as -1/4 or -1 1/4
+    one and a half, three quarters, 1, 1 1/4, 1 and 1/4, 1.25, .25.
+    Negative values should have the negative sign first, such as -1/4 or -1 1/4
 
     :param quantity_string: String to convert to a :class:`decimal.Decimal`
+    :param limits: The :class:`ParseLimits` to check quantity_string against before converting it.
+        Defaults to :data:`parse_limits`.
     """
+    check_quantity(quantity_string, limits)
 
     # get actual fraction-like strings to be N/N with no spaces
     quantity_string = quantity_string.strip()
+    if FRACTION_SLASH in quantity_string:
+        quantity_string = quantity_string.replace(FRACTION_SLASH, "/")
     quantity_string = re.sub(r"\b(\d+)\s+/\s+(\d+)\b", r"\1/\2", quantity_string)
 
     if is_number(quantity_string):
@@ -109,6 +384,15 @@ def quantity_to_decimal(quantity_string: str) -> Decimal:
     if is_fraction(quantity_string):
         return _fraction_string_to_decimal(quantity_string)
 
+    unicode_parts = _unicode_mixed_number(quantity_string)
+    if unicode_parts is not None:
+        positive_or_negative, whole, fraction = unicode_parts
+        return (Decimal(whole) + Decimal(fraction.numerator / fraction.denominator)) * positive_or_negative
+
+    value = _words_to_fraction(quantity_string)
+    if value is not None:
+        return Decimal(value.numerator / value.denominator)
+
     # assume the a hyphen between a whole value and fraction such as 1-1/4
     # is a separator and not a negative fraction.
     # If the negative is first though, then we need to keep it negative.
@@ -129,25 +413,47 @@ def quantity_to_decimal(quantity_string: str) -> Decimal:
     return Decimal(sum(number_stack)) * positive_or_negative
 
 
-def quantity_to_fraction(quantity_string: str) -> fractions.Fraction:
+def quantity_to_fraction(
+    quantity_string: str, intern: bool = False, limits: Optional[ParseLimits] = None
+) -> fractions.Fraction:
     """
     Take a quantity string and return a :class:`fractions.Fraction`.
 
     Handles one hundred, two hundred, three hundred twenty five,
-    1, 1 1/4, 1 and 1/4, 1-1/4, 1.25, .25. Negative values should have
-    the negative sign first, such as -1/4 or -1 1/4
+    one and a half, three quarters, 1, 1 1/4, 1 and 1/4, 1-1/4, 1.25, .25.
+    Negative values should have the negative sign first, such as -1/4 or -1 1/4
 
     :param quantity_string: String to convert to a :class:`fractions.Fraction`
+    :param bool intern: If True return the shared instance from :data:`fraction_pool`
+        when there is one.  Defaults to False.
+    :param limits: The :class:`ParseLimits` to check quantity_string against before converting it.
+        Defaults to :data:`parse_limits`.
     """
+    check_quantity(quantity_string, limits)
+    fraction = _quantity_to_fraction(quantity_string)
+    if intern:
+        return intern_fraction(fraction)
+    return fraction
+
+
+def _quantity_to_fraction(quantity_string: str) -> fractions.Fraction:
     # get actual fraction-like strings to be N/N with no spaces
     quantity_string = quantity_string.strip()
+    if FRACTION_SLASH in quantity_string:
+        quantity_string = quantity_string.replace(FRACTION_SLASH, "/")
     quantity_string = re.sub(r"\b(\d+)\s+/\s+(\d+)\b", r"\1/\2", quantity_string)
     if is_number(quantity_string):
-        return fractions.Fraction(quantity_string)
+        # float() accepts underscores between digits, but Fraction() only from python 3.11
+        return fractions.Fraction(quantity_string.replace("_", ""))
 
     if is_fraction(quantity_string):
         return _fraction_string_to_fraction(quantity_string)
 
+    unicode_parts = _unicode_mixed_number(quantity_string)
+    if unicode_parts is not None:
+        positive_or_negative, whole, fraction = unicode_parts
+        return (fraction + whole) * positive_or_negative
+
     # it must be a something like 1 1/4
     # assume that a hyphen between a whole value and fraction such as 1-1/4
     # is a separator and not a negative fraction.
@@ -161,7 +467,11 @@ def quantity_to_fraction(quantity_string: str) -> fractions.Fraction:
     # 1 1/4, 1-1/4, 1 - 1/4, 1 and 1/4
     parts = re.match(r"^-?(\d+)(?:\s+|\s*-?\s*|\s+and\s+)(\d+\/\d+)", quantity_string)
     if not parts:
-        raise InvalidFractionString("%s is not a valid fraction" % quantity_string)
+        # or it is spelled out, such as one and a half
+        value = _words_to_fraction(quantity_string)
+        if value is None:
+            raise InvalidFractionString("%s is not a valid fraction" % quantity_string)
+        return value
     # parts.group(0) is the entire string, 1 is the whole number bit
     f = fractions.Fraction(parts.group(2))
     f = (f + int(parts.group(1))) * positive_or_negative
@@ -188,12 +498,307 @@ def _fraction_string_to_decimal(fraction: str) -> Decimal:
     return Decimal(numerator / denominator)
 
 
+def _unicode_mixed_number(quantity_string: str) -> Optional[Tuple[int, int, fractions.Fraction]]:
+    """
+    Returns (positive_or_negative, whole, fraction) for a quantity ending in a unicode vulgar fraction
+    character, such as ``½``, ``1½``, or ``-2 and ¾``, or None.
+    """
+    # most quantities are ruled out by looking up the last character
+    if quantity_string[-1:] not in _UNICODE_FRACTION_VALUES:
+        return None
+    match = _UNICODE_MIXED_NUMBER.fullmatch(quantity_string)
+    if match is None:
+        return None
+    sign, whole, character = match.groups()
+    return (-1 if sign else 1, int(whole or 0), _UNICODE_FRACTION_VALUES[character])
+
+
+def _words_to_fraction(quantity_string: str) -> Optional[fractions.Fraction]:
+    """
+    Returns the value of a spelled out quantity such as ``twenty five``, ``one and a half``,
+    ``three quarters``, or ``2 thirds``, or None if quantity_string is not one.
+    """
+    quantity_string = quantity_string.strip().lower()
+    positive_or_negative = 1
+    if quantity_string.startswith("-"):
+        positive_or_negative = -1
+        quantity_string = quantity_string[1:].lstrip()
+
+    whole = None  # the number before "and"
+    and_limit = 0  # a number after "and" must be below this, as in one hundred and five
+    total = 0  # the thousands, millions, and billions of the number being read
+    current = None  # the part of the number being read below a thousand
+    # a number word may only follow if it is below this, so "twenty five" is read but not "five twenty".
+    # None before the first word of a number.
+    limit: Optional[int] = None
+    fraction: Optional[fractions.Fraction] = None
+    kind: Optional[int] = _AND_WORD
+    for word in _WORD_SEPARATOR.split(quantity_string):
+        if fraction is not None:
+            return None
+        if word.isdecimal():
+            kind, value = _NUMBER_WORD, int(word)
+            tens = False
+        else:
+            kind, value = _WORDS.get(word, (None, 0))
+            tens = kind == _NUMBER_WORD and value >= 20
+        if kind == _NUMBER_WORD or kind == _ARTICLE_WORD:
+            if limit is not None and (kind == _ARTICLE_WORD or not 0 < value < limit):
+                return None
+            current = (current or 0) + value
+            limit = 10 if tens else 0
+        elif kind == _SCALE_WORD:
+            if not current:
+                return None
+            if value == 100:
+                if current >= 100:
+                    return None
+                current *= 100
+            else:
+                # one million five thousand, but not one thousand five million
+                if total % (value * 1000) or current >= 1000:
+                    return None
+                total += current * value
+                current = None
+            limit = value
+        elif kind == _DENOMINATOR_WORD:
+            numerator = total + (current or 0)
+            if limit is None:
+                # half, quarter
+                numerator = 1
+            fraction = fractions.Fraction(numerator, value)
+        elif kind == _AND_WORD:
+            if limit is None or whole is not None:
+                return None
+            whole = total + (current or 0)
+            and_limit = limit
+            total, current, limit = 0, None, None
+        else:
+            return None
+
+    if kind == _AND_WORD or kind == _ARTICLE_WORD:
+        # nothing read, or a quantity ending in "and" or "a"
+        return None
+    if fraction is None:
+        number = total + (current or 0)
+        if whole is not None and not 0 < number < and_limit:
+            return None
+        return fractions.Fraction(number + (whole or 0)) * positive_or_negative
+    return (fraction + (whole or 0)) * positive_or_negative
+
+
+def _zero_denominator(quantity_string: str) -> ParseResult:
+    # the position just after the slash of the fraction the caller matched
+    match = _DENOMINATOR.search(quantity_string)
+    return ParseResult(None, "zero_denominator", match.start() + 1 if match is not None else 0)
+
+
+def try_parse_quantity(quantity_string: Any, limits: Optional[ParseLimits] = None) -> ParseResult:
+    """
+    Parse a quantity string the same way as :func:`quantity_to_fraction`, but return a :class:`ParseResult`
+    rather than raising an exception for bad input.  No exceptions are raised or caught along the way, which
+    makes checking many values where a lot are invalid, such as the cells of an import, much faster.
+
+    ``None`` and blank strings give the error ``empty``.  ints, floats, Decimals, and Fractions are converted
+    as they are.
+
+    :param quantity_string: The string to parse
+    :param limits: The :class:`ParseLimits` to check quantity_string against.  Defaults to :data:`parse_limits`.
+    """
+    if not isinstance(quantity_string, str):
+        return _try_parse_number(quantity_string)
+
+    stripped = quantity_string.strip()
+    if not stripped:
+        return ParseResult(None, "empty", 0)
+    limit_error = _find_limit_error(quantity_string, limits)
+    if limit_error is not None:
+        return ParseResult(None, limit_error[0], limit_error[2])
+
+    # the same steps as _quantity_to_fraction()
+    if FRACTION_SLASH in stripped:
+        stripped = stripped.replace(FRACTION_SLASH, "/")
+    if " /" in stripped:
+        stripped = re.sub(r"\b(\d+)\s+/\s+(\d+)\b", r"\1/\2", stripped)
+
+    if _NUMBER.fullmatch(stripped):
+        return ParseResult(fractions.Fraction(stripped.replace("_", "")))
+
+    match = _SIMPLE_FRACTION.fullmatch(stripped)
+    if match:
+        numerator, denominator = int(match.group(1)), int(match.group(2))
+        if not denominator:
+            return _zero_denominator(quantity_string)
+        return ParseResult(fractions.Fraction(numerator, denominator))
+
+    # like _quantity_to_fraction(), anything after the fraction of a mixed number is ignored
+    match = _MIXED_NUMBER.match(stripped)
+    if match:
+        whole, numerator, denominator = (int(group) for group in match.groups())
+        if not denominator:
+            return _zero_denominator(quantity_string)
+        value = fractions.Fraction(numerator, denominator) + whole
+        return ParseResult(-value if stripped.startswith("-") else value)
+
+    unicode_parts = _unicode_mixed_number(stripped)
+    if unicode_parts is not None:
+        positive_or_negative, whole, fraction = unicode_parts
+        return ParseResult((fraction + whole) * positive_or_negative)
+
+    words_value = _words_to_fraction(stripped)
+    if words_value is not None:
+        return ParseResult(words_value)
+
+    # the pattern matches the empty string, so there is always a match
+    valid = _QUANTITY_CHARACTERS.match(quantity_string)
+    assert valid is not None
+    return ParseResult(None, "invalid", valid.end() % len(quantity_string))
+
+
+def _try_parse_number(value: Any) -> ParseResult:
+    if value is None:
+        return ParseResult(None, "empty", 0)
+    if isinstance(value, numbers.Rational):
+        return ParseResult(fractions.Fraction(value))
+    if isinstance(value, Decimal) and value.is_finite():
+        return ParseResult(fractions.Fraction(value))
+    if isinstance(value, float) and math.isfinite(value):
+        return ParseResult(fractions.Fraction(value))
+    return ParseResult(None, "invalid", 0)
+
+
+def try_parse_quantities(quantity_strings: Iterable[Any], limits: Optional[ParseLimits] = None) -> List[ParseResult]:
+    """
+    Returns a :class:`ParseResult` from :func:`try_parse_quantity` for each of quantity_strings, so that
+    every error can be collected in one pass::
+
+        results = try_parse_quantities(column)
+        errors = [(row, result.error) for row, result in enumerate(results) if not result.ok]
+
+    :param quantity_strings: The strings to parse
+    :param limits: The :class:`ParseLimits` to check each string against.  Defaults to :data:`parse_limits`.
+    """
+    return [try_parse_quantity(quantity_string, limits) for quantity_string in quantity_strings]
+
+
+def iter_quantities(text: str, limits: Optional[ParseLimits] = None) -> Iterator[Tuple[int, int, fractions.Fraction]]:
+    """
+    Find every quantity in text, such as the ``1 1/2`` and ``3/4`` in "add 1 1/2 cups flour, then 3/4 tsp salt",
+    and yield ``(start, end, fraction)`` for each as it is found, where ``text[start:end]`` is the quantity.
+
+    Whole numbers, decimals, fractions, and mixed numbers written with a space, hyphen, or ``and`` are found,
+    with any spaces or tabs around the slash of a fraction.  Numbers within words or other numbers, such as
+    dates like 1/2/2024 or versions like 1.2.3, are skipped, as are fractions with a denominator of 0 and
+    quantities beyond the limits.  Like :func:`quantity_to_fraction`, ``2 1/2`` is always read as a mixed number.
+
+    :param text: The text to search
+    :param limits: The :class:`ParseLimits` each quantity must be within.  Defaults to :data:`parse_limits`.
+    """
+    if limits is None:
+        limits = parse_limits
+    max_length, max_digits, max_denominator = limits.max_length, limits.max_digits, limits.max_denominator
+    for match in _QUANTITY_SPAN.finditer(text):
+        start, end = match.span()
+        if max_length is not None and end - start > max_length:
+            continue
+        if max_digits is not None and end - start > max_digits and _find_limit_error(match.group(), limits):
+            continue
+        value = _quantity_span_value(match.groups(), max_denominator)
+        if value is not None:
+            yield (start, end, value)
+
+
+def _quantity_span_value(groups: Tuple[Any, ...], max_denominator: Optional[int]) -> Optional[fractions.Fraction]:
+    """
+    Returns the value of the groups of _QUANTITY_PATTERN, or None for a denominator of 0 or above max_denominator.
+    The groups of each alternative of the pattern are always matched together, so only the first of them is
+    checked for None.
+    """
+    sign, whole, mixed_numerator, mixed_denominator, mixed_character = groups[:5]
+    numerator, denominator, number, character = groups[5:9]
+    if number is not None:
+        whole_part, point, decimals = number.partition(".")
+        if point:
+            value = fractions.Fraction(int(whole_part + decimals), 10 ** len(decimals))
+        else:
+            value = _from_coprime_ints(int(number), 1)
+    elif numerator is not None:
+        denominator_value = int(denominator)
+        if not denominator_value or (max_denominator is not None and denominator_value > max_denominator):
+            return None
+        value = fractions.Fraction(int(numerator), denominator_value)
+    elif character is not None:
+        value = _UNICODE_FRACTION_VALUES[character]
+    elif mixed_character is not None:
+        value = _UNICODE_FRACTION_VALUES[mixed_character] + int(whole)
+    else:
+        denominator_value = int(mixed_denominator)
+        if not denominator_value or (max_denominator is not None and denominator_value > max_denominator):
+            return None
+        value = fractions.Fraction(int(whole) * denominator_value + int(mixed_numerator), denominator_value)
+    return -value if sign else value
+
+
+def approximate_fraction(
+    value: Union[fractions.Fraction, float, Decimal, int, str],
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
+) -> fractions.Fraction:
+    """
+    Returns the fraction with the smallest denominator which is within the given tolerance of value,
+    such as 1/3 for 0.333 with ``rel_tol=0.005``.  The tolerances work the same as :func:`math.isclose`,
+    the allowed difference is the larger of ``rel_tol * abs(value)`` and ``abs_tol``.
+
+    The continued fraction of value is only expanded until a fraction inside the tolerance is found,
+    which is much faster than :meth:`fractions.Fraction.limit_denominator()` with a large limit.
+
+    :param value: The value to approximate.
+    :param float rel_tol: The allowed difference relative to value, such as 0.005 for within 0.5%.
+    :param float abs_tol: The allowed absolute difference, such as 1/64.
+    """
+    f = value if isinstance(value, fractions.Fraction) else fractions.Fraction(value)
+    rel_n, rel_d = _as_integer_ratio(rel_tol or 0)
+    abs_n, abs_d = _as_integer_ratio(abs_tol or 0)
+    if rel_n < 0 or abs_n < 0:
+        raise ValueError("tolerances must be non-negative")
+
+    # all of the arithmetic is on integers, Fraction arithmetic is several times slower
+    n, d = abs(f.numerator), f.denominator
+    if rel_n * n * abs_d >= abs_n * rel_d * d:
+        tol_n, tol_d = rel_n * n, rel_d * d
+    else:
+        tol_n, tol_d = abs_n, abs_d
+    if not tol_n:
+        return f
+    low_n, high_n, low_d = n * tol_d - tol_n * d, n * tol_d + tol_n * d, d * tol_d
+    if low_n <= 0:
+        return fractions.Fraction(0)
+    high_d = low_d
+
+    # The simplest fraction in [low, high] shares the continued fraction terms of both ends
+    # up to the first point where an integer is inside the interval, where the expansion ends.
+    # Both ends are kept as integer ratios, each step replaces them with 1 / (end - term).
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        term = -(-low_n // low_d)
+        if term * high_d <= high_n:
+            # the smallest integer inside the interval
+            break
+        term -= 1
+        p0, q0, p1, q1 = p1, q1, term * p1 + p0, term * q1 + q0
+        low_n, low_d, high_n, high_d = high_d, high_n - term * high_d, low_d, low_n - term * low_d
+    numerator = term * p1 + p0
+    return fractions.Fraction(-numerator if f < 0 else numerator, term * q1 + q0)
+
+
 def get_fraction_parts(
     value: Union[fractions.Fraction, float, Decimal, int, str],
     allow_mixed_numbers: bool = True,
     limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
     coerce_thirds: bool = True,
-):
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
+) -> Tuple[int, int, int]:
     """
     Takes an `int`, `float`, or :class:`decimal.Decimal` and returns
     a tuple of (whole_number, numerator, denominator).  If allow_mixed_numbers
@@ -211,10 +816,39 @@ def get_fraction_parts(
     :param bool coerce_thirds:  Defaults to True.  If True
         then .3 repeating is forced to 1/3 rather than 3/10, 33/100, etc.
         and .66 and .67 are forced to 2/3.
+    :param float rel_tol: If given, use the fraction with the smallest denominator within this
+        tolerance relative to value, see :func:`approximate_fraction`, rather than limit_denominator.
+    :param float abs_tol: If given, use the fraction with the smallest denominator within this
+        absolute tolerance of value rather than limit_denominator.
     """
+    key = (value, allow_mixed_numbers, limit_denominator, coerce_thirds, rel_tol, abs_tol)
+    try:
+        parts = fraction_parts_cache.get(key)
+    except TypeError:
+        # unhashable values are not cached, fractions.Fraction() will decide if they are valid
+        return _get_fraction_parts(value, allow_mixed_numbers, limit_denominator, coerce_thirds, rel_tol, abs_tol)
+
+    if parts is None:
+        parts = _get_fraction_parts(value, allow_mixed_numbers, limit_denominator, coerce_thirds, rel_tol, abs_tol)
+        fraction_parts_cache.set(key, parts)
+    return parts
+
 
+def _get_fraction_parts(
+    value: Union[fractions.Fraction, float, Decimal, int, str],
+    allow_mixed_numbers: bool,
+    limit_denominator: int,
+    coerce_thirds: bool,
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
+) -> Tuple[int, int, int]:
     f = fractions.Fraction(value)
 
+    if rel_tol or abs_tol:
+        # the tolerance is relative to the whole value, so approximate before splitting off the whole number
+        f = approximate_fraction(f, rel_tol, abs_tol)
+        limit_denominator = 0
+
     whole_number = 0
     if allow_mixed_numbers and f.numerator >= f.denominator:
         # convert to complex number
@@ -247,3 +881,126 @@ def get_fraction_unicode_entity(value: Union[fractions.Fraction, float, Decimal,
     if entity not in HTML_ENTITIES:
         raise NoHtmlUnicodeEntity("No valid HTML entity exists for %s" % value)
     return entity
+
+
+def format_fraction(
+    value: Union[fractions.Fraction, float, Decimal, int, str],
+    style: str = "mixed",
+    limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+    coerce_thirds: bool = True,
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
+) -> str:
+    """
+    Format a value as a fraction string.
+
+    The styles are:
+
+    * ``mixed`` - mixed numbers such as ``1 1/2``
+    * ``improper`` - improper fractions such as ``3/2``
+    * ``html`` - the same markup rendered by the ``display_fraction`` template tag,
+      such as ``1 <sup>1</sup>&frasl;<sub>2</sub>``
+    * ``unicode`` - unicode vulgar fraction characters where one exists such as ``1½``,
+      otherwise the numerator and denominator separated by U+2044 FRACTION SLASH.
+
+    :param value: The value to format.
+    :param str style: One of ``mixed``, ``improper``, ``html``, or ``unicode``.  Defaults to ``mixed``.
+    :param int limit_denominator: Limit the denominator to this value.  Defaults to 1000000,
+        which is the same as :meth:`fractions.Fraction.limit_denominator()` default max_denominator
+    :param bool coerce_thirds:  Defaults to True.  If True
+        then .3 repeating is forced to 1/3 rather than 3/10, 33/100, etc.
+        and .66 and .67 are forced to 2/3.
+    :param float rel_tol: If given, use the fraction with the smallest denominator within this
+        tolerance relative to value, see :func:`approximate_fraction`, rather than limit_denominator.
+    :param float abs_tol: If given, use the fraction with the smallest denominator within this
+        absolute tolerance of value rather than limit_denominator.
+    """
+    if style not in FRACTION_STYLES:
+        raise ValueError("style must be one of %s, not %r" % (", ".join(FRACTION_STYLES), style))
+
+    allow_mixed_numbers = style != "improper"
+    whole_number, numerator, denominator = get_fraction_parts(
+        value, allow_mixed_numbers, limit_denominator, coerce_thirds, rel_tol, abs_tol
+    )
+
+    if not allow_mixed_numbers:
+        return "%d/%d" % (numerator, denominator)
+
+    if not numerator:
+        return "%d" % whole_number
+
+    whole_string = "%d" % whole_number if whole_number else ""
+    if style == "html":
+        fraction_string = "<sup>%d</sup>&frasl;<sub>%d</sub>" % (numerator, denominator)
+    elif style == "unicode":
+        fraction_string = UNICODE_FRACTIONS.get(
+            (numerator, denominator), "%d%s%d" % (numerator, FRACTION_SLASH, denominator)
+        )
+        if whole_string and (numerator, denominator) in UNICODE_FRACTIONS:
+            return "%s%s" % (whole_string, fraction_string)
+    else:
+        fraction_string = "%d/%d" % (numerator, denominator)
+
+    return ("%s %s" % (whole_string, fraction_string)).strip()
+
+
+def _as_integer_ratio(value: Union[fractions.Fraction, float, Decimal, int, str]) -> Tuple[int, int]:
+    if isinstance(value, str):
+        value = quantity_to_fraction(value)
+    elif isinstance(value, (float, Decimal)):
+        # exact, and cheaper than building a Fraction
+        return value.as_integer_ratio()
+    elif not isinstance(value, numbers.Rational):
+        value = fractions.Fraction(value)
+    return value.numerator, value.denominator
+
+
+def _sum_by_denominator(values: Iterable[Union[fractions.Fraction, float, Decimal, int, str]]) -> Tuple[int, int, int]:
+    """
+    Returns (numerator, denominator, count) for the total of values, without reducing it.
+    Numerators are added up per denominator so that the work of finding a common denominator
+    is done once for each distinct denominator rather than once for each value.
+    """
+    numerators: Dict[int, int] = {}
+    get = numerators.get
+    count = 0
+    for value in values:
+        if type(value) is fractions.Fraction:
+            numerator, denominator = value.numerator, value.denominator
+        else:
+            numerator, denominator = _as_integer_ratio(value)
+        numerators[denominator] = get(denominator, 0) + numerator
+        count += 1
+
+    common_denominator = 1
+    for denominator in numerators:
+        common_denominator = common_denominator // math.gcd(common_denominator, denominator) * denominator
+    numerator = sum(n * (common_denominator // d) for d, n in numerators.items())
+    return numerator, common_denominator, count
+
+
+def fraction_sum(values: Iterable[Union[fractions.Fraction, float, Decimal, int, str]]) -> fractions.Fraction:
+    """
+    Returns the exact sum of values as a :class:`fractions.Fraction`.
+
+    Gives the same result as ``sum()`` but only reduces the total once, rather than after
+    every addition, which makes it much faster for long lists.  Strings are converted with
+    :func:`quantity_to_fraction`.
+
+    :param values: Fractions, Decimals, ints, floats, or quantity strings such as ``1 1/2``
+    """
+    numerator, denominator, count = _sum_by_denominator(values)
+    return fractions.Fraction(numerator, denominator)
+
+
+def fraction_mean(values: Iterable[Union[fractions.Fraction, float, Decimal, int, str]]) -> fractions.Fraction:
+    """
+    Returns the exact mean of values as a :class:`fractions.Fraction`.  Raises ValueError
+    if values is empty.
+
+    :param values: Fractions, Decimals, ints, floats, or quantity strings such as ``1 1/2``
+    """
+    numerator, denominator, count = _sum_by_denominator(values)
+    if not count:
+        raise ValueError("fraction_mean() requires at least one value")
+    return fractions.Fraction(numerator, denominator * count)
@@ -0,0 +1,410 @@
+"""
+Vectorized fraction parsing and formatting for pandas.
+
+Importing this module registers a ``frac`` accessor on :class:`pandas.Series`::
+
+    import djfractions.accessors  # noqa: F401
+
+    df["quantity"].frac.parse()
+    df["quantity"].frac.format("unicode", limit_denominator=16)
+
+The accessor works on whole columns using numpy integer arithmetic and matches the
+semantics of :func:`djfractions.quantity_to_fraction`, :func:`djfractions.get_fraction_parts`
+and :func:`djfractions.format_fraction`.  Values which the vectorized grammar cannot handle,
+such as numbers too large for a 64 bit integer or odd inputs like ``1e3``, fall back to
+those functions one element at a time.
+"""
+
+import fractions
+from decimal import Decimal
+from typing import Optional, Tuple
+
+# pandas is an optional dependency without type stubs
+try:
+    import numpy as np
+    import pandas as pd  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    raise ImportError("djfractions.accessors requires pandas. To fix this error, run: pip install pandas")
+
+from djfractions import (
+    DEFAULT_MAX_DENOMINATOR,
+    FRACTION_SLASH,
+    FRACTION_STYLES,
+    UNICODE_FRACTIONS,
+    format_fraction,
+    get_fraction_parts,
+    quantity_to_fraction,
+)
+from djfractions.exceptions import InvalidFractionString
+
+__all__ = ["FractionAccessor"]
+
+# One pattern for everything quantity_to_fraction() handles in the common case.
+# Named groups become columns from Series.str.extract().
+QUANTITY_PATTERN = (
+    r"^\s*(?P<sign>-?)"
+    r"(?:(?P<whole>\d+)(?:\s+and\s+|\s*-\s*|\s+)(?P<mixed_numerator>\d+)(?:/|\s+/\s+)(?P<mixed_denominator>\d+)"
+    r"|(?P<numerator>\d+)(?:/|\s+/\s+)(?P<denominator>\d+)"
+    r"|(?P<integer>\d+)(?:\.(?P<decimals>\d*))?"
+    r"|\.(?P<decimals_only>\d+))\s*$"
+)
+
+# Digit strings longer than this may not fit in an int64 once combined, so those
+# rows use the scalar functions instead.
+MAX_VECTORIZED_DIGITS = 15
+
+INT64_MAX = np.iinfo(np.int64).max
+
+_DECIMAL_POWERS = np.array([10**i for i in range(MAX_VECTORIZED_DIGITS + 1)], dtype=np.int64)
+
+
+def _check_fallback(value, errors: str) -> Optional[fractions.Fraction]:
+    """
+    Convert a single value the vectorized code could not handle.  Returns None for
+    invalid values unless errors is "raise".
+    """
+    try:
+        parsed = quantity_to_fraction(value) if isinstance(value, str) else fractions.Fraction(value)
+        if abs(parsed.numerator) > INT64_MAX or parsed.denominator > INT64_MAX:
+            raise OverflowError("%s does not fit in a 64 bit integer" % parsed)
+    except (InvalidFractionString, ValueError, TypeError, ZeroDivisionError, OverflowError):
+        if errors == "raise":
+            raise
+        return None
+    return parsed
+
+
+def _digits(column: pd.Series) -> np.ndarray:
+    return column.fillna("0").replace("", "0").astype(np.int64).to_numpy()
+
+
+def _parse_strings(values: pd.Series, errors: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns (numerator, denominator, valid) arrays for a series of quantity strings.
+    """
+    as_strings = values.astype("object").where(values.notna(), None)
+    parts = as_strings.str.extract(QUANTITY_PATTERN)
+    longest = parts.drop(columns="sign").apply(lambda column: column.str.len()).max(axis=1)
+    vectorized = longest.notna().to_numpy() & (longest.fillna(0).to_numpy() <= MAX_VECTORIZED_DIGITS)
+    parts = parts.where(pd.Series(vectorized, index=parts.index), None)
+
+    mixed = parts["whole"].notna().to_numpy()
+    simple = parts["numerator"].notna().to_numpy()
+
+    decimal_places = parts["decimals"].fillna(parts["decimals_only"]).fillna("").str.len()
+    decimal_places = decimal_places.clip(upper=MAX_VECTORIZED_DIGITS).to_numpy(dtype=np.int64)
+    decimal_denominator = _DECIMAL_POWERS[decimal_places]
+
+    numerator = np.where(
+        mixed,
+        _digits(parts["whole"]) * _digits(parts["mixed_denominator"]) + _digits(parts["mixed_numerator"]),
+        np.where(
+            simple,
+            _digits(parts["numerator"]),
+            _digits(parts["integer"]) * decimal_denominator + _digits(parts["decimals"].fillna(parts["decimals_only"])),
+        ),
+    )
+    denominator = np.where(
+        mixed,
+        _digits(parts["mixed_denominator"]),
+        np.where(simple, _digits(parts["denominator"]), decimal_denominator),
+    )
+    numerator = np.where(parts["sign"].to_numpy() == "-", -numerator, numerator)
+
+    valid = vectorized & (denominator != 0)
+    denominator = np.where(valid, denominator, 1)
+    numerator = np.where(valid, numerator, 0)
+
+    # anything the vectorized grammar did not handle goes through quantity_to_fraction()
+    for position in np.flatnonzero(~valid & values.notna().to_numpy()):
+        parsed = _check_fallback(values.iat[position], errors)
+        if parsed is not None:
+            numerator[position], denominator[position], valid[position] = parsed.numerator, parsed.denominator, True
+
+    return numerator, denominator, valid
+
+
+def _float_to_ratio(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact numerator and denominator of floats, the same as fractions.Fraction(value),
+    for every float whose ratio fits in an int64.  Returns (numerator, denominator, fits).
+    """
+    finite = np.isfinite(values)
+    mantissa, exponent = np.frexp(np.where(finite, values, 0.0))
+    shift = 53 - exponent
+    fits = finite & (shift <= 62) & (shift >= -9)
+    shift = np.where(fits, shift, 0)
+    numerator = (mantissa * 2.0**53).astype(np.int64)
+    numerator = np.where(shift < 0, numerator << np.clip(-shift, 0, None), numerator)
+    denominator = np.left_shift(np.int64(1), np.clip(shift, 0, None))
+    return np.where(fits, numerator, 0), np.where(fits, denominator, 1), fits
+
+
+def _reduce(numerator: np.ndarray, denominator: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    divisor = np.gcd(numerator, denominator)
+    divisor = np.where(divisor == 0, 1, divisor)
+    return numerator // divisor, denominator // divisor
+
+
+def _limit_denominator(
+    numerator: np.ndarray, denominator: np.ndarray, max_denominator: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized :meth:`fractions.Fraction.limit_denominator` for reduced integer arrays.
+    """
+    if not max_denominator:
+        return numerator, denominator
+    if max_denominator < 1:
+        raise ValueError("max_denominator should be at least 1")
+
+    active = denominator > max_denominator
+    if not active.any():
+        return numerator, denominator
+
+    p0, q0 = np.zeros_like(numerator), np.ones_like(numerator)
+    p1, q1 = np.ones_like(numerator), np.zeros_like(numerator)
+    n, d = numerator.copy(), np.where(active, denominator, 1)
+    while active.any():
+        a = n // d
+        q2 = q0 + a * q1
+        step = active & (q2 <= max_denominator)
+        p0, q0, p1, q1 = (
+            np.where(step, p1, p0),
+            np.where(step, q1, q0),
+            np.where(step, p0 + a * p1, p1),
+            np.where(step, q2, q1),
+        )
+        n, d = np.where(step, d, n), np.where(step, n - a * d, d)
+        active = step
+
+    # same closeness test as Fraction.limit_denominator() on python 3.12+:
+    # 2 * d * (q0 + k * q1) <= denominator, rearranged to stay within an int64
+    k = (max_denominator - q0) // np.where(q1 == 0, 1, q1)
+    semi_q = q0 + k * q1
+    use_convergent = 2 * semi_q <= denominator // np.where(d == 0, 1, d)
+    limited = denominator > max_denominator
+    return (
+        np.where(limited, np.where(use_convergent, p1, p0 + k * p1), numerator),
+        np.where(limited, np.where(use_convergent, q1, semi_q), denominator),
+    )
+
+
+def _coerce_to_thirds(numerator: np.ndarray, denominator: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized :func:`djfractions.coerce_to_thirds`.
+    """
+    values = numerator / denominator
+    scaled = values * 100
+    hundredths = np.round(scaled)
+    # coerce_to_thirds() rounds the exact value of the float with Decimal.quantize(), which
+    # multiplying by 100 can push to the other side of a tie, so those are checked one at a time.
+    for position in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6):
+        hundredths[position] = Decimal(values[position]).quantize(Decimal("0.00")) * 100
+    # Decimal's % keeps the sign of the dividend, so negative values are never coerced
+    hundredths = np.where(hundredths >= 0, hundredths % 100, -1)
+    one_third = (hundredths == 33) | (hundredths == 30)
+    two_thirds = (hundredths == 67) | (hundredths == 60)
+    whole = numerator // denominator
+    coerce = one_third | two_thirds
+    return (
+        np.where(coerce, whole * 3 + np.where(one_third, 1, 2), numerator),
+        np.where(coerce, 3, denominator),
+    )
+
+
+@pd.api.extensions.register_series_accessor("frac")
+class FractionAccessor:
+    """
+    ``Series.frac`` accessor.  Works with series of quantity strings such as
+    ``"1 1/2"`` or ``".25"`` as well as numeric series.
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    def _ratios(self, errors: str = "coerce") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        series = self._series
+        if pd.api.types.is_integer_dtype(series.dtype) and not series.isna().any():
+            numerator = series.to_numpy(dtype=np.int64)
+            return numerator, np.ones_like(numerator), np.ones(len(series), dtype=bool)
+        if pd.api.types.is_float_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+            numerator, denominator, valid = _float_to_ratio(series.to_numpy(dtype=np.float64, na_value=np.nan))
+            for position in np.flatnonzero(~valid & series.notna().to_numpy()):
+                # very large, very small, or non-finite values
+                _check_fallback(series.iat[position], errors)
+            numerator, denominator = _reduce(numerator, denominator)
+            return numerator, denominator, valid
+        numerator, denominator, valid = _parse_strings(series, errors)
+        numerator, denominator = _reduce(numerator, denominator)
+        return numerator, denominator, valid
+
+    def _frame(self, columns: dict, valid: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            {name: pd.array(np.where(valid, values, 0), dtype="Int64") for name, values in columns.items()},
+            index=self._series.index,
+        ).where(pd.Series(valid, index=self._series.index), pd.NA)
+
+    def _parse_unique(self, errors: str = "coerce") -> pd.DataFrame:
+        numerator, denominator, valid = self._ratios(errors)
+        return self._frame({"numerator": numerator, "denominator": denominator}, valid)
+
+    def _to_decimal_unique(self, errors: str = "coerce") -> pd.Series:
+        numerator, denominator, valid = self._ratios(errors)
+        return pd.Series(np.where(valid, numerator / denominator, np.nan), index=self._series.index)
+
+    def _limit_denominator_unique(
+        self, max_denominator: int = DEFAULT_MAX_DENOMINATOR, errors: str = "coerce"
+    ) -> pd.DataFrame:
+        numerator, denominator, valid = self._ratios(errors)
+        numerator, denominator = _limit_denominator(numerator, denominator, max_denominator)
+        return self._frame({"numerator": numerator, "denominator": denominator}, valid)
+
+    def _parts_unique(
+        self,
+        allow_mixed_numbers: bool = True,
+        limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+        coerce_thirds: bool = True,
+        errors: str = "coerce",
+    ) -> pd.DataFrame:
+        numerator, denominator, valid = self._ratios()
+        whole_number = np.zeros_like(numerator)
+        if allow_mixed_numbers:
+            mixed = numerator >= denominator
+            whole_number = np.where(mixed, numerator // denominator, 0)
+            numerator = np.where(mixed, numerator % denominator, numerator)
+            numerator, denominator = _reduce(numerator, denominator)
+
+        numerator, denominator = _limit_denominator(numerator, denominator, limit_denominator)
+
+        if coerce_thirds and (not limit_denominator or limit_denominator > 3):
+            numerator, denominator = _coerce_to_thirds(numerator, denominator)
+
+        # values whose exact ratio does not fit in an int64, such as very small floats,
+        # may still have parts which do once the denominator is limited.
+        for position in np.flatnonzero(~valid & self._series.notna().to_numpy()):
+            value = self._series.iat[position]
+            try:
+                value = quantity_to_fraction(value) if isinstance(value, str) else value
+                row = get_fraction_parts(value, allow_mixed_numbers, limit_denominator, coerce_thirds)
+                if max(abs(part) for part in row) > INT64_MAX:
+                    raise OverflowError("%s does not fit in a 64 bit integer" % value)
+            except (InvalidFractionString, ValueError, TypeError, ZeroDivisionError, OverflowError):
+                if errors == "raise":
+                    raise
+                continue
+            whole_number[position], numerator[position], denominator[position] = row
+            valid[position] = True
+
+        return self._frame({"whole_number": whole_number, "numerator": numerator, "denominator": denominator}, valid)
+
+    def _format_unique(
+        self,
+        style: str = "mixed",
+        limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+        coerce_thirds: bool = True,
+        errors: str = "coerce",
+    ) -> pd.Series:
+        if style not in FRACTION_STYLES:
+            # let format_fraction() raise the same error
+            format_fraction(0, style)
+
+        allow_mixed_numbers = style != "improper"
+        parts = self._parts_unique(allow_mixed_numbers, limit_denominator, coerce_thirds, errors)
+        valid = parts["denominator"].notna()
+        parts = parts.fillna(0)
+        whole_number = parts["whole_number"].astype(str)
+        numerator = parts["numerator"].astype(str)
+        denominator = parts["denominator"].astype(str)
+        has_whole = (parts["whole_number"] != 0).to_numpy()
+        has_fraction = (parts["numerator"] != 0).to_numpy()
+
+        if not allow_mixed_numbers:
+            result = numerator + "/" + denominator
+        else:
+            if style == "html":
+                fraction_string = "<sup>" + numerator + "</sup>&frasl;<sub>" + denominator + "</sub>"
+            elif style == "unicode":
+                glyphs = pd.Series(
+                    [UNICODE_FRACTIONS.get(key) for key in zip(parts["numerator"], parts["denominator"])],
+                    index=parts.index,
+                    dtype="object",
+                )
+                fraction_string = glyphs.fillna(numerator + FRACTION_SLASH + denominator)
+            else:
+                fraction_string = numerator + "/" + denominator
+
+            separator = " "
+            if style == "unicode":
+                separator = pd.Series(np.where(glyphs.notna(), "", " "), index=parts.index)
+            result = pd.Series(
+                np.where(
+                    has_fraction,
+                    np.where(has_whole, whole_number + separator + fraction_string, fraction_string),
+                    whole_number,
+                ),
+                index=parts.index,
+                dtype="object",
+            )
+        return result.astype("object").where(valid, pd.NA)
+
+    def _on_unique_values(self, method, *args, **kwargs):
+        """
+        Columns are usually made of a small number of distinct values, so each distinct
+        value is converted once and the results are expanded back out to the full column.
+        """
+        codes, uniques = pd.factorize(self._series)
+        result = method(FractionAccessor(pd.Series(uniques)), *args, **kwargs).reindex(codes)
+        result.index = self._series.index
+        if isinstance(result, pd.Series) and result.dtype == object:
+            result = result.where(codes >= 0, pd.NA)
+        return result
+
+    def parse(self, errors: str = "coerce") -> pd.DataFrame:
+        """
+        Parse the series the same way as :func:`djfractions.quantity_to_fraction`.
+
+        Returns a DataFrame with nullable integer ``numerator`` and ``denominator``
+        columns.  Invalid values are ``<NA>`` unless ``errors="raise"``.
+        """
+        return self._on_unique_values(FractionAccessor._parse_unique, errors)
+
+    def to_decimal(self, errors: str = "coerce") -> pd.Series:
+        """
+        Parse the series and return the values as float64, the vectorized equivalent
+        of :func:`djfractions.quantity_to_decimal`.
+        """
+        return self._on_unique_values(FractionAccessor._to_decimal_unique, errors)
+
+    def limit_denominator(self, max_denominator: int = DEFAULT_MAX_DENOMINATOR, errors: str = "coerce") -> pd.DataFrame:
+        """
+        Parse the series and apply :meth:`fractions.Fraction.limit_denominator` to each value.
+        """
+        return self._on_unique_values(FractionAccessor._limit_denominator_unique, max_denominator, errors)
+
+    def parts(
+        self,
+        allow_mixed_numbers: bool = True,
+        limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+        coerce_thirds: bool = True,
+        errors: str = "coerce",
+    ) -> pd.DataFrame:
+        """
+        The vectorized equivalent of :func:`djfractions.get_fraction_parts`.  Returns a
+        DataFrame with ``whole_number``, ``numerator`` and ``denominator`` columns.
+        """
+        return self._on_unique_values(
+            FractionAccessor._parts_unique, allow_mixed_numbers, limit_denominator, coerce_thirds, errors
+        )
+
+    def format(
+        self,
+        style: str = "mixed",
+        limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+        coerce_thirds: bool = True,
+        errors: str = "coerce",
+    ) -> pd.Series:
+        """
+        The vectorized equivalent of :func:`djfractions.format_fraction`.  Invalid values
+        are ``<NA>`` unless ``errors="raise"``.
+        """
+        return self._on_unique_values(FractionAccessor._format_unique, style, limit_denominator, coerce_thirds, errors)
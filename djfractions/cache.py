@@ -0,0 +1,110 @@
+"""
+Thread safe caches used by djfractions.
+
+Caches are split into shards by key hash.  Reads are a plain ``dict.get()`` on one
+shard and never take a lock, which is safe both with the GIL and on free-threaded
+Python builds where dict operations are internally synchronized.  Writes lock only
+the shard they touch, so threads writing different keys rarely wait on each other.
+"""
+
+import threading
+from typing import Any, Callable, Hashable, List, NamedTuple
+
+__all__ = ["CacheStats", "ShardedCache"]
+
+_MISSING = object()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Shard:
+    __slots__ = ("data", "lock", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+
+class ShardedCache:
+    """
+    A bounded key/value cache which many threads can use at once.
+
+    When a shard is full the oldest entry in that shard is dropped.  Hit and miss
+    counts are kept per shard without locking, so under heavy contention they are
+    close estimates rather than exact counts.
+
+    :ivar int maxsize: The maximum number of entries across all shards
+    :ivar int shards: The number of shards.  Rounded up to a power of two.
+    """
+
+    def __init__(self, maxsize: int = 4096, shards: int = 16):
+        shard_count = 1
+        while shard_count < shards:
+            shard_count *= 2
+        self.maxsize = maxsize
+        self._mask = shard_count - 1
+        self._shard_size = max(1, maxsize // shard_count)
+        self._shards: List[_Shard] = [_Shard() for _ in range(shard_count)]
+
+    def _shard(self, key: Hashable) -> _Shard:
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for key or default.  Raises TypeError if key is not hashable.
+        """
+        shard = self._shard(key)
+        value = shard.data.get(key, _MISSING)
+        if value is _MISSING:
+            shard.misses += 1
+            return default
+        shard.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            if key not in shard.data and len(shard.data) >= self._shard_size:
+                # dicts keep insertion order, so the first key is the oldest
+                del shard.data[next(iter(shard.data))]
+            shard.data[key] = value
+
+    def get_or_set(self, key: Hashable, default: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for key, calling default() and caching the result if
+        there is not one.  default() may be called by more than one thread for the same key.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+                shard.hits = shard.misses = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=sum(shard.hits for shard in self._shards),
+            misses=sum(shard.misses for shard in self._shards),
+            size=sum(len(shard.data) for shard in self._shards),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return sum(len(shard.data) for shard in self._shards)
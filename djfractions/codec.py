@@ -0,0 +1,185 @@
+"""
+Compact binary encoding of :class:`fractions.Fraction` values.
+
+A fraction is written as two varints, the zigzag encoded numerator followed by the
+denominator, so common values such as 1/2 or 3/4 take two bytes.  Pickle writes the
+same value with its class and two pickled integers, or before python 3.11 as its string
+form which is parsed again when loading.
+
+:class:`FractionCacheSerializer` uses this for Django's cache framework::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": "redis://127.0.0.1:6379",
+            "OPTIONS": {"serializer": "djfractions.codec.FractionCacheSerializer"},
+        }
+    }
+"""
+
+import copyreg
+import fractions
+import io
+import pickle
+from typing import Any, Iterable, List, Optional
+
+from djfractions import _from_coprime_ints
+
+__all__ = [
+    "encode_fraction",
+    "decode_fraction",
+    "encode_fractions",
+    "decode_fractions",
+    "FractionCacheSerializer",
+    "register_pickle_reducer",
+]
+
+_Fraction = fractions.Fraction
+
+# first byte of encoded data, never a digit, whitespace, or the 0x80 that pickles start with
+FRACTION_TAG = 0x01
+FRACTION_LIST_TAG = 0x02
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varints(data: bytes, start: int = 0) -> List[int]:
+    data = data[start:]
+    if data.isascii():
+        # every varint is a single byte, which is the usual case for numerators and denominators under 64
+        return list(data)
+    values: List[int] = []
+    append = values.append
+    current = shift = 0
+    for byte in data:
+        if byte & 0x80:
+            current |= (byte & 0x7F) << shift
+            shift += 7
+        else:
+            append(current | (byte << shift))
+            current = shift = 0
+    if shift:
+        raise ValueError("Truncated fraction data")
+    return values
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return -((value + 1) >> 1) if value & 1 else value >> 1
+
+
+def _write_fraction(out: bytearray, value: fractions.Fraction) -> None:
+    _write_varint(out, _zigzag(value.numerator))
+    _write_varint(out, value.denominator)
+
+
+def encode_fraction(value: fractions.Fraction) -> bytes:
+    """
+    Returns value as bytes which :func:`decode_fraction` turns back into a Fraction.
+    """
+    out = bytearray([FRACTION_TAG])
+    _write_fraction(out, value)
+    return bytes(out)
+
+
+def decode_fraction(data: bytes) -> fractions.Fraction:
+    """
+    Returns the :class:`fractions.Fraction` written by :func:`encode_fraction`.
+    """
+    if not data or data[0] != FRACTION_TAG:
+        raise ValueError("Not an encoded fraction")
+    values = _read_varints(data, 1)
+    if len(values) != 2 or not values[1]:
+        raise ValueError("Not an encoded fraction")
+    return _from_coprime_ints(_unzigzag(values[0]), values[1])
+
+
+def encode_fractions(values: Iterable[fractions.Fraction]) -> bytes:
+    """
+    Returns a sequence of fractions as bytes which :func:`decode_fractions` turns back into a list.
+    """
+    out = bytearray([FRACTION_LIST_TAG])
+    values = list(values)
+    _write_varint(out, len(values))
+    for value in values:
+        _write_fraction(out, value)
+    return bytes(out)
+
+
+def decode_fractions(data: bytes) -> List[fractions.Fraction]:
+    """
+    Returns the list of :class:`fractions.Fraction` written by :func:`encode_fractions`.
+    """
+    if not data or data[0] != FRACTION_LIST_TAG:
+        raise ValueError("Not an encoded list of fractions")
+    values = _read_varints(data, 1)
+    if not values or len(values) != values[0] * 2 + 1 or not all(values[2::2]):
+        raise ValueError("Not an encoded list of fractions")
+    return [_from_coprime_ints(_unzigzag(n), d) for n, d in zip(values[1::2], values[2::2])]
+
+
+def _reduce_fraction(value: fractions.Fraction) -> Any:
+    # before python 3.11 the default, Fraction.__reduce__(), stores str(value) and parses it again when loading.
+    # Only fractions.Fraction is referenced so that the pickles load without djfractions.
+    return (_Fraction, (value.numerator, value.denominator))
+
+
+def register_pickle_reducer() -> None:
+    """
+    Make :mod:`pickle` store every :class:`fractions.Fraction` as its numerator and denominator
+    rather than as a string, wherever pickle is used.  The pickles are loaded by calling
+    ``Fraction(numerator, denominator)``, so they do not need djfractions installed to be loaded.
+    """
+    copyreg.pickle(_Fraction, _reduce_fraction)
+
+
+class FractionCacheSerializer:
+    """
+    A serializer for Django's Redis cache backend, with the same interface as
+    ``django.core.cache.backends.redis.RedisSerializer``.
+
+    Fractions and lists of fractions are stored with :func:`encode_fraction` and
+    :func:`encode_fractions`.  Anything else is pickled, with any fractions inside it stored
+    as their numerator and denominator.  Data pickled by the default serializer still loads.
+
+    :ivar int protocol: The pickle protocol.  Defaults to :data:`pickle.HIGHEST_PROTOCOL`
+    """
+
+    def __init__(self, protocol: Optional[int] = None):
+        self.protocol = pickle.HIGHEST_PROTOCOL if protocol is None else protocol
+        self._dispatch_table = copyreg.dispatch_table.copy()
+        self._dispatch_table[_Fraction] = _reduce_fraction
+
+    def dumps(self, obj: Any) -> Any:
+        # integers are stored as is so that incr() and decr() work, the same as Django's RedisSerializer.
+        # int subclasses, such as bool, are pickled.
+        if type(obj) is int:
+            return obj
+        if type(obj) is _Fraction:
+            return encode_fraction(obj)
+        if type(obj) is list and obj and all(type(value) is _Fraction for value in obj):
+            return encode_fractions(obj)
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, self.protocol)
+        pickler.dispatch_table = self._dispatch_table
+        pickler.dump(obj)
+        return buffer.getvalue()
+
+    def loads(self, data: Any) -> Any:
+        try:
+            return int(data)
+        except ValueError:
+            pass
+        if data[0] == FRACTION_TAG:
+            return decode_fraction(data)
+        if data[0] == FRACTION_LIST_TAG:
+            return decode_fractions(data)
+        return pickle.loads(data)
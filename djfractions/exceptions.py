@@ -11,6 +11,22 @@ class InvalidFractionString(FractionError):
     pass
 
 
+class ParseLimitExceeded(InvalidFractionString):
+    """
+    Raised when a quantity string is longer, has more digits, or has a larger denominator or
+    exponent than the :class:`djfractions.ParseLimits` in use allow.
+
+    :ivar str code: The limit which was exceeded, ``max_length``, ``max_digits``, ``max_denominator``,
+        or ``max_exponent``
+    :ivar int limit: The value of that limit
+    """
+
+    def __init__(self, message: str, code: str, limit: int):
+        super().__init__(message)
+        self.code = code
+        self.limit = limit
+
+
 class NoHtmlUnicodeEntity(FractionError):
     """
     Raised when converting an unsupported fraction to an HTML entity
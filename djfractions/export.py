@@ -0,0 +1,144 @@
+"""
+Streaming CSV and TSV export of querysets with :class:`djfractions.models.DecimalFractionField` and
+:class:`djfractions.models.FloatBackedFractionField` columns.
+
+Rows are read from a server-side cursor in chunks and written as they are read, so an export uses
+the same memory however large the table is::
+
+    from django.http import StreamingHttpResponse
+    from djfractions.export import iter_csv
+
+    def export_ingredients(request):
+        return StreamingHttpResponse(
+            iter_csv(Ingredient.objects.all(), ["name", "quantity", "unit"], style="unicode"),
+            content_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="ingredients.csv"'},
+        )
+"""
+
+import csv
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+
+from djfractions import DEFAULT_MAX_DENOMINATOR, FRACTION_STYLES, format_fraction
+from djfractions.models import BaseFractionField
+
+__all__ = ["iter_rows", "iter_csv", "write_csv"]
+
+# formatted values kept per column, cleared when full so an export with many distinct values
+# still runs in constant memory
+FORMAT_CACHE_SIZE = 4096
+
+
+class _Echo:
+    """
+    A file like object which returns what is written to it, so :func:`csv.writer` can build
+    lines without buffering them.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _column_formatter(field: BaseFractionField, style: str) -> Callable[[Any], Any]:
+    limit_denominator = field.limit_denominator or DEFAULT_MAX_DENOMINATOR
+    coerce_thirds = field.coerce_thirds
+    formatted: Dict[Any, str] = {}
+
+    def format_value(value: Any) -> Any:
+        if value is None:
+            return value
+        try:
+            return formatted[value]
+        except KeyError:
+            pass
+        if len(formatted) >= FORMAT_CACHE_SIZE:
+            formatted.clear()
+        formatted[value] = result = format_fraction(value, style, limit_denominator, coerce_thirds)
+        return result
+
+    return format_value
+
+
+def _get_fraction_field(queryset: QuerySet, name: str) -> Optional[BaseFractionField]:
+    if "__" in name:
+        # a lookup across a relation, written as the database returns it
+        return None
+    try:
+        field = queryset.model._meta.get_field(name)
+    except FieldDoesNotExist:
+        # such as an annotation
+        return None
+    return field if isinstance(field, BaseFractionField) else None
+
+
+def iter_rows(
+    queryset: QuerySet, fields: Optional[Sequence[str]] = None, style: str = "mixed", chunk_size: int = 2000
+) -> Iterator[List[Any]]:
+    """
+    Yields a list of the values of fields for each row of queryset, with the values of fraction fields
+    formatted by :func:`djfractions.format_fraction` using each field's ``limit_denominator`` and
+    ``coerce_thirds``.  Rows are read with ``QuerySet.iterator()``, which uses a server-side cursor on
+    databases which support them.
+
+    :param queryset: The queryset to export
+    :param fields: The field names, or lookups such as ``recipe__name``, to export.
+        Defaults to every concrete field of the model.
+    :param str style: ``mixed``, ``improper``, ``html``, or ``unicode``.  Defaults to ``mixed``.
+    :param int chunk_size: Rows fetched from the cursor at a time.  Defaults to 2000.
+    """
+    if style not in FRACTION_STYLES:
+        raise ValueError("style must be one of %s, not %r" % (", ".join(FRACTION_STYLES), style))
+    if fields is None:
+        fields = [field.attname for field in queryset.model._meta.concrete_fields]
+
+    formatters = []
+    for index, name in enumerate(fields):
+        field = _get_fraction_field(queryset, name)
+        if field is not None:
+            formatters.append((index, _column_formatter(field, style)))
+
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        row = list(row)
+        for index, format_value in formatters:
+            row[index] = format_value(row[index])
+        yield row
+
+
+def iter_csv(
+    queryset: QuerySet,
+    fields: Optional[Sequence[str]] = None,
+    style: str = "mixed",
+    dialect: str = "excel",
+    header: bool = True,
+    chunk_size: int = 2000,
+) -> Iterator[str]:
+    """
+    Yields queryset as CSV, for a ``StreamingHttpResponse`` or writing to a file.  The lines of each
+    chunk of rows are joined into one string.  See :func:`iter_rows` for the fields, style and chunk_size.
+
+    :param str dialect: The :mod:`csv` dialect.  Use ``excel-tab`` for TSV.  Defaults to ``excel``.
+    :param bool header: If True, the first line is the field names.  Defaults to True.
+    """
+    if fields is None:
+        fields = [field.attname for field in queryset.model._meta.concrete_fields]
+    writer = csv.writer(_Echo(), dialect=dialect)
+    lines = [writer.writerow(fields)] if header else []
+    for row in iter_rows(queryset, fields, style, chunk_size):
+        lines.append(writer.writerow(row))
+        if len(lines) >= chunk_size:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def write_csv(file: IO[str], queryset: QuerySet, fields: Optional[Sequence[str]] = None, **kwargs: Any) -> None:
+    """
+    Writes queryset as CSV to file, which should be opened with ``newline=""``.
+    Takes the same keyword arguments as :func:`iter_csv`.
+    """
+    for chunk in iter_csv(queryset, fields, **kwargs):
+        file.write(chunk)
@@ -8,7 +8,22 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import ngettext_lazy
 
-from . import coerce_to_thirds, get_fraction_parts, is_number, quantity_to_decimal, quantity_to_fraction
+import djfractions
+
+from . import (
+    _unicode_mixed_number,
+    _words_to_fraction,
+    approximate_fraction,
+    check_quantity,
+    coerce_to_thirds,
+    get_fraction_parts,
+    is_number,
+    quantity_to_decimal,
+    quantity_to_fraction,
+)
+from .exceptions import ParseLimitExceeded
+from .localization import normalize_quantity
+from .widgets import FractionInput
 
 
 class FractionField(forms.Field):
@@ -28,17 +43,36 @@ class FractionField(forms.Field):
         decimals and floats greater than 1 will be converted to a mixed
         number such as `1 1/2` in the form field's value.  If False then
         improper fractions such as `3/2` will be created. Defaults to True.
+    :ivar float rel_tol: If set, fractions are replaced with the fraction with the smallest
+        denominator within this tolerance relative to the value, such as 0.005 for within 0.5%,
+        rather than using limit_denominator.
+    :ivar float abs_tol: If set, fractions are replaced with the fraction with the smallest
+        denominator within this absolute tolerance of the value.
+    :ivar bool localize: If True then input uses the decimal separator, thousand
+        separator, and conjunctions such as `et` of the active language.
+    :ivar parse_limits: The :class:`djfractions.ParseLimits` input is checked against before it
+        is converted.  Defaults to :data:`djfractions.parse_limits`.
+
+    Use :class:`djfractions.widgets.FractionInput` as the widget to parse input in the browser.
     """
 
     default_error_messages = {
         "invalid": _("Enter a fraction such as 1 1/4 or 1/4."),
+        "parse_max_length": _("Ensure this value has at most %(limit)s characters."),
+        "parse_max_digits": _("Ensure that no number in this value has more than %(limit)s digits."),
+        "parse_max_denominator": _("Ensure that the denominator is no larger than %(limit)s."),
+        "parse_max_exponent": _("Ensure that the exponent is no larger than %(limit)s."),
     }
 
-    # matches standard 'x/y' fractions with 0 or more spaces before, after, or between characters.
-    FRACTION_MATCH = re.compile(r"^\s*-?\s*\d+\s*\/\s*\d+\s*$")
+    # matches standard 'x/y' fractions, or with U+2044 FRACTION SLASH, with 0 or more spaces before, after,
+    # or between characters.
+    FRACTION_MATCH = re.compile(r"^\s*-?\s*\d+\s*[/\u2044]\s*\d+\s*$")
     # matches mixed numbers such as '1 1/2' with any number of spaces and with common
     # separators of - (hyphen) and the word 'and' between the whole number and fraction part
-    MIXED_NUMBER_MATCH = re.compile(r"^\s*-?\s*\d+(\s+|\s+and\s+|\s*\-\s*)\d+\s*\/\s*\d+\s*$")
+    MIXED_NUMBER_MATCH = re.compile(r"^\s*-?\s*\d+(\s+|\s+and\s+|\s*\-\s*)\d+\s*[/\u2044]\s*\d+\s*$")
+    # matches the 'numerator/denominator' values which FractionInput submits, which are converted
+    # without any of the other checks
+    CANONICAL_MATCH = re.compile(r"(-?[0-9]+)/([0-9]+)")
 
     def __init__(
         self,
@@ -48,14 +82,22 @@ class FractionField(forms.Field):
         coerce_thirds=True,
         use_mixed_numbers=True,
         *args,
+        rel_tol=None,
+        abs_tol=None,
+        parse_limits=None,
         **kwargs
     ):
         self.coerce_thirds = coerce_thirds
         self.limit_denominator = limit_denominator
         self.use_mixed_numbers = use_mixed_numbers
+        self.rel_tol, self.abs_tol = rel_tol, abs_tol
+        self.parse_limits = parse_limits
         self.max_value, self.min_value = max_value, min_value
 
         super().__init__(*args, **kwargs)
+        if isinstance(self.widget, FractionInput):
+            # error_messages are not set up yet when widget_attrs() is called
+            self.widget.attrs.setdefault("data-djfractions-invalid-message", self.error_messages["invalid"])
         if max_value is not None:
             self.validators.append(validators.MaxValueValidator(max_value))
         if min_value is not None:
@@ -67,7 +109,7 @@ class FractionField(forms.Field):
 
         try:
             whole_number, numerator, denominator = get_fraction_parts(
-                value, self.use_mixed_numbers, self.limit_denominator, self.coerce_thirds
+                value, self.use_mixed_numbers, self.limit_denominator, self.coerce_thirds, self.rel_tol, self.abs_tol
             )
 
             # if we are allowing mixed numbers (so non-fractional values,
@@ -88,6 +130,37 @@ class FractionField(forms.Field):
 
         return fraction_string.strip()
 
+    def check_limits(self, value):
+        """
+        Raise a :class:`django.core.exceptions.ValidationError` if the string value is beyond
+        the field's parse_limits.
+        """
+        try:
+            check_quantity(value, self.parse_limits)
+        except ParseLimitExceeded as e:
+            # prefixed, since DecimalFractionField already has a max_digits message for the cleaned value
+            code = "parse_%s" % e.code
+            raise ValidationError(self.error_messages[code], code=code, params={"limit": e.limit})
+
+    def canonical_to_fraction(self, match):
+        """
+        Returns the :class:`fractions.Fraction` for a match of CANONICAL_MATCH.
+        """
+        numerator, denominator = int(match.group(1)), int(match.group(2))
+        if not denominator:
+            raise ValidationError(self.error_messages["invalid"], code="invalid")
+        return fractions.Fraction(numerator, denominator)
+
+    def widget_attrs(self, widget):
+        attrs = super().widget_attrs(widget)
+        if isinstance(widget, FractionInput):
+            # so that djfractions.js leaves input beyond the limits for the server to reject
+            limits = self.parse_limits if self.parse_limits is not None else djfractions.parse_limits
+            for name, limit in zip(("max-length", "max-digits", "max-denominator", "max-exponent"), limits):
+                if limit is not None:
+                    attrs["data-djfractions-%s" % name] = limit
+        return attrs
+
     def to_python(self, value):
         """
         Take string input such as 1/4 or 1 1/3 and convert to a :class:`fractions.Fraction`.
@@ -96,7 +169,14 @@ class FractionField(forms.Field):
         if value in validators.EMPTY_VALUES:
             return None
 
-        if isinstance(value, str):
+        canonical = self.CANONICAL_MATCH.fullmatch(value) if isinstance(value, str) else None
+        if canonical:
+            self.check_limits(value)
+            fraction = self.canonical_to_fraction(canonical)
+        elif isinstance(value, str):
+            self.check_limits(value)
+            if self.localize:
+                value = normalize_quantity(value)
             # some really lame validation that we do not have a string like "1 1 1/4" because that
             # is not a valid number.
             # these regexes should match fractions such as 1 1/4 and 1/4, with any number
@@ -106,6 +186,8 @@ class FractionField(forms.Field):
                 not is_number(value)
                 and not self.FRACTION_MATCH.match(value)
                 and not self.MIXED_NUMBER_MATCH.match(value)
+                and _unicode_mixed_number(value.strip()) is None
+                and _words_to_fraction(value) is None
             ):
                 # this second matches optional whitespace, then a digit, then
                 # whitespace OR the word 'and' with or without spaces OR a hyphen with
@@ -113,16 +195,20 @@ class FractionField(forms.Field):
                 # examples: 1 1/2, 1-1/2, 1 - 1/2, 1 and 1/2, etc.
                 raise ValidationError(self.error_messages["invalid"], code="invalid")
 
-            fraction = quantity_to_fraction(value)
+            fraction = quantity_to_fraction(value, limits=self.parse_limits)
         else:
             # it's not a string, so try to convert it to a Fraction
             # may need to catch some exceptions here and raise a ValidationError
             fraction = fractions.Fraction(value)
 
-        if self.limit_denominator:
-            fraction = fraction.limit_denominator(self.limit_denominator)
+        limit_denominator = self.limit_denominator
+        if self.rel_tol or self.abs_tol:
+            fraction = approximate_fraction(fraction, self.rel_tol, self.abs_tol)
+            limit_denominator = None
+        elif limit_denominator:
+            fraction = fraction.limit_denominator(limit_denominator)
 
-        if self.coerce_thirds and (not self.limit_denominator or self.limit_denominator > 3):
+        if self.coerce_thirds and (not limit_denominator or limit_denominator > 3):
             fraction = coerce_to_thirds(fraction)
 
         return fraction
@@ -203,6 +289,9 @@ class DecimalFractionField(FractionField):
         self.round_decimal = kwargs.pop("round_decimal", False)
 
         super().__init__(*args, **kwargs)
+        if isinstance(self.widget, FractionInput):
+            # the text is parsed on the server instead, so that 0.1 is not cleaned from 1/10 through a float
+            self.widget.submit_canonical = False
 
     def to_python(self, value):
         """
@@ -214,16 +303,27 @@ class DecimalFractionField(FractionField):
         if isinstance(value, fractions.Fraction):
             return Decimal(value.numerator / value.denominator)
 
+        canonical = self.CANONICAL_MATCH.fullmatch(value) if isinstance(value, str) else None
+        if canonical:
+            self.check_limits(value)
+            fraction = self.canonical_to_fraction(canonical)
+            return Decimal(fraction.numerator / fraction.denominator)
+
         # some really lame validation that we do not have a string like "1 1 1/4" because that
         # is not a valid number.
         # these regexes should match fractions such as 1 1/4 and 1/4, with any number
         # of spaces between digits and / and any length of actual digits such as
         # 100 1/4 or 1 100/400, etc
         if isinstance(value, str):
+            self.check_limits(value)
+            if self.localize:
+                value = normalize_quantity(value)
             if (
                 not is_number(value)
                 and not self.FRACTION_MATCH.match(value)
                 and not self.MIXED_NUMBER_MATCH.match(value)
+                and _unicode_mixed_number(value.strip()) is None
+                and _words_to_fraction(value) is None
             ):
                 # this second matches optional whitespace, then a digit, then
                 # whitespace OR the word 'and' with or without spaces OR a hyphen with
@@ -232,7 +332,7 @@ class DecimalFractionField(FractionField):
                 raise ValidationError(self.error_messages["invalid"], code="invalid")
 
             try:
-                value = quantity_to_decimal(value)
+                value = quantity_to_decimal(value, limits=self.parse_limits)
             except DecimalException:
                 raise ValidationError(self.error_messages["invalid"], code="invalid")
         else:
@@ -0,0 +1,179 @@
+"""
+Counts and times the fraction conversions made while running a block of code, such as
+a request.  Used by :class:`djfractions.panels.FractionsPanel`.
+
+:func:`install` wraps the conversion points of the model field, the form fields, and the
+template tags.  The wrappers only record anything inside :func:`collect`, outside of it
+they call straight through::
+
+    from djfractions import instrumentation
+
+    instrumentation.install()
+    with instrumentation.collect() as collector:
+        ...
+    collector.stats["DecimalFractionField.from_db_value"].count
+"""
+
+import contextlib
+import contextvars
+import functools
+import heapq
+import importlib
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from djfractions import fraction_parts_cache
+
+__all__ = ["HOOKS", "ConversionStats", "Collector", "install", "uninstall", "collect"]
+
+# (label, module, class or None for a module level function, attribute)
+HOOKS = [
+    ("DecimalFractionField.from_db_value", "djfractions.models.fields", "DecimalFractionField", "from_db_value"),
+    # the converter used in place of from_db_value() on SQLite and PostgreSQL, counted as from_db_value
+    ("DecimalFractionField.from_db_value", "djfractions.models.fields", "DecimalFractionField", "from_db_decimal"),
+    ("DecimalFractionField.get_db_prep_save", "djfractions.models.fields", "DecimalFractionField", "get_db_prep_save"),
+    (
+        "FloatBackedFractionField.from_db_value",
+        "djfractions.models.fields",
+        "FloatBackedFractionField",
+        "from_db_value",
+    ),
+    ("FractionField.to_python", "djfractions.forms", "FractionField", "to_python"),
+    ("FractionField.prepare_value", "djfractions.forms", "FractionField", "prepare_value"),
+    ("DecimalFractionField.to_python (form)", "djfractions.forms", "DecimalFractionField", "to_python"),
+    # the template tags look up get_fraction_parts() from their module on every call
+    ("display_fraction", "djfractions.templatetags.fractions", None, "get_fraction_parts"),
+]
+
+_collector: "contextvars.ContextVar[Optional[Collector]]" = contextvars.ContextVar(
+    "djfractions_collector", default=None
+)
+# (owner, attribute) -> the original function, for uninstall()
+_originals: Dict[Tuple[Any, str], Callable] = {}
+
+
+class ConversionStats:
+    """
+    Totals for one conversion point.
+
+    :ivar int count: Number of calls
+    :ivar float total_time: Seconds spent in the calls
+    :ivar list slowest: (seconds, repr of the input) for the slowest calls, slowest first
+    """
+
+    __slots__ = ("count", "total_time", "_slowest", "_keep")
+
+    def __init__(self, keep: int = 10):
+        self.count = 0
+        self.total_time = 0.0
+        self._slowest: List[Tuple[float, int, Any]] = []
+        self._keep = keep
+
+    def add(self, value: Any, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        # the count breaks ties so values are never compared
+        entry = (elapsed, self.count, value)
+        if len(self._slowest) < self._keep:
+            heapq.heappush(self._slowest, entry)
+        elif elapsed > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        return [(elapsed, repr(value)) for elapsed, count, value in sorted(self._slowest, reverse=True)]
+
+
+class Collector:
+    """
+    Conversions recorded inside one :func:`collect` block.
+
+    :ivar dict stats: :class:`ConversionStats` keyed by the labels in :data:`HOOKS`
+    :ivar int cache_hits: ``fraction_parts_cache`` hits during the block.  The cache is shared
+        by all threads, so this includes hits from other threads running at the same time.
+    :ivar int cache_misses: ``fraction_parts_cache`` misses during the block
+    """
+
+    def __init__(self, keep_slowest: int = 10):
+        self.stats: Dict[str, ConversionStats] = {}
+        self.keep_slowest = keep_slowest
+        self._cache_start = fraction_parts_cache.stats()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def record(self, label: str, value: Any, elapsed: float) -> None:
+        try:
+            stats = self.stats[label]
+        except KeyError:
+            stats = self.stats[label] = ConversionStats(self.keep_slowest)
+        stats.add(value, elapsed)
+
+    def finish(self) -> None:
+        end = fraction_parts_cache.stats()
+        self.cache_hits = end.hits - self._cache_start.hits
+        self.cache_misses = end.misses - self._cache_start.misses
+
+    @property
+    def count(self) -> int:
+        return sum(stats.count for stats in self.stats.values())
+
+    @property
+    def total_time(self) -> float:
+        return sum(stats.total_time for stats in self.stats.values())
+
+
+def _wrap(label: str, function: Callable, value_index: int) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return function(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            collector.record(
+                label, args[value_index] if len(args) > value_index else None, time.perf_counter() - started
+            )
+
+    return wrapper
+
+
+def install() -> None:
+    """
+    Wrap the conversion points listed in :data:`HOOKS`.  Calling this more than once does nothing.
+    """
+    for label, module_name, class_name, attribute in HOOKS:
+        module = importlib.import_module(module_name)
+        owner = getattr(module, class_name) if class_name else module
+        if (owner, attribute) in _originals:
+            continue
+        # look in the class __dict__ so that inherited methods are not wrapped on the subclass
+        function = vars(owner)[attribute]
+        _originals[(owner, attribute)] = function
+        setattr(owner, attribute, _wrap(label, function, 1 if class_name else 0))
+
+
+def uninstall() -> None:
+    """
+    Restore the functions wrapped by :func:`install`.
+    """
+    for (owner, attribute), function in list(_originals.items()):
+        setattr(owner, attribute, function)
+        del _originals[(owner, attribute)]
+
+
+@contextlib.contextmanager
+def collect(keep_slowest: int = 10) -> Iterator[Collector]:
+    """
+    Record the conversions made inside the block, in this thread or async task only.
+
+    :param int keep_slowest: The number of slowest inputs to keep for each conversion point
+    """
+    collector = Collector(keep_slowest)
+    token = _collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _collector.reset(token)
+        collector.finish()
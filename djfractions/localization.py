@@ -0,0 +1,179 @@
+"""
+Locale aware quantity parsing.
+
+Quantities such as ``1,5`` or ``1 et 1/2`` are normalized to the format understood by
+:func:`djfractions.quantity_to_fraction` and :func:`djfractions.quantity_to_decimal`
+using the decimal and thousand separators from Django's locale formats and the
+conjunctions in :data:`CONJUNCTIONS`.  The compiled grammar for each language is
+built once and then looked up by language code.
+"""
+
+import fractions
+import re
+import unicodedata
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.utils import formats
+from django.utils.translation import get_language
+
+from djfractions import check_quantity, quantity_to_decimal, quantity_to_fraction
+
+__all__ = [
+    "CONJUNCTIONS",
+    "QuantityGrammar",
+    "get_quantity_grammar",
+    "register_conjunctions",
+    "normalize_quantity",
+    "localized_quantity_to_fraction",
+    "localized_quantity_to_decimal",
+]
+
+# Words used between the whole number and fraction of a mixed number, such as 1 and 1/2.
+# Keyed by language code.  Languages without an entry only accept "and".
+CONJUNCTIONS: Dict[str, Tuple[str, ...]] = {
+    "en": ("and",),
+    "fr": ("et",),
+    "de": ("und",),
+    "es": ("y",),
+    "it": ("e",),
+    "pt": ("e",),
+    "nl": ("en",),
+    "sv": ("och",),
+    "da": ("og",),
+    "nb": ("og",),
+    "pl": ("i",),
+}
+
+# Compiled grammars keyed by (language code, USE_THOUSAND_SEPARATOR).  Only ever added
+# to with setdefault(), which is atomic, so threads building the same grammar at
+# the same time all end up sharing the first one stored and reads need no lock.
+_grammars: Dict[Tuple[str, bool], "QuantityGrammar"] = {}
+
+
+class QuantityGrammar:
+    """
+    Normalizes localized quantity strings.
+
+    :ivar str decimal_separator: The decimal separator such as ``.`` or ``,``
+    :ivar str thousand_separator: The digit grouping separator such as ``,`` or ``.``
+    :ivar conjunctions: Words which may separate a whole number and a fraction
+    """
+
+    def __init__(self, decimal_separator: str = ".", thousand_separator: str = ",", conjunctions: Iterable[str] = ()):
+        self.decimal_separator = decimal_separator
+        self.thousand_separator = thousand_separator
+        self.conjunctions = tuple(conjunctions)
+
+        # grouping separators only count when followed by exactly three digits which are not
+        # the start of a fraction, so 1 250/1000 is still a mixed number.
+        separators = {thousand_separator, unicodedata.normalize("NFKD", thousand_separator)} - {decimal_separator, ""}
+        self.grouping_re = None
+        if separators:
+            self.grouping_re = re.compile(
+                r"(?<=\d)(?:%s)(?=\d{3}(?![\d/]))" % "|".join(re.escape(s) for s in sorted(separators))
+            )
+        self.decimal_re = None
+        if decimal_separator != ".":
+            self.decimal_re = re.compile(r"%s(?=\d)" % re.escape(decimal_separator))
+        words = [word for word in self.conjunctions if word != "and"]
+        self.conjunction_re = None
+        if words:
+            self.conjunction_re = re.compile(
+                r"(?<=\d)\s+(?:%s)\s+(?=\d)" % "|".join(re.escape(word) for word in words), re.IGNORECASE
+            )
+
+    def __repr__(self) -> str:
+        return "<QuantityGrammar decimal=%r thousand=%r conjunctions=%r>" % (
+            self.decimal_separator,
+            self.thousand_separator,
+            self.conjunctions,
+        )
+
+    def normalize(self, quantity_string: str) -> str:
+        """
+        Convert a localized quantity string such as ``1,5`` or ``1 et 1/2`` to
+        ``1.5`` or ``1 and 1/2``.
+        """
+        if self.grouping_re is not None:
+            quantity_string = self.grouping_re.sub("", quantity_string)
+        if self.decimal_re is not None:
+            quantity_string = self.decimal_re.sub(".", quantity_string)
+        if self.conjunction_re is not None:
+            quantity_string = self.conjunction_re.sub(" and ", quantity_string)
+        return quantity_string
+
+
+def _build_grammar(language_code: str, use_thousand_separator: bool) -> QuantityGrammar:
+    base_language = language_code.split("-")[0]
+    conjunctions = CONJUNCTIONS.get(language_code, CONJUNCTIONS.get(base_language, ()))
+    # same as django.utils.formats.sanitize_separators(), grouping is only
+    # understood when USE_THOUSAND_SEPARATOR is on.
+    # use_l10n, since before Django 4.0 the language is ignored when USE_L10N is off, its default.
+    thousand_separator = ""
+    if use_thousand_separator:
+        thousand_separator = formats.get_format("THOUSAND_SEPARATOR", language_code, use_l10n=True)
+    return QuantityGrammar(
+        decimal_separator=formats.get_format("DECIMAL_SEPARATOR", language_code, use_l10n=True),
+        thousand_separator=thousand_separator,
+        conjunctions=conjunctions,
+    )
+
+
+def get_quantity_grammar(language_code: Optional[str] = None) -> QuantityGrammar:
+    """
+    Returns the :class:`QuantityGrammar` for a language, defaulting to the active language.
+    Grammars are compiled the first time a language is used.
+
+    :param str language_code: The language code such as ``fr`` or ``de-ch``
+    """
+    key = ((language_code or get_language() or settings.LANGUAGE_CODE).lower(), settings.USE_THOUSAND_SEPARATOR)
+    try:
+        return _grammars[key]
+    except KeyError:
+        return _grammars.setdefault(key, _build_grammar(*key))
+
+
+def register_conjunctions(language_code: str, conjunctions: Iterable[str]) -> None:
+    """
+    Set the words which may separate the whole number and fraction of a mixed number
+    for a language.
+
+    :param str language_code: The language code such as ``fr``
+    :param conjunctions: The words, such as ``["et"]``
+    """
+    CONJUNCTIONS[language_code.lower()] = tuple(conjunctions)
+    _grammars.clear()
+
+
+def normalize_quantity(quantity_string: str, language_code: Optional[str] = None) -> str:
+    """
+    Convert a localized quantity string to the format used by :func:`djfractions.quantity_to_fraction`.
+
+    :param quantity_string: The localized string, such as ``1,5``
+    :param str language_code: The language to use.  Defaults to the active language.
+    """
+    return get_quantity_grammar(language_code).normalize(quantity_string)
+
+
+def localized_quantity_to_fraction(quantity_string: str, language_code: Optional[str] = None) -> fractions.Fraction:
+    """
+    Take a localized quantity string and return a :class:`fractions.Fraction`.
+
+    :param quantity_string: String to convert, such as ``1,5`` or ``1 et 1/2``
+    :param str language_code: The language to use.  Defaults to the active language.
+    """
+    check_quantity(quantity_string)
+    return quantity_to_fraction(normalize_quantity(quantity_string, language_code))
+
+
+def localized_quantity_to_decimal(quantity_string: str, language_code: Optional[str] = None) -> Decimal:
+    """
+    Take a localized quantity string and return a :class:`decimal.Decimal`.
+
+    :param quantity_string: String to convert, such as ``1,5`` or ``1 et 1/2``
+    :param str language_code: The language to use.  Defaults to the active language.
+    """
+    check_quantity(quantity_string)
+    return quantity_to_decimal(normalize_quantity(quantity_string, language_code))
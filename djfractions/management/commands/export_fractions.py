@@ -0,0 +1,62 @@
+from django.apps import apps
+from django.core.exceptions import FieldError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from djfractions import FRACTION_STYLES
+from djfractions.export import iter_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the rows of a model as CSV or TSV, with DecimalFractionField values written as fractions. "
+        "Rows are read and written in chunks, so any size of table is exported in constant memory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("label", metavar="app_label.Model", help="The model to export.")
+        parser.add_argument(
+            "--fields",
+            help="Comma separated field names, or lookups such as recipe__name, to export. Defaults to every field.",
+        )
+        parser.add_argument(
+            "--style", choices=FRACTION_STYLES, default="mixed", help="How fractions are written. Defaults to mixed."
+        )
+        parser.add_argument("--tsv", action="store_true", help="Write tab separated values rather than CSV.")
+        parser.add_argument("--no-header", action="store_true", help="Do not write the field names as the first row.")
+        parser.add_argument("--output", help="The file to write to. Defaults to stdout.")
+        parser.add_argument(
+            "--chunk-size", type=int, default=2000, help="Rows fetched from the cursor at a time. Defaults to 2000."
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="The database to read from.")
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["label"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        fields = None
+        if options["fields"]:
+            fields = [name.strip() for name in options["fields"].split(",") if name.strip()]
+
+        queryset = model._default_manager.using(options["database"]).order_by("pk")
+        kwargs = {
+            "style": options["style"],
+            "dialect": "excel-tab" if options["tsv"] else "excel",
+            "header": not options["no_header"],
+            "chunk_size": options["chunk_size"],
+        }
+        chunks = iter_csv(queryset, fields, **kwargs)
+        try:
+            if options["output"]:
+                with open(options["output"], "w", newline="", encoding="utf-8") as output:
+                    for chunk in chunks:
+                        output.write(chunk)
+            else:
+                for chunk in chunks:
+                    self.stdout.write(chunk, ending="")
+        except FieldError as e:
+            raise CommandError(str(e))
@@ -0,0 +1,125 @@
+import cProfile
+import io
+import pstats
+import time
+from collections import Counter
+from typing import Any, Callable, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from djfractions import DEFAULT_MAX_DENOMINATOR, fraction_parts_cache, get_fraction_parts
+from djfractions.management.utils import get_fraction_fields, is_usable, raw_values
+from djfractions.templatetags.fractions import display_fraction
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile the conversion of stored DecimalFractionField values to fractions, form values, "
+        "and template output using rows from the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "labels",
+            nargs="*",
+            metavar="app_label[.Model[.field]]",
+            help="Limit profiling to these apps, models or fields. Defaults to every DecimalFractionField.",
+        )
+        parser.add_argument("--sample", type=int, default=10000, help="Rows to read per field. Defaults to 10000.")
+        parser.add_argument(
+            "--chunk-size", type=int, default=2000, help="Rows fetched from the cursor at a time. Defaults to 2000."
+        )
+        parser.add_argument("--top", type=int, default=15, help="Number of cProfile entries to show. Defaults to 15.")
+        parser.add_argument("--no-cprofile", action="store_true", help="Skip the cProfile pass.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="The database to read from.")
+
+    def handle(self, *args, **options):
+        fields = get_fraction_fields(options["labels"])
+        if not fields:
+            raise CommandError("No DecimalFractionFields found.")
+
+        connection = connections[options["database"]]
+        for model, field in fields:
+            label = "%s.%s" % (model._meta.label, field.name)
+            if not is_usable(field):
+                self.stderr.write("Skipping %s, it does not define max_digits and decimal_places." % label)
+                continue
+
+            queryset = model._default_manager.using(options["database"])
+            values = [value for pk, value in raw_values(queryset, field, options["chunk_size"], options["sample"])]
+            self.stdout.write(self.style.MIGRATE_HEADING("%s (%d rows)" % (label, len(values))))
+            self.stdout.write(
+                "  limit_denominator=%s coerce_thirds=%s decimal_places=%s"
+                % (field.limit_denominator, field.coerce_thirds, field.decimal_places)
+            )
+            if not values:
+                continue
+            self.profile_field(field, values, connection, options)
+
+    def get_stages(self, field, connection) -> List[Any]:
+        """
+        Returns (name, function, uses_fractions) for each conversion step.  uses_fractions is
+        True when the step takes the output of from_db_value rather than the stored decimal.
+        """
+        # the converter used for this database, which may be from_db_value() or a faster equivalent
+        from_db_value = field.get_db_converters(connection)[0]
+        form_field = field.formfield()
+        limit_denominator = field.limit_denominator or DEFAULT_MAX_DENOMINATOR
+        return [
+            ("from_db_value", lambda value: from_db_value(value, None, connection), False),
+            (
+                "get_fraction_parts",
+                lambda value: get_fraction_parts(value, True, limit_denominator, field.coerce_thirds),
+                True,
+            ),
+            ("FractionField.prepare_value", form_field.prepare_value, True),
+            ("display_fraction", lambda value: display_fraction(value, limit_denominator), True),
+        ]
+
+    def profile_field(self, field, values: List[Any], connection, options) -> None:
+        stages = self.get_stages(field, connection)
+        from_db_value = field.get_db_converters(connection)[0]
+        fraction_values = [from_db_value(value, None, connection) for value in values]
+
+        for name, function, uses_fractions in stages:
+            inputs = fraction_values if uses_fractions else values
+            before = fraction_parts_cache.stats()
+            elapsed = self.time_stage(function, inputs)
+            after = fraction_parts_cache.stats()
+            hits, misses = after.hits - before.hits, after.misses - before.misses
+            cache_report = ""
+            if hits + misses:
+                cache_report = ", cache hit rate %.1f%%" % (100.0 * hits / (hits + misses))
+            self.stdout.write(
+                "  %-28s %12.0f values/sec%s" % (name, len(inputs) / elapsed if elapsed else 0, cache_report)
+            )
+
+        denominators = Counter(value.denominator for value in fraction_values)
+        self.stdout.write("  denominators:")
+        for denominator, count in denominators.most_common(10):
+            self.stdout.write("    %-12d %6.2f%%" % (denominator, 100.0 * count / len(fraction_values)))
+        if len(denominators) > 10:
+            self.stdout.write("    %d other denominators" % (len(denominators) - 10))
+
+        if not options["no_cprofile"]:
+            self.stdout.write("  hotspots:")
+            self.stdout.write(self.cprofile(stages, values, fraction_values, options["top"]))
+
+    def time_stage(self, function: Callable, values: List[Any]) -> float:
+        started = time.perf_counter()
+        for value in values:
+            function(value)
+        return time.perf_counter() - started
+
+    def cprofile(self, stages, values: List[Any], fraction_values: List[Any], top: int) -> str:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for name, function, uses_fractions in stages:
+            for value in fraction_values if uses_fractions else values:
+                function(value)
+        profiler.disable()
+
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).strip_dirs().sort_stats("tottime").print_stats(top)
+        return output.getvalue()
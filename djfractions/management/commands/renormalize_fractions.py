@@ -0,0 +1,105 @@
+import decimal
+import time
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.backends import utils
+
+from djfractions.management.utils import get_fraction_fields, is_usable, raw_values
+
+
+class Command(BaseCommand):
+    help = (
+        "Rewrite the stored values of a DecimalFractionField after changing its limit_denominator, "
+        "coerce_thirds, or decimal_places so they match what the field now converts them to."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("label", metavar="app_label.Model.field", help="The field to renormalize.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows read per chunk.  Changes are saved and a checkpoint reported after each chunk. "
+            "Defaults to 2000.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="Rows per bulk_update() query. Defaults to 500."
+        )
+        parser.add_argument(
+            "--resume-after",
+            metavar="PK",
+            help="Only process rows with a primary key greater than this, such as the last reported checkpoint.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Report changed rows without saving them.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="The database to update.")
+
+    def handle(self, *args, **options):
+        label = options["label"]
+        if label.count(".") != 2:
+            raise CommandError("%s is not app_label.Model.field" % label)
+        [(model, field)] = get_fraction_fields([label])
+        if not is_usable(field):
+            raise CommandError("%s does not define max_digits and decimal_places." % label)
+        if options["chunk_size"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--chunk-size and --batch-size must be positive integers.")
+
+        self.model, self.field = model, field
+        self.database, self.dry_run = options["database"], options["dry_run"]
+        self.batch_size = options["batch_size"]
+
+        queryset = model._base_manager.using(self.database)
+        if options["resume_after"] is not None:
+            queryset = queryset.filter(pk__gt=options["resume_after"])
+
+        started = time.perf_counter()
+        scanned = changed = 0
+        pending: List[Any] = []
+        last_pk = None
+        for pk, value in raw_values(queryset, field, options["chunk_size"]):
+            scanned += 1
+            last_pk = pk
+            fraction_value = field.to_fraction(value)
+            if self.normalize(fraction_value) != value:
+                pending.append(model(pk=pk, **{field.attname: fraction_value}))
+            if scanned % options["chunk_size"] == 0:
+                changed += self.save(pending)
+                pending = []
+                self.report(scanned, changed, last_pk, started)
+
+        changed += self.save(pending)
+        if scanned % options["chunk_size"] or not scanned:
+            self.report(scanned, changed, last_pk, started)
+        self.stdout.write(
+            self.style.SUCCESS(
+                "%s %d of %d rows of %s." % ("Would update" if self.dry_run else "Updated", changed, scanned, label)
+            )
+        )
+
+    def normalize(self, value) -> decimal.Decimal:
+        """
+        Returns value as the decimal the database stores for it, rounded to the field's
+        max_digits and decimal_places.
+        """
+        formatted = utils.format_number(
+            self.field.get_prep_value(value), self.field.max_digits, self.field.decimal_places
+        )
+        # raw_values() only yields the rows which are not null
+        assert formatted is not None
+        return decimal.Decimal(formatted)
+
+    def save(self, objs: List[Any]) -> int:
+        if objs and not self.dry_run:
+            with transaction.atomic(using=self.database):
+                self.model._base_manager.using(self.database).bulk_update(
+                    objs, [self.field.name], batch_size=self.batch_size
+                )
+        return len(objs)
+
+    def report(self, scanned: int, changed: int, last_pk: Any, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            "%d rows scanned, %d changed, %.0f rows/sec, checkpoint: %s"
+            % (scanned, changed, scanned / elapsed if elapsed else 0, last_pk)
+        )
@@ -0,0 +1,81 @@
+"""
+Helpers shared by the djfractions management commands.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.core.management.base import CommandError
+from django.db import models
+from django.db.models.functions import Cast
+
+from djfractions.models import DecimalFractionField
+
+# annotation name used to read the stored decimal without the field's converters
+RAW_VALUE = "_djfractions_raw_value"
+
+
+def get_fraction_fields(labels: Iterable[str] = ()) -> List[Tuple[Type[models.Model], DecimalFractionField]]:
+    """
+    Returns (model, field) for every DecimalFractionField in the installed models, or only
+    those matching labels.  Labels are ``app_label``, ``app_label.Model`` or ``app_label.Model.field``.
+    """
+    labels = list(labels)
+    candidates: List[Tuple[Type[models.Model], Optional[str]]]
+    if not labels:
+        candidates = [(model, None) for model in apps.get_models()]
+    else:
+        candidates = []
+        for label in labels:
+            parts = label.split(".")
+            if len(parts) > 3:
+                raise CommandError("%s is not app_label, app_label.Model, or app_label.Model.field" % label)
+            try:
+                app_config = apps.get_app_config(parts[0])
+                if len(parts) == 1:
+                    candidates.extend((model, None) for model in app_config.get_models())
+                else:
+                    candidates.append((app_config.get_model(parts[1]), parts[2] if len(parts) == 3 else None))
+            except LookupError as e:
+                raise CommandError(str(e))
+
+    fields = []
+    for model, field_name in candidates:
+        for field in model._meta.get_fields():
+            if isinstance(field, DecimalFractionField) and field_name in (None, field.name):
+                fields.append((model, field))
+        if field_name and not any(f.name == field_name for m, f in fields if m is model):
+            raise CommandError("%s.%s is not a DecimalFractionField" % (model._meta.label, field_name))
+    return fields
+
+
+def raw_values(
+    queryset: models.QuerySet, field: DecimalFractionField, chunk_size: int = 2000, limit: Optional[int] = None
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yields (pk, stored decimal) for the non-null values of field in queryset, ordered by
+    primary key.  The value is read as a plain decimal, before the field converts it to
+    a :class:`fractions.Fraction`.  At most limit rows are returned if it is given.  Rows
+    are streamed with ``QuerySet.iterator()``, which uses a server side cursor on databases
+    that support one.
+    """
+    decimal_field: models.DecimalField = models.DecimalField(
+        max_digits=field.max_digits, decimal_places=field.decimal_places
+    )
+    queryset = (
+        queryset.filter(**{"%s__isnull" % field.name: False})
+        .annotate(**{RAW_VALUE: Cast(field.name, output_field=decimal_field)})
+        .order_by("pk")
+        .values_list("pk", RAW_VALUE)
+    )
+    if limit is not None:
+        queryset = queryset[:limit]
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def is_usable(field: DecimalFractionField) -> bool:
+    """
+    Fields without max_digits and decimal_places fail Django's system checks and
+    cannot be read back as decimals.
+    """
+    return field.max_digits is not None and field.decimal_places is not None
@@ -1 +1,2 @@
-from .fields import DecimalFractionField
+from .expressions import FractionValue
+from .fields import BaseFractionField, DecimalFractionField, FloatBackedFractionField, LazyFraction
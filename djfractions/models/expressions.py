@@ -0,0 +1,103 @@
+"""
+Query expressions for doing fraction arithmetic in the database, such as scaling every quantity
+of a recipe with one ``UPDATE``::
+
+    from fractions import Fraction
+    from django.db.models import F
+
+    Ingredient.objects.filter(recipe=recipe).update(quantity=F("quantity") * Fraction(3, 2))
+"""
+
+import decimal
+import fractions
+from typing import Any, List, Optional, Tuple
+
+from django.db.models import Expression, Value
+
+__all__ = ["FractionValue"]
+
+# numerators and denominators outside a signed 64 bit integer can not be bound as parameters by every driver
+BIGINT_LIMIT = 2**63
+# significant digits of the quotient sent in their place
+QUOTIENT_PRECISION = 34
+
+
+class FractionValue(Expression):
+    """
+    A :class:`fractions.Fraction` in a query, such as ``F("quantity") * FractionValue(Fraction(3, 2))``.
+    The numerator and denominator are passed as integers and divided by the database as NUMERIC,
+    DECIMAL on MySQL, or REAL on SQLite, so the value is not rounded through a float first.  A numerator or denominator
+    beyond a 64 bit integer is divided in Python instead, and the quotient passed as a decimal string.
+
+    :param value: The :class:`fractions.Fraction`, or anything Fraction() accepts
+    :param output_field: Defaults to a :class:`djfractions.models.DecimalFractionField`, so that annotations
+        are read back as fractions.
+    """
+
+    def __init__(self, value: Any, output_field: Optional[Any] = None):
+        super().__init__(output_field=output_field)
+        self.value = fractions.Fraction(value)
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (self.__class__.__name__, self.value)
+
+    def _resolve_output_field(self) -> Any:
+        # imported here as the field imports this module
+        from .fields import DecimalFractionField
+
+        return DecimalFractionField()
+
+    def as_sql(self, compiler: Any, connection: Any, cast_type: str = "NUMERIC") -> Tuple[str, List[Any]]:
+        numerator, denominator = self.value.numerator, self.value.denominator
+        if -BIGINT_LIMIT <= numerator < BIGINT_LIMIT and denominator < BIGINT_LIMIT:
+            return "(CAST(%%s AS %s) / %%s)" % cast_type, [numerator, denominator]
+        with decimal.localcontext() as context:
+            context.prec = QUOTIENT_PRECISION
+            quotient = decimal.Decimal(numerator) / decimal.Decimal(denominator)
+        return "CAST(%%s AS %s)" % cast_type, [str(quotient)]
+
+    def as_sqlite(self, compiler: Any, connection: Any) -> Tuple[str, List[Any]]:
+        # NUMERIC affinity keeps whole numbers as integers, which SQLite would divide as integers
+        return self.as_sql(compiler, connection, cast_type="REAL")
+
+    def as_mysql(self, compiler: Any, connection: Any) -> Tuple[str, List[Any]]:
+        # MySQL has no CAST to NUMERIC, and a DECIMAL without a scale drops the fractional part
+        return self.as_sql(compiler, connection, cast_type="DECIMAL(65, 30)")
+
+
+def replace_fraction_values(expression: Any) -> Tuple[Any, bool]:
+    """
+    Returns a copy of expression with each ``Value`` holding a :class:`fractions.Fraction`, such as the one
+    Django wraps around the Fraction in ``F("quantity") * Fraction(3, 2)``, replaced by a :class:`FractionValue`,
+    and whether expression has any fractions in it.  Expressions without any are returned as they are.
+
+    A ``Value`` with an output field, such as those in the ``Case()`` built by ``QuerySet.bulk_update()``,
+    is left alone, since its field already prepares the Fraction.
+    """
+    if isinstance(expression, FractionValue):
+        return expression, True
+    if isinstance(expression, Value):
+        # _output_field_or_none is not in django-stubs
+        if (
+            isinstance(expression.value, fractions.Fraction)
+            and expression._output_field_or_none is None  # type: ignore[attr-defined]
+        ):
+            return FractionValue(expression.value), True
+        return expression, False
+
+    if not hasattr(expression, "get_source_expressions"):
+        # such as an F() which has not been resolved yet
+        return expression, False
+
+    found = False
+    sources = []
+    for source in expression.get_source_expressions():
+        if source is not None:
+            source, source_found = replace_fraction_values(source)
+            found = found or source_found
+        sources.append(source)
+    if not found:
+        return expression, False
+    expression = expression.copy()
+    expression.set_source_expressions(sources)
+    return expression, True
@@ -1,24 +1,99 @@
 import decimal
 import fractions
 import logging
-from typing import Any, List, Optional, Tuple, Union
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from django.core import checks
 from django.core.checks.messages import CheckMessage
-from django.db.models import Field
+from django.db.models import DecimalField, Field, FloatField, IntegerField, Value
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from djfractions import coerce_to_thirds
+from djfractions import DEFAULT_MAX_DENOMINATOR, _from_coprime_ints, _may_be_thirds, coerce_to_thirds
 from djfractions import forms as fraction_forms
+from djfractions import intern_fraction
+
+from .expressions import replace_fraction_values
 
 logger = logging.getLogger(__name__)
 
 
-class DecimalFractionField(Field):
+class LazyFraction(fractions.Fraction):
     """
-    Field which stores values as a Decimal value, but uses
-    :class:`fractions.Fraction` for its value
+    A :class:`fractions.Fraction` loaded by a ``DecimalFractionField(lazy=True)`` which holds the value from
+    the database and only converts it, with the field's ``limit_denominator``, ``coerce_thirds``, and
+    ``intern`` options, the first time its numerator or denominator are needed.  That is on any arithmetic,
+    comparison, hashing, ``str()``, or ``float()``, so it can be used anywhere a Fraction is.
+
+    :ivar db_value: The value loaded from the database, usually a :class:`decimal.Decimal`, for passing
+        through without converting it.
+    """
+
+    __slots__ = ("db_value", "_field")
+    db_value: Any
+    _field: "DecimalFractionField"
+
+    def __new__(cls, db_value: Any, field: "DecimalFractionField") -> "LazyFraction":
+        self = object.__new__(cls)
+        self.db_value = db_value
+        self._field = field
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when the _numerator and _denominator slots have not been set yet
+        if name != "_numerator" and name != "_denominator":
+            raise AttributeError(name)
+        fraction_value = self._field.from_db_decimal(self.db_value, None, None)
+        # from_db_lazy() never wraps None
+        assert fraction_value is not None
+        self._numerator, self._denominator = fraction_value.numerator, fraction_value.denominator
+        return getattr(self, name)
+
+    def __repr__(self) -> str:
+        return "Fraction(%s, %s)" % (self.numerator, self.denominator)
+
+    def __reduce__(self) -> Any:
+        return (fractions.Fraction, (self.numerator, self.denominator))
+
+    def __copy__(self) -> "LazyFraction":
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "LazyFraction":
+        return self
+
+
+def _snap_float(value: float, max_denominator: Optional[int]) -> Optional[fractions.Fraction]:
+    """
+    Returns the first convergent of the continued fraction of value which converts back to exactly value,
+    such as 1/3 for ``1 / 3``, or None if its denominator would be over max_denominator.  A float written
+    from a fraction with a small denominator is found in a few steps of integer arithmetic, rather than
+    by building the float's exact binary fraction and limiting its denominator.
+    """
+    numerator, denominator = value.as_integer_ratio()
+    previous_numerator, previous_denominator, current_numerator, current_denominator = 0, 1, 1, 0
+    while True:
+        term, remainder = divmod(numerator, denominator)
+        next_denominator = previous_denominator + term * current_denominator
+        if max_denominator is not None and next_denominator > max_denominator:
+            return None
+        previous_numerator, previous_denominator, current_numerator, current_denominator = (
+            current_numerator,
+            current_denominator,
+            previous_numerator + term * current_numerator,
+            next_denominator,
+        )
+        # int true division is correctly rounded, and the last convergent is value itself
+        if not remainder or current_numerator / current_denominator == value:
+            return _from_coprime_ints(current_numerator, current_denominator)
+        numerator, denominator = denominator, remainder
+
+
+class BaseFractionField(Field):
+    """
+    Base for fields which use :class:`fractions.Fraction` for their value, with the ``limit_denominator``,
+    ``coerce_thirds``, and ``intern`` options applied to values read from the database.  Subclasses choose
+    how the value is stored.
     """
 
     empty_strings_allowed = False
@@ -27,7 +102,108 @@ class DecimalFractionField(Field):
     default_error_messages = {
         "invalid": _("'%(value)s' value must be a fraction number."),  # type: ignore
     }
+
+    def __init__(
+        self,
+        verbose_name: Optional[str] = None,
+        name: Optional[str] = None,
+        limit_denominator: Optional[int] = None,
+        coerce_thirds: bool = True,
+        intern: bool = False,
+        **kwargs
+    ):
+        self.limit_denominator = limit_denominator
+        self.coerce_thirds = coerce_thirds
+        self.intern = intern
+        super().__init__(verbose_name=verbose_name, name=name, **kwargs)
+
+    def get_placeholder(self, value: Any, compiler: Any, connection: Any) -> str:
+        # QuerySet.update() calls this with the resolved expression being saved just before compiling it,
+        # on every Django version, while get_db_prep_save() is only given expressions from Django 4.2.
+        if hasattr(value, "as_sql"):
+            return self.prepare_expression(value, connection)
+        return "%s"
+
+    def prepare_expression(self, expression: Any, connection: Any) -> str:
+        """
+        Replaces any :class:`fractions.Fraction` in the resolved expression being saved to this field, such as
+        the one in ``F("quantity") * Fraction(3, 2)``, with a :class:`djfractions.models.FractionValue`, so that
+        ``QuerySet.update()`` can do fraction arithmetic in the database.  Returns the SQL placeholder for the
+        expression.
+
+        The expression is changed in place.  It was resolved for the query being compiled, so nothing else
+        refers to it.
+        """
+        self.replace_fractions(expression, connection)
+        return "%s"
+
+    def replace_fractions(self, expression: Any, connection: Any) -> bool:
+        """
+        Replaces the fractions in expression, in place, for :meth:`prepare_expression`, and returns whether
+        there were any.
+        """
+        replaced, has_fractions = replace_fraction_values(expression)
+        if replaced is expression:
+            return has_fractions
+        if isinstance(expression, Value):
+            # such as update(quantity=Value(Fraction(1, 3))), which can only be saved as a plain value
+            expression.value = self.get_db_prep_save(expression.value, connection)
+        else:
+            expression.set_source_expressions(replaced.get_source_expressions())
+        return True
+
+    def to_python(self, value: Union[fractions.Fraction, decimal.Decimal, float, int, str]) -> fractions.Fraction:
+        if value is None:
+            return value
+
+        # probably need similar error handling to
+        # https://github.com/django/django/blob/stable/1.8.x/django/db/models/fields/__init__.py#L1598
+        return self.to_fraction(value)
+
+    def to_fraction(self, value: Union[fractions.Fraction, decimal.Decimal, float, int, str]) -> fractions.Fraction:
+        fraction_value = fractions.Fraction(value)
+
+        if self.limit_denominator:
+            fraction_value = fraction_value.limit_denominator(self.limit_denominator)
+
+        if self.coerce_thirds and (not self.limit_denominator or self.limit_denominator > 3):
+            fraction_value = coerce_to_thirds(fraction_value)
+
+        if self.intern:
+            fraction_value = intern_fraction(fraction_value)
+
+        return fraction_value
+
+    def deconstruct(self) -> Tuple[str, str, list, dict]:
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["limit_denominator"] = self.limit_denominator
+        kwargs["coerce_thirds"] = self.coerce_thirds
+        if self.intern:
+            kwargs["intern"] = self.intern
+        return name, path, args, kwargs
+
+    def formfield(
+        self,
+        form_class: Optional[Any] = fraction_forms.FractionField,
+        choices_form_class: Optional[Any] = None,
+        **kwargs: Any
+    ) -> Any:
+        return super().formfield(form_class=form_class, choices_form_class=choices_form_class, **kwargs)
+
+
+class DecimalFractionField(BaseFractionField):
+    """
+    Field which stores values as a Decimal value, but uses
+    :class:`fractions.Fraction` for its value
+    """
+
     description = _("Fraction number stored in the database as a Decimal")
+    # Database converters by connection vendor, used by get_db_converters() in place of from_db_value().
+    # Django's SQLite backend has already turned the stored REAL into a Decimal, and psycopg returns Decimal.
+    db_converters: Dict[str, str] = {
+        "sqlite": "from_db_decimal",
+        "postgresql": "from_db_decimal",
+    }
 
     def __init__(
         self,
@@ -37,14 +213,22 @@ class DecimalFractionField(Field):
         decimal_places: Optional[int] = None,
         limit_denominator: Optional[int] = None,
         coerce_thirds: bool = True,
+        intern: bool = False,
+        lazy: bool = False,
         **kwargs
     ):
-        self.limit_denominator = limit_denominator
-        self.coerce_thirds = coerce_thirds
+        self.lazy = lazy
 
         # for decimal stuff
         self.max_digits, self.decimal_places = max_digits, decimal_places
-        super().__init__(verbose_name=verbose_name, name=name, **kwargs)
+        super().__init__(
+            verbose_name=verbose_name,
+            name=name,
+            limit_denominator=limit_denominator,
+            coerce_thirds=coerce_thirds,
+            intern=intern,
+            **kwargs
+        )
 
     @cached_property
     def context(self) -> decimal.Context:
@@ -129,7 +313,67 @@ class DecimalFractionField(Field):
         # Not sure if I even really need this anymore.
         return self.to_python(value)
 
+    def get_db_converters(self, connection: Any) -> List[Callable]:
+        if self.lazy:
+            return [self.from_db_lazy]
+        converter = self.db_converters.get(connection.vendor)
+        # a subclass which overrides from_db_value() expects it to be used
+        if converter is None or type(self).from_db_value is not DecimalFractionField.from_db_value:
+            # get_db_converters() is not in django-stubs
+            return super().get_db_converters(connection)  # type: ignore[misc]
+        return [getattr(self, converter)]
+
+    def from_db_decimal(self, value: Any, expression: Any, connection: Any) -> Optional[fractions.Fraction]:
+        """
+        Database converter for drivers which return :class:`decimal.Decimal`.  Returns the same
+        value as :meth:`from_db_value`, but takes the numerator and denominator straight from the
+        Decimal, or from a decimal string, and skips the work of ``limit_denominator`` and
+        ``coerce_thirds`` for values they would not change.
+        """
+        if value is None:
+            return value
+        value_type = type(value)
+        if value_type is decimal.Decimal:
+            # already reduced, and raises ValueError for NaN and infinity just as Fraction() does
+            numerator, denominator = value.as_integer_ratio()
+        elif value_type is str:
+            whole, point, decimals = value.partition(".")
+            if not (decimals.isdigit() and whole.lstrip("-").isdigit()):
+                return self.to_python(value)
+            numerator, denominator = int(whole + decimals), 10 ** len(decimals)
+            divisor = math.gcd(numerator, denominator)
+            numerator, denominator = numerator // divisor, denominator // divisor
+        else:
+            return self.to_python(value)
+
+        limit = self.limit_denominator
+        if limit and denominator > limit:
+            fraction_value = fractions.Fraction(numerator, denominator).limit_denominator(limit)
+            numerator, denominator = fraction_value.numerator, fraction_value.denominator
+        else:
+            fraction_value = _from_coprime_ints(numerator, denominator)
+
+        if self.coerce_thirds and (not limit or limit > 3) and _may_be_thirds(numerator, denominator):
+            fraction_value = coerce_to_thirds(fraction_value)
+
+        if self.intern:
+            fraction_value = intern_fraction(fraction_value)
+
+        return fraction_value
+
+    def from_db_lazy(self, value: Any, expression: Any, connection: Any) -> Optional[LazyFraction]:
+        """
+        Database converter used when the field has ``lazy=True``.  Returns a :class:`LazyFraction`
+        which converts value the same way as :meth:`from_db_decimal` when it is first used.
+        """
+        if value is None:
+            return value
+        return LazyFraction(value, self)
+
     def get_db_prep_save(self, value: Any, connection):
+        # expressions such as the Case() built by QuerySet.bulk_update() compile themselves
+        if hasattr(value, "as_sql"):
+            return value
         # return connection.ops.adapt_decimalfield_value(self.to_python(value), self.max_digits, self.decimal_places)
         # for django 1.9 the following will need used.
         if hasattr(connection.ops, "adapt_decimalfield_value"):
@@ -141,13 +385,15 @@ class DecimalFractionField(Field):
         else:
             return connection.ops.value_to_db_decimal(self.get_prep_value(value), self.max_digits, self.decimal_places)
 
-    def to_python(self, value: Union[fractions.Fraction, decimal.Decimal, float, int, str]) -> fractions.Fraction:
-        if value is None:
-            return value
-
-        # probably need similar error handling to
-        # https://github.com/django/django/blob/stable/1.8.x/django/db/models/fields/__init__.py#L1598
-        return self.to_fraction(value)
+    def prepare_expression(self, expression: Any, connection: Any) -> str:
+        """
+        Replaces any :class:`fractions.Fraction` in the resolved expression being saved to this field, as
+        :meth:`BaseFractionField.prepare_expression` does, and returns a placeholder which rounds the result to
+        ``decimal_places``.  Other expressions are saved as they are.
+        """
+        if not self.replace_fractions(expression, connection) or self.decimal_places is None:
+            return "%s"
+        return "ROUND(%%s, %d)" % self.decimal_places
 
     def get_prep_value(
         self, value: Union[fractions.Fraction, decimal.Decimal, float, int, str, None]
@@ -166,21 +412,10 @@ class DecimalFractionField(Field):
 
         return decimal.Decimal(value)
 
-    def to_fraction(self, value: Union[fractions.Fraction, decimal.Decimal, float, int, str]) -> fractions.Fraction:
-        fraction_value = fractions.Fraction(value)
-
-        if self.limit_denominator:
-            fraction_value = fraction_value.limit_denominator(self.limit_denominator)
-
-        if self.coerce_thirds and (not self.limit_denominator or self.limit_denominator > 3):
-            fraction_value = coerce_to_thirds(fraction_value)
-
-        return fraction_value
-
     def deconstruct(self) -> Tuple[str, str, list, dict]:
         name, path, args, kwargs = super().deconstruct()
-        kwargs["limit_denominator"] = self.limit_denominator
-        kwargs["coerce_thirds"] = self.coerce_thirds
+        if self.lazy:
+            kwargs["lazy"] = self.lazy
 
         # added this
         # copied from decimal field
@@ -191,14 +426,6 @@ class DecimalFractionField(Field):
 
         return name, path, args, kwargs
 
-    def formfield(
-        self,
-        form_class: Optional[Any] = fraction_forms.FractionField,
-        choices_form_class: Optional[Any] = None,
-        **kwargs: Any
-    ) -> Any:
-        return super().formfield(form_class=form_class, choices_form_class=choices_form_class, **kwargs)
-
     def get_internal_type(self) -> str:
         # returning DecimalField, since we use the same backing column type as that
         # and this is safer than overriding db_type() and db_check() since that would
@@ -225,3 +452,90 @@ class DecimalFractionField(Field):
         from django.db.backends import utils
 
         return utils.format_number(value, self.max_digits, self.decimal_places)
+
+
+class FloatBackedFractionField(BaseFractionField):
+    """
+    Field which stores values as a double precision float, but uses :class:`fractions.Fraction` for its value.
+    Floats compare, sort, and aggregate faster than NUMERIC columns and make smaller indexes, and a fraction
+    with a denominator up to ``limit_denominator`` is read back exactly from the float it was saved as.
+
+    ``limit_denominator`` defaults to 1000000 rather than None, since a float has no exact decimal places
+    to limit it.  With None, values are read back as the exact binary fraction of the float.
+    """
+
+    description = _("Fraction number stored in the database as a float")
+
+    def __init__(
+        self,
+        verbose_name: Optional[str] = None,
+        name: Optional[str] = None,
+        limit_denominator: Optional[int] = DEFAULT_MAX_DENOMINATOR,
+        coerce_thirds: bool = True,
+        intern: bool = False,
+        **kwargs
+    ):
+        super().__init__(
+            verbose_name=verbose_name,
+            name=name,
+            limit_denominator=limit_denominator,
+            coerce_thirds=coerce_thirds,
+            intern=intern,
+            **kwargs
+        )
+
+    def from_db_value(self, value: Any, expression: Any, connection: Any, *args, **kwargs) -> fractions.Fraction:
+        """
+        Snaps the stored float to the fraction with a small denominator it was saved from, then applies
+        ``coerce_thirds`` and ``intern``.  Falls back to :meth:`to_python` for floats which are not within
+        ``limit_denominator`` of a fraction, and for every float when ``limit_denominator`` is None.
+        """
+        if value is None or type(value) is not float or not math.isfinite(value) or self.limit_denominator is None:
+            return self.to_python(value)
+        fraction_value = _snap_float(value, self.limit_denominator)
+        if fraction_value is None:
+            return self.to_python(value)
+
+        limit = self.limit_denominator
+        if (
+            self.coerce_thirds
+            and (not limit or limit > 3)
+            and _may_be_thirds(fraction_value.numerator, fraction_value.denominator)
+        ):
+            fraction_value = coerce_to_thirds(fraction_value)
+
+        if self.intern:
+            fraction_value = intern_fraction(fraction_value)
+
+        return fraction_value
+
+    def get_prep_value(
+        self, value: Union[fractions.Fraction, decimal.Decimal, float, int, str, None]
+    ) -> Optional[float]:
+        if value is None:
+            return value
+        if isinstance(value, str):
+            value = fractions.Fraction(value)
+        return float(value)
+
+    def get_internal_type(self) -> str:
+        return "FloatField"
+
+
+try:
+    # added in Django 4.1 and not in django-stubs yet
+    from django.db.models.expressions import register_combinable_fields  # type: ignore[attr-defined]
+except ImportError:
+    # before Django 4.1 arithmetic between two DecimalFractionFields already resolves to one, and mixed
+    # types need an output_field
+    pass
+else:
+    # so that arithmetic such as F("quantity") * FractionValue(Fraction(3, 2)) or F("quantity") * 2
+    # in an annotation is read back as a fraction
+    for _connector in ("+", "-", "*", "/"):
+        for _other in (DecimalFractionField, DecimalField, IntegerField):
+            register_combinable_fields(DecimalFractionField, _connector, _other, DecimalFractionField)
+            register_combinable_fields(_other, _connector, DecimalFractionField, DecimalFractionField)
+        for _other in (FloatBackedFractionField, DecimalFractionField, FloatField, IntegerField):
+            register_combinable_fields(FloatBackedFractionField, _connector, _other, FloatBackedFractionField)
+            register_combinable_fields(_other, _connector, FloatBackedFractionField, FloatBackedFractionField)
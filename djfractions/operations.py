@@ -0,0 +1,301 @@
+"""
+Migration operations for moving data off of :class:`djfractions.models.DecimalFractionField`.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from django.db import NotSupportedError
+from django.db.migrations.operations.base import Operation
+
+__all__ = ["ConvertFractionToIntegers"]
+
+# SQL type names used to cast to a double and to an exact decimal, by database vendor.
+# The conversion relies on WITH RECURSIVE and UPDATE ... FROM, so only databases
+# which support both are listed.
+VENDOR_TYPES = {
+    "sqlite": {"double": "REAL", "decimal": "REAL"},
+    "postgresql": {"double": "DOUBLE PRECISION", "decimal": "NUMERIC"},
+}
+
+# The largest max_digits converted exactly, by database vendor.  The stored decimal is scaled to a
+# BIGINT, which holds any 18 digit integer.  SQLite stores decimals as doubles, which Django reads
+# back rounded to 15 significant digits, and beyond that the scaled double is not exact either.
+VENDOR_MAX_DIGITS = {
+    "sqlite": 15,
+    "postgresql": 18,
+}
+
+# coerce_thirds is checked with p / q as a double, as Python does, which is only exact while p and q
+# are below this.
+MAX_EXACT_DOUBLE = 2**53
+
+# Finds the same fraction as Fraction(stored_decimal).limit_denominator(limit) for each row.
+# The stored decimal is scaled to an integer numerator n over 10 ** decimal_places and
+# expanded as a continued fraction, one row per term, until the next convergent's
+# denominator would be larger than the limit.  The first term is taken in the anchor
+# so that the remainders are never negative and integer division is floor division.
+# The choice between the last convergent and the best semiconvergent is the all integer
+# form used by CPython 3.12's limit_denominator():  2 * d * (q0 + k * q1) <= denominator
+# written as (q0 + k * q1) <= denominator / (2 * d), which is the same for integers and
+# does not overflow a BIGINT when 10 ** decimal_places * limit does.  The limit is never
+# more than 10 ** decimal_places, which is the largest denominator n / 10 ** decimal_places has.
+# Modulo is written %% because the statements are run with query parameters.
+CONVERT_SQL = """
+WITH RECURSIVE
+src (pk, n) AS (
+    SELECT {pk}, CAST(ROUND({column} * {scale}) AS BIGINT)
+    FROM {table}
+    WHERE {column} IS NOT NULL{batch}
+),
+first_term (pk, n, a) AS (
+    SELECT pk, n, CASE WHEN n < 0 AND n %% {scale} <> 0 THEN n / {scale} - 1 ELSE n / {scale} END FROM src
+),
+cf (pk, n, d, p0, q0, p1, q1) AS (
+    SELECT pk, CAST({scale} AS BIGINT), n - a * {scale}, CAST(1 AS BIGINT), CAST(0 AS BIGINT), a, CAST(1 AS BIGINT)
+    FROM first_term
+    UNION ALL
+    SELECT pk, d, n %% d, p1, q1, p0 + (n / d) * p1, q0 + (n / d) * q1
+    FROM cf
+    WHERE CASE WHEN d = 0 THEN 0 WHEN q0 + (n / d) * q1 <= {limit} THEN 1 ELSE 0 END = 1
+),
+best (pk, p, q) AS (
+    SELECT
+        pk,
+        CASE
+            WHEN d = 0 THEN p1
+            WHEN q0 + (({limit} - q0) / q1) * q1 <= {scale} / (2 * d) THEN p1
+            ELSE p0 + (({limit} - q0) / q1) * p1
+        END,
+        CASE
+            WHEN d = 0 THEN q1
+            WHEN q0 + (({limit} - q0) / q1) * q1 <= {scale} / (2 * d) THEN q1
+            ELSE q0 + (({limit} - q0) / q1) * q1
+        END
+    FROM cf
+    WHERE CASE WHEN d = 0 THEN 1 WHEN q0 + (n / d) * q1 > {limit} THEN 1 ELSE 0 END = 1
+){thirds}
+UPDATE {table}
+SET {numerator} = result.p, {denominator} = result.q
+FROM {result} AS result
+WHERE {table}.{pk} = result.pk
+"""
+
+# The same test as djfractions.coerce_to_thirds(), which rounds float(p / q) to hundredths.
+# x = p / q is rounded to a double as Python does, which is exact while p and q are below 2 ** 53,
+# and f = x - w, where w is the whole part of p / q, is its exact fractional part.  h is the exact
+# number of hundredths in p / q - w.  Rounding up or down depends on which side of (2h + 1) / 200
+# f falls.  f * 200 - (2h + 1) is worked out exactly with Dekker's product, splitting f into high
+# and low halves of its mantissa, so that values which are not exactly representable round the
+# same way Python does.
+THIRDS_SQL = """,
+doubles (pk, p, q, w, f) AS (
+    SELECT pk, p, q, p / q, CAST(p AS {double}) / CAST(q AS {double}) - CAST(p / q AS {double})
+    FROM best
+    WHERE p >= 0
+),
+split (pk, p, q, h, f, c) AS (
+    SELECT pk, p, q, (100 * (p - w * q)) / q, f, CAST(134217729 AS {double}) * f FROM doubles
+),
+product (pk, p, q, h, f, hi, prod) AS (
+    SELECT pk, p, q, h, f, c - (c - f), f * 200 FROM split
+),
+hundredths (pk, p, q, c) AS (
+    SELECT
+        pk,
+        p,
+        q,
+        h + CASE
+            WHEN (prod - (2 * h + 1)) + ((hi * 200 - prod) + (f - hi) * 200) > 0 THEN 1
+            WHEN (prod - (2 * h + 1)) + ((hi * 200 - prod) + (f - hi) * 200) < 0 THEN 0
+            ELSE h %% 2
+        END
+    FROM product
+),
+thirds (pk, p, q) AS (
+    SELECT pk, 3 * (p / q) + CASE WHEN c %% 100 < 50 THEN 1 ELSE 2 END, 3
+    FROM hundredths
+    WHERE c %% 100 IN (30, 33, 60, 67)
+),
+coerced (pk, p, q) AS (
+    SELECT pk, p, q FROM thirds
+    UNION ALL
+    SELECT pk, p, q FROM best WHERE pk NOT IN (SELECT pk FROM thirds)
+)"""
+
+REVERSE_SQL = """
+UPDATE {table}
+SET {column} = ROUND(CAST({numerator} AS {decimal}) / {denominator}, {decimal_places})
+WHERE {numerator} IS NOT NULL AND {denominator} IS NOT NULL{batch}
+"""
+
+
+class ConvertFractionToIntegers(Operation):
+    """
+    Copies the values of a :class:`djfractions.models.DecimalFractionField` into a pair of
+    integer fields holding the numerator and denominator, entirely in SQL.
+
+    Each value becomes the same fraction that the field's ``to_fraction()`` returns, using the
+    field's ``limit_denominator`` and ``coerce_thirds``.  Rows are converted in primary key
+    order with one UPDATE per batch, so the table is never loaded into Python.  Add the integer
+    fields before this operation and remove the decimal field after it.  Reversing writes
+    numerator / denominator back to the decimal field, rounded to its ``decimal_places``.
+
+    Supported on SQLite 3.33+, for fields with a ``max_digits`` of at most 15, and on PostgreSQL for
+    fields with a ``max_digits`` of at most 18, since each value is scaled to a 64 bit integer.  When
+    ``coerce_thirds`` applies, the largest numerator the conversion can find, 10 ** (max_digits -
+    decimal_places) times the smaller of ``limit_denominator`` and 10 ** decimal_places, must also be
+    below 2 ** 53, since Python checks for thirds with a float.  That always holds for fields of 15 digits
+    or fewer.  :class:`django.db.NotSupportedError` is raised before any SQL is run for other fields.
+
+    :ivar str model_name: The model name
+    :ivar str from_field: The name of the DecimalFractionField
+    :ivar str numerator_field: The name of the integer field to store the numerator in
+    :ivar str denominator_field: The name of the integer field to store the denominator in
+    :ivar int batch_size: Rows per UPDATE
+    """
+
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(
+        self,
+        model_name: str,
+        from_field: str,
+        numerator_field: str,
+        denominator_field: str,
+        batch_size: int = 10000,
+    ):
+        self.model_name = model_name
+        self.from_field = from_field
+        self.numerator_field = numerator_field
+        self.denominator_field = denominator_field
+        self.batch_size = batch_size
+
+    def deconstruct(self) -> Tuple[str, list, dict]:
+        kwargs: Dict[str, Any] = {
+            "model_name": self.model_name,
+            "from_field": self.from_field,
+            "numerator_field": self.numerator_field,
+            "denominator_field": self.denominator_field,
+        }
+        if self.batch_size != 10000:
+            kwargs["batch_size"] = self.batch_size
+        return (self.__class__.__qualname__, [], kwargs)
+
+    def state_forwards(self, app_label: str, state: Any) -> None:
+        # only data changes, the fields are added and removed by their own operations.
+        pass
+
+    def database_forwards(self, app_label: str, schema_editor: Any, from_state: Any, to_state: Any) -> None:
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        field = model._meta.get_field(self.from_field)
+        vendor_types = self.get_vendor_types(schema_editor.connection)
+        max_digits = VENDOR_MAX_DIGITS[schema_editor.connection.vendor]
+        if field.max_digits > max_digits:
+            raise NotSupportedError(
+                "%s supports fields with max_digits of at most %d on %s, %s.%s has %d."
+                % (
+                    self.__class__.__name__,
+                    max_digits,
+                    schema_editor.connection.vendor,
+                    self.model_name,
+                    self.from_field,
+                    field.max_digits,
+                )
+            )
+        scale = 10**field.decimal_places
+        # without a limit, or with one above scale, the exact fraction is used.
+        limit = min(field.limit_denominator or scale, scale)
+        thirds = ""
+        if field.coerce_thirds and (not field.limit_denominator or field.limit_denominator > 3):
+            if 10 ** (field.max_digits - field.decimal_places) * limit >= MAX_EXACT_DOUBLE:
+                raise NotSupportedError(
+                    "%s can not apply coerce_thirds to %s.%s, its largest numerator must be below 2 ** 53. "
+                    "Lower its limit_denominator or max_digits."
+                    % (self.__class__.__name__, self.model_name, self.from_field)
+                )
+            thirds = THIRDS_SQL.format(**vendor_types)
+        sql = CONVERT_SQL.format(
+            scale=scale,
+            limit=limit,
+            thirds=thirds,
+            result="coerced" if thirds else "best",
+            batch="{batch}",
+            **self.get_names(model, schema_editor.connection),
+        )
+        self.run_batches(model, self.from_field, sql, schema_editor)
+
+    def database_backwards(self, app_label: str, schema_editor: Any, from_state: Any, to_state: Any) -> None:
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        sql = REVERSE_SQL.format(
+            decimal=self.get_vendor_types(schema_editor.connection)["decimal"],
+            decimal_places=model._meta.get_field(self.from_field).decimal_places,
+            batch="{batch}",
+            **self.get_names(model, schema_editor.connection),
+        )
+        self.run_batches(model, self.numerator_field, sql, schema_editor)
+
+    def get_vendor_types(self, connection: Any) -> Dict[str, str]:
+        try:
+            return VENDOR_TYPES[connection.vendor]
+        except KeyError:
+            raise NotSupportedError("%s is not supported on %s." % (self.__class__.__name__, connection.vendor))
+
+    def get_names(self, model: Any, connection: Any) -> Dict[str, str]:
+        quote_name = connection.ops.quote_name
+        return {
+            "table": quote_name(model._meta.db_table),
+            "pk": quote_name(model._meta.pk.column),
+            "column": quote_name(model._meta.get_field(self.from_field).column),
+            "numerator": quote_name(model._meta.get_field(self.numerator_field).column),
+            "denominator": quote_name(model._meta.get_field(self.denominator_field).column),
+        }
+
+    def get_batch_bounds(self, model: Any, field_name: str, using: str) -> List[Any]:
+        """
+        Returns the primary key of the last row in each full batch of rows which have a value in field_name.
+        """
+        queryset = (
+            model._base_manager.using(using)
+            .filter(**{"%s__isnull" % field_name: False})
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        bounds: List[Any] = []
+        while True:
+            remaining = queryset.filter(pk__gt=bounds[-1]) if bounds else queryset
+            try:
+                bounds.append(remaining[self.batch_size - 1])
+            except IndexError:
+                return bounds
+
+    def run_batches(self, model: Any, field_name: str, sql: str, schema_editor: Any) -> None:
+        pk = schema_editor.connection.ops.quote_name(model._meta.pk.column)
+        bounds = self.get_batch_bounds(model, field_name, schema_editor.connection.alias)
+        lower = None
+        for upper in bounds + [None]:
+            batch, params = "", []
+            if lower is not None:
+                batch += " AND %s > %%s" % pk
+                params.append(lower)
+            if upper is not None:
+                batch += " AND %s <= %%s" % pk
+                params.append(upper)
+            schema_editor.execute(sql.format(batch=batch), params)
+            lower = upper
+
+    def describe(self) -> str:
+        return "Convert %s.%s to %s / %s" % (
+            self.model_name,
+            self.from_field,
+            self.numerator_field,
+            self.denominator_field,
+        )
+
+    @property
+    def migration_name_fragment(self) -> str:
+        return "%s_%s_to_integers" % (self.model_name.lower(), self.from_field.lower())
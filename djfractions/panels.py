@@ -0,0 +1,70 @@
+"""
+A django-debug-toolbar panel showing the fraction conversions made by each request::
+
+    DEBUG_TOOLBAR_PANELS = [
+        ...
+        "djfractions.panels.FractionsPanel",
+    ]
+"""
+
+from typing import Any, Dict
+
+from django.utils.translation import gettext_lazy as _
+
+from djfractions import instrumentation
+
+try:
+    # django-debug-toolbar is an optional dependency without type stubs
+    from debug_toolbar.panels import Panel  # type: ignore[import]
+except ImportError as e:
+    raise ImportError("djfractions.panels requires django-debug-toolbar, run: pip install django-debug-toolbar") from e
+
+__all__ = ["FractionsPanel"]
+
+
+class FractionsPanel(Panel):
+    """
+    Shows how many times each fraction conversion point was called during the request, the time
+    spent in each, the slowest inputs, and ``fraction_parts_cache`` hits and misses.
+    """
+
+    title = _("Fractions")
+    template = "djfractions/debug_toolbar/fractions_panel.html"
+
+    @property
+    def nav_subtitle(self) -> str:
+        stats = self.get_stats()
+        if not stats:
+            return ""
+        return _("%(count)d conversions in %(time).2fms") % {"count": stats["count"], "time": stats["total_time"]}
+
+    def enable_instrumentation(self) -> None:
+        # the wrappers are left in place afterwards.  They call straight through when
+        # nothing is collecting, and other threads may still be inside a request.
+        instrumentation.install()
+
+    def process_request(self, request: Any) -> Any:
+        with instrumentation.collect() as self.collector:
+            return super().process_request(request)
+
+    def generate_stats(self, request: Any, response: Any) -> None:
+        collector = self.collector
+        conversions = []
+        for label, stats in sorted(collector.stats.items(), key=lambda item: item[1].total_time, reverse=True):
+            conversions.append(
+                {
+                    "label": label,
+                    "count": stats.count,
+                    "total_time": stats.total_time * 1000,
+                    "average_time": stats.total_time * 1000 / stats.count,
+                    "slowest": [(elapsed * 1000, value) for elapsed, value in stats.slowest],
+                }
+            )
+        data: Dict[str, Any] = {
+            "conversions": conversions,
+            "count": collector.count,
+            "total_time": collector.total_time * 1000,
+            "cache_hits": collector.cache_hits,
+            "cache_misses": collector.cache_misses,
+        }
+        self.record_stats(data)
@@ -0,0 +1,201 @@
+"""
+JSON encoding and decoding for :class:`fractions.Fraction`.
+
+Fractions are written either as ``"n/d"`` strings, the same as ``str(fraction)``, or as
+``{"numerator": n, "denominator": d}`` objects.  The module is also a Django serializer
+format which writes ``DecimalFractionField`` values this way::
+
+    SERIALIZATION_MODULES = {"json": "djfractions.serializers"}
+"""
+
+import fractions
+import json
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Optional, Type, Union
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.serializers.json import Serializer as JSONSerializer
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.db import models
+
+from djfractions.models import BaseFractionField
+
+__all__ = [
+    "FractionJSONEncoder",
+    "StructuredFractionJSONEncoder",
+    "FractionJSONDecoder",
+    "orjson_default",
+    "orjson_structured_default",
+    "fraction_to_json",
+    "fraction_from_json",
+    "fraction_object_hook",
+    "Serializer",
+    "Deserializer",
+]
+
+_Fraction = fractions.Fraction
+
+
+def fraction_to_json(value: fractions.Fraction, structured: bool = False) -> Union[str, Dict[str, int]]:
+    """
+    Returns value as ``"n/d"``, or ``"n"`` for whole numbers, or as
+    ``{"numerator": n, "denominator": d}`` if structured is True.
+    """
+    if structured:
+        return {"numerator": value.numerator, "denominator": value.denominator}
+    return str(value)
+
+
+def fraction_from_json(value: Union[str, Dict[str, int]]) -> fractions.Fraction:
+    """
+    Returns the :class:`fractions.Fraction` for a value written by :func:`fraction_to_json`.
+    Other strings which :class:`fractions.Fraction` accepts, such as ``"0.5"``, also work.
+    """
+    if isinstance(value, dict):
+        return _Fraction(value["numerator"], value["denominator"])
+    numerator, slash, denominator = value.partition("/")
+    try:
+        return _Fraction(int(numerator), int(denominator) if slash else 1)
+    except ValueError:
+        return _Fraction(value)
+
+
+def fraction_object_hook(obj: Dict[str, Any]) -> Any:
+    """
+    ``object_hook`` for :func:`json.loads` which turns ``{"numerator": n, "denominator": d}``
+    objects into :class:`fractions.Fraction`.
+    """
+    if len(obj) == 2 and "numerator" in obj and "denominator" in obj:
+        return _Fraction(obj["numerator"], obj["denominator"])
+    return obj
+
+
+class FractionJSONEncoder(DjangoJSONEncoder):
+    """
+    :class:`django.core.serializers.json.DjangoJSONEncoder` which also encodes
+    :class:`fractions.Fraction` as ``"n/d"``.  Usable anywhere Django accepts an encoder,
+    such as ``JsonResponse(data, encoder=FractionJSONEncoder)``.
+    """
+
+    structured_fractions = False
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, _Fraction):
+            return fraction_to_json(o, self.structured_fractions)
+        return super().default(o)
+
+
+class StructuredFractionJSONEncoder(FractionJSONEncoder):
+    """
+    Encodes :class:`fractions.Fraction` as ``{"numerator": n, "denominator": d}``.
+    """
+
+    structured_fractions = True
+
+
+class FractionJSONDecoder(json.JSONDecoder):
+    """
+    Decodes the objects written by :class:`StructuredFractionJSONEncoder` back to
+    :class:`fractions.Fraction`.  ``"n/d"`` strings cannot be told apart from other strings,
+    so they are left for :func:`fraction_from_json`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("object_hook", fraction_object_hook)
+        super().__init__(*args, **kwargs)
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    ``default`` for ``orjson.dumps()`` which encodes :class:`fractions.Fraction` as ``"n/d"``
+    and :class:`decimal.Decimal`, which orjson does not support, as a string.
+    """
+    if isinstance(obj, _Fraction):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+def orjson_structured_default(obj: Any) -> Any:
+    """
+    ``default`` for ``orjson.dumps()`` which encodes :class:`fractions.Fraction` as
+    ``{"numerator": n, "denominator": d}``.
+    """
+    if isinstance(obj, _Fraction):
+        return {"numerator": obj.numerator, "denominator": obj.denominator}
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+class Serializer(JSONSerializer):
+    """
+    Django's JSON serializer with ``DecimalFractionField`` values written as ``"n/d"``, or as
+    structured objects when the ``structured_fractions=True`` option is given.
+    """
+
+    def _init_options(self) -> None:
+        self.structured_fractions = self.options.pop("structured_fractions", False)
+        # the private serializer hooks are not in django-stubs
+        super()._init_options()  # type: ignore[misc]
+        self.json_kwargs["cls"] = StructuredFractionJSONEncoder if self.structured_fractions else FractionJSONEncoder
+
+    def _value_from_field(self, obj: Any, field: Any) -> Any:
+        if isinstance(field, BaseFractionField):
+            value = field.value_from_object(obj)
+            if value is None:
+                return None
+            if not isinstance(value, _Fraction):
+                value = field.to_fraction(value)
+            return fraction_to_json(value, self.structured_fractions)
+        return super()._value_from_field(obj, field)  # type: ignore[misc]
+
+
+def _decode_fraction_fields(objects: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Turns the ``{"numerator": n, "denominator": d}`` values of fraction fields in objects into
+    :class:`fractions.Fraction`.  Values of other fields, such as a ``JSONField``, are left as they are.
+    """
+    models_by_label: Dict[str, Optional[Type[models.Model]]] = {}
+    for obj in objects:
+        label = obj.get("model") if isinstance(obj, dict) else None
+        fields = obj.get("fields") if isinstance(obj, dict) else None
+        if isinstance(label, str) and isinstance(fields, dict):
+            if label not in models_by_label:
+                try:
+                    models_by_label[label] = apps.get_model(label)
+                except (LookupError, ValueError):
+                    # reported by the python deserializer
+                    models_by_label[label] = None
+            model = models_by_label[label]
+            for name, value in fields.items():
+                if model is None or not isinstance(value, dict):
+                    continue
+                try:
+                    field = model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    continue
+                if isinstance(field, BaseFractionField):
+                    fields[name] = fraction_from_json(value)
+        yield obj
+
+
+def Deserializer(stream_or_string, **options):
+    """
+    Deserialize JSON written by :class:`Serializer` or Django's own JSON serializer.
+    """
+    if not isinstance(stream_or_string, (bytes, str)):
+        stream_or_string = stream_or_string.read()
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    try:
+        objects = json.loads(stream_or_string)
+        yield from PythonDeserializer(_decode_fraction_fields(objects), **options)
+    except (GeneratorExit, DeserializationError):
+        raise
+    except Exception as exc:
+        raise DeserializationError() from exc
@@ -0,0 +1,230 @@
+/*
+ * Browser side parsing for djfractions.widgets.FractionInput.
+ *
+ * parseQuantity() follows the same grammar as djfractions.quantity_to_fraction(), so
+ * "1 1/2", "1-1/2", "1 and 1/2", "3/2", "1.5" and "15e-1" are all 3/2.  As input is typed
+ * the hidden input beside each FractionInput is set to "numerator/denominator" and enabled,
+ * and the text input is marked invalid if it cannot be a quantity.
+ *
+ * When the browser cannot be sure of the answer, such as for non ASCII input, spelled out
+ * quantities like "one and a half", or a value beyond the field's limits, the hidden input is
+ * disabled and the server parses the text.  Inputs of fields with localize=True are marked with
+ * data-djfractions-localized and always left to the server, which knows the separators and
+ * conjunctions of the active language.
+ */
+(function (window, document) {
+  "use strict";
+
+  var WHOLE_FRACTION_SPACES = /\b(\d+)\s+\/\s+(\d+)\b/g;
+  var NUMBER = /^([-+])?(?=\d|\.\d)(\d+(?:_\d+)*)?(?:\.(\d+(?:_\d+)*)?)?(?:[eE]([-+]?\d+(?:_\d+)*))?$/;
+  var SIMPLE_FRACTION = /^(-?\d+)\/(\d+)$/;
+  var MIXED_NUMBER = /^-?(\d+)(?:\s+|\s*-?\s*|\s+and\s+)(\d+)\/(\d+)/;
+  // python treats more of these as whitespace than javascript does, leave them to the server
+  var UNSURE = /[^\x20-\x7e\t\n\r\f\v]/;
+  // spelled out quantities are only read on the server
+  var LETTERS = /[a-z]/i;
+  var DIGITS = /\d[\d_]*/g;
+  var DENOMINATOR = /\/\s*(\d+)/g;
+  var EXPONENT = /[\d.][eE][-+]?(\d[\d_]*)/g;
+  // the largest exponent worked out here when a field has no max_exponent
+  var MAX_EXPONENT = 1000;
+
+  var INVALID = { error: "invalid" };
+
+  function big(value) {
+    return window.BigInt(value);
+  }
+
+  function gcd(a, b) {
+    if (a < big(0)) {
+      a = -a;
+    }
+    while (b > big(0)) {
+      var remainder = a % b;
+      a = b;
+      b = remainder;
+    }
+    return a;
+  }
+
+  function fraction(numerator, denominator) {
+    if (denominator === big(0)) {
+      return INVALID;
+    }
+    var divisor = gcd(numerator, denominator);
+    return { numerator: numerator / divisor, denominator: denominator / divisor };
+  }
+
+  function limitError(text, limits) {
+    var match, digits;
+    if (limits.maxLength !== null && text.length > Number(limits.maxLength)) {
+      return true;
+    }
+    if (limits.maxDigits !== null) {
+      DIGITS.lastIndex = 0;
+      while ((match = DIGITS.exec(text)) !== null) {
+        if (match[0].length > Number(limits.maxDigits)) {
+          return true;
+        }
+      }
+    }
+    if (limits.maxDenominator !== null) {
+      DENOMINATOR.lastIndex = 0;
+      while ((match = DENOMINATOR.exec(text)) !== null) {
+        digits = match[1].replace(/^0+/, "");
+        // compare lengths first so that a long denominator is never turned into a BigInt
+        var maxDenominator = String(limits.maxDenominator);
+        if (digits.length > maxDenominator.length || big(digits || "0") > big(maxDenominator)) {
+          return true;
+        }
+      }
+    }
+    if (limits.maxExponent !== null) {
+      EXPONENT.lastIndex = 0;
+      while ((match = EXPONENT.exec(text)) !== null) {
+        digits = match[1].replace(/_/g, "").replace(/^0+/, "");
+        var maxExponent = String(limits.maxExponent);
+        if (digits.length > maxExponent.length || Number(digits || "0") > Number(maxExponent)) {
+          return true;
+        }
+      }
+    }
+    return false;
+  }
+
+  function parseNumber(match) {
+    var sign = match[1] === "-" ? big(-1) : big(1);
+    var whole = (match[2] || "").replace(/_/g, "");
+    var decimals = (match[3] || "").replace(/_/g, "");
+    var exponent = Number((match[4] || "0").replace(/_/g, "")) - decimals.length;
+    if (Math.abs(exponent) > MAX_EXPONENT) {
+      return null;
+    }
+    var numerator = big(whole + decimals || "0") * sign;
+    var power = big(10) ** big(Math.abs(exponent));
+    if (exponent >= 0) {
+      return fraction(numerator * power, big(1));
+    }
+    return fraction(numerator, power);
+  }
+
+  /*
+   * Returns {numerator, denominator} as BigInts, {error: "empty"}, {error: "invalid"}, or null
+   * when the server should decide.  limits has maxLength, maxDigits, maxDenominator, and
+   * maxExponent, each a number, a string of digits, or null.
+   */
+  function parseQuantity(text, limits) {
+    var match, result;
+    if (typeof window.BigInt !== "function") {
+      return null;
+    }
+    limits = limits || { maxLength: null, maxDigits: null, maxDenominator: null, maxExponent: null };
+    if (UNSURE.test(text) || limitError(text, limits)) {
+      return null;
+    }
+    text = text.trim().replace(WHOLE_FRACTION_SPACES, "$1/$2");
+    if (!text) {
+      return { error: "empty" };
+    }
+
+    match = NUMBER.exec(text);
+    if (match) {
+      result = parseNumber(match);
+    } else if ((match = SIMPLE_FRACTION.exec(text))) {
+      result = fraction(big(match[1]), big(match[2]));
+    } else if ((match = MIXED_NUMBER.exec(text))) {
+      // like the server, anything after the fraction of a mixed number is ignored
+      if (big(match[3]) === big(0)) {
+        return INVALID;
+      }
+      result = fraction(big(match[1]) * big(match[3]) + big(match[2]), big(match[3]));
+      if (text.charAt(0) === "-") {
+        result.numerator = -result.numerator;
+      }
+    } else if (LETTERS.test(text)) {
+      return null;
+    } else {
+      return INVALID;
+    }
+
+    // the canonical value is checked against the limits on the server too
+    if (result && result.numerator !== undefined && limitError(canonical(result), limits)) {
+      return null;
+    }
+    return result;
+  }
+
+  function canonical(result) {
+    return result.numerator.toString() + "/" + result.denominator.toString();
+  }
+
+  function limitAttribute(input, name) {
+    var value = input.getAttribute("data-djfractions-" + name);
+    return value === null || value === "" ? null : value;
+  }
+
+  function canonicalInput(input) {
+    var name = input.getAttribute("data-djfractions-input");
+    var sibling = input.nextElementSibling;
+    if (sibling && sibling.name === name) {
+      return sibling;
+    }
+    return input.form ? input.form.elements.namedItem(name) : null;
+  }
+
+  function update(input) {
+    var hidden = canonicalInput(input);
+    var result = null;
+    if (!input.hasAttribute("data-djfractions-localized")) {
+      result = parseQuantity(input.value, {
+        maxLength: limitAttribute(input, "max-length"),
+        maxDigits: limitAttribute(input, "max-digits"),
+        maxDenominator: limitAttribute(input, "max-denominator"),
+        maxExponent: limitAttribute(input, "max-exponent"),
+      });
+    }
+    var valid = result !== null && result.error === undefined;
+
+    if (hidden) {
+      hidden.value = valid ? canonical(result) : "";
+      hidden.disabled = !valid;
+    }
+    if (result !== null && result.error === "invalid") {
+      input.setCustomValidity(input.getAttribute("data-djfractions-invalid-message") || "Enter a fraction");
+    } else {
+      input.setCustomValidity("");
+    }
+  }
+
+  function initFractionInputs(root) {
+    var inputs = (root || document).querySelectorAll("input[data-djfractions-input]");
+    for (var i = 0; i < inputs.length; i++) {
+      update(inputs[i]);
+    }
+  }
+
+  function onInput(event) {
+    var target = event.target;
+    if (target && target.hasAttribute && target.hasAttribute("data-djfractions-input")) {
+      update(target);
+    }
+  }
+
+  window.djfractions = window.djfractions || {};
+  window.djfractions.parseQuantity = parseQuantity;
+  window.djfractions.initFractionInputs = initFractionInputs;
+
+  if (typeof window.BigInt !== "function" || !document) {
+    // without BigInt the hidden inputs stay disabled and the server parses everything
+    return;
+  }
+  // listening on the document also covers formset rows added after the page loads
+  document.addEventListener("input", onInput);
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", function () {
+      initFractionInputs(document);
+    });
+  } else {
+    initFractionInputs(document);
+  }
+})(typeof window !== "undefined" ? window : globalThis, typeof document !== "undefined" ? document : null);
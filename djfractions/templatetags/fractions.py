@@ -1,8 +1,9 @@
 import fractions
 from decimal import InvalidOperation
-from typing import Any
+from typing import Any, Dict, Iterable, List, Optional
 
 from django import template
+from django.utils.safestring import SafeString, mark_safe
 
 # The try/accept is not working with mypy so for now just always use this.
 from typing_extensions import TypedDict
@@ -34,6 +35,8 @@ def display_fraction(
     limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
     allow_mixed_numbers: bool = True,
     coerce_thirds: bool = True,
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
 ) -> FractionDisplayData:
     """
     Display a numeric value as an html fraction using
@@ -47,11 +50,15 @@ def display_fraction(
     :param bool coerce_thirds:  If True then .3 repeating is forced to 1/3
         rather than 3/10, 33/100, etc. and .66 and .67 are forced to 2/3.
         Defaults to True.
+    :param float rel_tol: Use the fraction with the smallest denominator within this tolerance
+        relative to value, such as 0.005 for within 0.5%, rather than limit_denominator.
+    :param float abs_tol: Use the fraction with the smallest denominator within this absolute
+        tolerance of value rather than limit_denominator.
     """
 
     try:
         whole_number, numerator, denominator = get_fraction_parts(
-            value, allow_mixed_numbers, limit_denominator, coerce_thirds
+            value, allow_mixed_numbers, limit_denominator, coerce_thirds, rel_tol, abs_tol
         )
     except (ValueError, InvalidOperation) as e:
         # Could just return early here since it is known that there is no unicode entity for 0/0
@@ -74,7 +81,11 @@ def display_fraction(
 
 @register.inclusion_tag("djfractions/display_fraction.html", name="display_improper_fraction")
 def display_improper_fraction(
-    value: Any, limit_denominator: int = DEFAULT_MAX_DENOMINATOR, coerce_thirds: bool = True
+    value: Any,
+    limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+    coerce_thirds: bool = True,
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
 ) -> FractionDisplayData:
     """
     Display a numeric value as an html fraction using
@@ -88,7 +99,81 @@ def display_improper_fraction(
     :param bool coerce_thirds:  If True then .3 repeating is forced to 1/3
         rather than 3/10, 33/100, etc. and .66 and .67 are forced to 2/3.
         Defaults to True.
+    :param float rel_tol: Use the fraction with the smallest denominator within this tolerance
+        relative to value rather than limit_denominator.
+    :param float abs_tol: Use the fraction with the smallest denominator within this absolute
+        tolerance of value rather than limit_denominator.
     """
     return display_fraction(
-        value, limit_denominator=limit_denominator, allow_mixed_numbers=False, coerce_thirds=coerce_thirds
+        value,
+        limit_denominator=limit_denominator,
+        allow_mixed_numbers=False,
+        coerce_thirds=coerce_thirds,
+        rel_tol=rel_tol,
+        abs_tol=abs_tol,
     )
+
+
+@register.simple_tag(takes_context=True, name="display_fractions")
+def display_fractions(
+    context: template.Context,
+    values: Iterable[Any],
+    field: Optional[str] = None,
+    limit_denominator: int = DEFAULT_MAX_DENOMINATOR,
+    allow_mixed_numbers: bool = True,
+    coerce_thirds: bool = True,
+    rel_tol: Optional[float] = None,
+    abs_tol: Optional[float] = None,
+) -> List[SafeString]:
+    """
+    Render each of values the same way as :func:`display_fraction` and return the list of html strings,
+    so that a column of many values does not need a tag call for each one::
+
+        {% display_fractions ingredients "quantity" as quantities %}
+        {% for quantity in quantities %}<td>{{ quantity }}</td>{% endfor %}
+
+    The template is looked up once, and each distinct value is only rendered once.
+
+    :param values: The values to display, or objects to get field from.
+    :param str field: If given, display this attribute of each of values.  For a
+        :class:`django.db.models.QuerySet` only this field is loaded, with ``values_list()``.
+    :param int limit_denominator: Limit the denominator to this value.  Defaults to 1000000,
+        which is the same as :meth:`fractions.Fraction.limit_denominator()` default max_denominator
+    :param bool allow_mixed_numbers: Convert to mixed numbers such as 1 1/2 or keep improper
+        fractions such as 3/2.  Defaults to True.
+    :param bool coerce_thirds:  If True then .3 repeating is forced to 1/3
+        rather than 3/10, 33/100, etc. and .66 and .67 are forced to 2/3.
+        Defaults to True.
+    :param float rel_tol: Use the fraction with the smallest denominator within this tolerance
+        relative to value rather than limit_denominator.
+    :param float abs_tol: Use the fraction with the smallest denominator within this absolute
+        tolerance of value rather than limit_denominator.
+    """
+    if field:
+        if hasattr(values, "values_list"):
+            values = values.values_list(field, flat=True)
+        else:
+            values = [getattr(value, field) for value in values]
+
+    # the context of a template being rendered always has its template set
+    engine = context.template.engine if context.template is not None else template.Engine.get_default()
+    display_template = engine.get_template("djfractions/display_fraction.html")
+    rendered: Dict[Any, SafeString] = {}
+    results = []
+    for value in values:
+        try:
+            html = rendered.get(value)
+        except TypeError:
+            # unhashable values are rendered every time
+            html = None
+        if html is None:
+            display_data = display_fraction(
+                value, limit_denominator, allow_mixed_numbers, coerce_thirds, rel_tol, abs_tol
+            )
+            html = mark_safe(display_template.render(context.new(dict(display_data))))
+            try:
+                rendered[value] = html
+            except TypeError:
+                pass
+        results.append(html)
+    return results
@@ -0,0 +1,220 @@
+"""
+Parsing quantities together with their unit, such as ``1 1/2 cups`` or ``3/4 lb``.
+
+A :class:`UnitRegistry` holds unit names and their aliases and compiles them, as a trie, into one
+regular expression with the quantity, so each line is parsed in a single match::
+
+    from djfractions.units import unit_registry
+
+    unit_registry.parse("1 1/2 cups flour")
+    # UnitQuantity(value=Fraction(3, 2), unit='cup', end=11)
+
+    unit_registry.add("stick", ["sticks"])
+"""
+
+import fractions
+import re
+import threading
+from typing import Dict, Iterable, Match, NamedTuple, Optional, Pattern
+
+import djfractions
+from djfractions import (
+    _QUANTITY_PATTERN,
+    _UNICODE_FRACTION_CHARACTERS,
+    ParseLimits,
+    _find_limit_error,
+    _quantity_span_value,
+    check_quantity,
+)
+from djfractions.exceptions import InvalidFractionString
+
+__all__ = [
+    "UnitQuantity",
+    "UnitRegistry",
+    "DEFAULT_UNITS",
+    "unit_registry",
+]
+
+# Unit names and their aliases.  Plurals of the names are added by UnitRegistry.
+DEFAULT_UNITS: Dict[str, Iterable[str]] = {
+    "teaspoon": ["tsp", "tsps", "tspn"],
+    "tablespoon": ["tbsp", "tbsps", "tbs", "tbl", "tblsp"],
+    "cup": [],
+    "fluid ounce": ["fl oz", "fl. oz", "floz"],
+    "ounce": ["oz"],
+    "pound": ["lb", "lbs"],
+    "gram": ["g", "gr", "grs", "gramme", "grammes"],
+    "kilogram": ["kg", "kgs", "kilo", "kilos"],
+    "milligram": ["mg"],
+    "liter": ["l", "litre", "litres"],
+    "milliliter": ["ml", "millilitre", "millilitres"],
+    "pint": ["pt", "pts"],
+    "quart": ["qt", "qts"],
+    "gallon": ["gal", "gals"],
+    "pinch": [],
+    "dash": [],
+    "clove": [],
+    "can": [],
+    "package": ["pkg", "pkgs"],
+    "slice": [],
+}
+
+
+class UnitQuantity(NamedTuple):
+    """
+    A quantity and unit parsed by :meth:`UnitRegistry.parse`.
+
+    :ivar value: The :class:`fractions.Fraction`
+    :ivar str unit: The name of the unit, or None if the quantity has no unit
+    :ivar int end: The index in the parsed text after the quantity, unit, and the whitespace following them,
+        where the rest of the line, such as the ingredient, starts.
+    """
+
+    value: fractions.Fraction
+    unit: Optional[str]
+    end: int
+
+
+def _plural(name: str) -> str:
+    if name.endswith(("s", "x", "z", "ch", "sh")):
+        return name + "es"
+    return name + "s"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Returns a regular expression matching any of words, built from a trie of them so that words with
+    a common prefix, such as ``tbsp`` and ``tbsps``, share one branch rather than each being tried in turn.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: Dict[str, dict]) -> str:
+    branches = [re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    pattern = "(?:%s)" % "|".join(branches)
+    # a word may end here, longer words are tried first
+    return pattern + "?" if "" in node else pattern
+
+
+class UnitRegistry:
+    """
+    Unit names with their aliases, compiled into one regular expression with the quantity pattern.
+    Units are matched ignoring case, must not run into a following word, and may end with a period,
+    as in ``oz.``.
+
+    :param units: A dict of unit name to its aliases.  Defaults to :data:`DEFAULT_UNITS`.
+    :param bool plurals: If True, the plural of each unit name is added as an alias.  Defaults to True.
+    """
+
+    def __init__(self, units: Optional[Dict[str, Iterable[str]]] = None, plurals: bool = True):
+        self.plurals = plurals
+        self._aliases: Dict[str, str] = {}
+        self._pattern: Optional[Pattern] = None
+        self._lock = threading.Lock()
+        for name, aliases in (DEFAULT_UNITS if units is None else units).items():
+            self.add(name, aliases)
+
+    def add(self, name: str, aliases: Iterable[str] = ()) -> None:
+        """
+        Add a unit, or more aliases for a unit which has already been added.
+
+        :param str name: The name of the unit, which :meth:`parse` returns
+        :param aliases: Other names and abbreviations of the unit
+        """
+        names = [name] + list(aliases)
+        if self.plurals:
+            names.append(_plural(name))
+        with self._lock:
+            for alias in names:
+                self._aliases[alias.lower()] = name
+            self._pattern = None
+
+    @property
+    def units(self) -> Dict[str, str]:
+        """
+        A dict of each alias, in lower case, to its unit name.
+        """
+        return dict(self._aliases)
+
+    @property
+    def pattern(self) -> Pattern:
+        """
+        The compiled regular expression for a quantity with an optional unit at the start of a string.
+        Group 1 is the quantity and the last group is the unit.
+        """
+        pattern = self._pattern
+        if pattern is None:
+            with self._lock:
+                self._pattern = pattern = re.compile(
+                    r"[ \t]*("
+                    + _QUANTITY_PATTERN
+                    + r")(?![\d/\u2044%s]|[.,]\d)[ \t]*(?:(?i:(%s))(?!\w)\.?[ \t]*)?"
+                    % (_UNICODE_FRACTION_CHARACTERS, _trie_pattern(self._aliases)),
+                    re.VERBOSE,
+                )
+        return pattern
+
+    def try_parse(self, text: str, limits: Optional[ParseLimits] = None) -> Optional[UnitQuantity]:
+        """
+        Returns the :class:`UnitQuantity` at the start of text, or None if text does not start with a quantity
+        or the quantity is beyond the limits, without raising an exception.
+
+        :param str text: The text to parse, such as ``1 1/2 cups flour``
+        :param limits: The :class:`djfractions.ParseLimits` the quantity must be within.
+            Defaults to :data:`djfractions.parse_limits`.
+        """
+        match = self.pattern.match(text)
+        if match is None:
+            return None
+        return self._unit_quantity(match, limits)
+
+    def parse(self, text: str, limits: Optional[ParseLimits] = None) -> UnitQuantity:
+        """
+        Returns the :class:`UnitQuantity` at the start of text.  The unit is None if the quantity is not
+        followed by a known unit, as in ``2 eggs``.
+
+        Raises :class:`djfractions.exceptions.InvalidFractionString` if text does not start with a quantity,
+        or :class:`djfractions.exceptions.ParseLimitExceeded` if the quantity is beyond the limits.
+
+        :param str text: The text to parse, such as ``1 1/2 cups flour``
+        :param limits: The :class:`djfractions.ParseLimits` the quantity must be within.
+            Defaults to :data:`djfractions.parse_limits`.
+        """
+        match = self.pattern.match(text)
+        if match is not None:
+            result = self._unit_quantity(match, limits)
+            if result is not None:
+                return result
+            # raises ParseLimitExceeded if that is why there was no result
+            check_quantity(match.group(1), limits)
+        raise InvalidFractionString("%s does not start with a quantity" % text)
+
+    def _unit_quantity(self, match: Match, limits: Optional[ParseLimits]) -> Optional[UnitQuantity]:
+        if limits is None:
+            limits = djfractions.parse_limits
+        quantity = match.group(1)
+        # a quantity within max_digits can not have a number longer than it
+        if (limits.max_length is not None and len(quantity) > limits.max_length) or (
+            limits.max_digits is not None and len(quantity) > limits.max_digits and _find_limit_error(quantity, limits)
+        ):
+            return None
+        groups = match.groups()
+        value = _quantity_span_value(groups[1:10], limits.max_denominator)
+        if value is None:
+            return None
+        unit = groups[10]
+        return UnitQuantity(value, None if unit is None else self._aliases[unit.lower()], match.end())
+
+
+# The registry of DEFAULT_UNITS.  Add units to it with unit_registry.add().
+unit_registry = UnitRegistry()
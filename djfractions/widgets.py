@@ -0,0 +1,49 @@
+from typing import Any, Dict, Optional
+
+from django import forms
+
+
+class FractionInput(forms.TextInput):
+    """
+    A text input for :class:`djfractions.forms.FractionField` which parses what is typed in the
+    browser with the ``js/djfractions.js`` static file, using the same grammar as
+    :func:`djfractions.quantity_to_fraction`.  Input which cannot be parsed is marked invalid
+    as it is typed, and valid input is copied as ``numerator/denominator`` into a hidden input
+    which is submitted in its place, so the field can skip the full parse.
+
+    The hidden input is rendered empty and disabled, and only filled in and enabled by the script,
+    so without it the text is submitted and parsed on the server as usual.
+
+    The browser does not know the separators and conjunctions of the active language, so for a
+    field with ``localize=True`` the script neither parses nor marks the input, and the server
+    parses the text.
+
+    :ivar str canonical_suffix: Appended to the field name for the name of the hidden input.
+    :ivar bool submit_canonical: Whether the hidden input is rendered and submitted in place of the text.
+        :class:`djfractions.forms.DecimalFractionField` turns it off, since a canonical value such as
+        ``1/10`` can not be cleaned back to the exact decimal that was typed.
+    """
+
+    template_name = "djfractions/widgets/fraction_input.html"
+    canonical_suffix = "_canonical"
+    submit_canonical = True
+
+    class Media:
+        js = ["js/djfractions.js"]
+
+    def get_context(self, name: str, value: Any, attrs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"]["data-djfractions-input"] = name + self.canonical_suffix
+        context["widget"]["canonical_name"] = name + self.canonical_suffix if self.submit_canonical else None
+        if self.is_localized:
+            context["widget"]["attrs"]["data-djfractions-localized"] = True
+        return context
+
+    def value_from_datadict(self, data: Any, files: Any, name: str) -> Any:
+        canonical = data.get(name + self.canonical_suffix) if self.submit_canonical and not self.is_localized else None
+        if canonical:
+            return canonical
+        return super().value_from_datadict(data, files, name)
+
+    def value_omitted_from_data(self, data: Any, files: Any, name: str) -> bool:
+        return name not in data and name + self.canonical_suffix not in data
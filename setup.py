@@ -22,6 +22,10 @@ setup(
     ],
     include_package_data=True,
     install_requires=[],
+    extras_require={
+        "pandas": ["pandas"],
+        "debug_toolbar": ["django-debug-toolbar"],
+    },
     test_suite="runtests.run_tests",
     license="BSD",
     zip_safe=False,
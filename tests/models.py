@@ -1,6 +1,6 @@
 from django.db import models
 
-from djfractions.models import DecimalFractionField
+from djfractions.models import DecimalFractionField, FloatBackedFractionField
 
 
 class TestModel(models.Model):
@@ -39,3 +39,50 @@ class BadTestModel(models.Model):
 
     missing_max_digits = DecimalFractionField(decimal_places=5)
     missing_decimal_places = DecimalFractionField(max_digits=5)
+
+
+class FractionToIntegersModel(models.Model):
+    """
+    A model for testing djfractions.operations.ConvertFractionToIntegers
+    """
+
+    value = DecimalFractionField(max_digits=15, decimal_places=10, null=True)
+    numerator = models.BigIntegerField(null=True)
+    denominator = models.BigIntegerField(null=True)
+
+
+class WideFractionToIntegersModel(models.Model):
+    """
+    A model for testing djfractions.operations.ConvertFractionToIntegers with fields of up to 18 digits
+    """
+
+    value = DecimalFractionField(max_digits=18, decimal_places=17, null=True)
+    numerator = models.BigIntegerField(null=True)
+    denominator = models.BigIntegerField(null=True)
+
+
+class FloatBackedTestModel(models.Model):
+    """
+    A model for testing djfractions.models.FloatBackedFractionField
+    """
+
+    value = FloatBackedFractionField(null=True)
+    denominator_limited_to_ten = FloatBackedFractionField(limit_denominator=10, null=True)
+
+
+class IntegerFractionModel(models.Model):
+    """
+    A fraction stored as the integer pair ConvertFractionToIntegers leaves once the decimal field is removed,
+    for testing that djfractions.serializers does not decode it as a Fraction.
+    """
+
+    numerator = models.BigIntegerField()
+    denominator = models.BigIntegerField()
+
+
+class JSONDataModel(models.Model):
+    """
+    A model for testing that djfractions.serializers leaves JSONField content alone.
+    """
+
+    data = models.JSONField(null=True)
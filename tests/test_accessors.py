@@ -0,0 +1,76 @@
+import fractions
+import unittest
+
+from django.test import TestCase
+
+from djfractions import format_fraction, get_fraction_parts, quantity_to_fraction
+
+try:
+    import pandas as pd
+
+    import djfractions.accessors  # noqa: F401
+except ImportError:
+    pd = None
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class FractionAccessorTest(TestCase):
+    """
+    Test the pandas ``Series.frac`` accessor against the scalar functions it vectorizes
+    """
+
+    values = ["1", "1 1/4", "1-1/4", "-1 and 1/4", ".25", "1.25", "10/4", "0.333", "2 2/3", "1e3"]
+
+    def test_parse(self):
+        result = pd.Series(self.values).frac.parse()
+        for value, (numerator, denominator) in zip(self.values, result.itertuples(index=False)):
+            self.assertEqual(quantity_to_fraction(value), fractions.Fraction(numerator, denominator))
+
+    def test_parse_invalid_values(self):
+        result = pd.Series(["abcd", "1 1 1/3", "1/0", None]).frac.parse()
+        self.assertTrue(result["numerator"].isna().all())
+        self.assertTrue(result["denominator"].isna().all())
+
+    def test_parse_invalid_values_raise(self):
+        with self.assertRaises(Exception):
+            pd.Series(["1/2", "abcd"]).frac.parse(errors="raise")
+
+    def test_to_decimal(self):
+        result = pd.Series(["1 1/2", "1/4", None]).frac.to_decimal()
+        self.assertEqual([1.5, 0.25], result.iloc[:2].tolist())
+        self.assertTrue(pd.isna(result.iloc[2]))
+
+    def test_limit_denominator(self):
+        result = pd.Series([1 / 3.0, 0.1428, "7/12"]).frac.limit_denominator(10)
+        self.assertEqual([1, 1, 4], result["numerator"].tolist())
+        self.assertEqual([3, 7, 7], result["denominator"].tolist())
+
+    def test_parts_match_get_fraction_parts(self):
+        values = [0.5, 1.5, 4.0, 1 / 3.0, 5 / 3.0, 0.3, 2.6, 44.325, 0.0, -1.5]
+        series = pd.Series(values)
+        for limit_denominator in (None, 3, 16, 1000000):
+            for allow_mixed_numbers in (True, False):
+                result = series.frac.parts(allow_mixed_numbers, limit_denominator)
+                for value, row in zip(values, result.itertuples(index=False)):
+                    self.assertEqual(
+                        get_fraction_parts(value, allow_mixed_numbers, limit_denominator),
+                        tuple(int(part) for part in row),
+                    )
+
+    def test_format(self):
+        values = ["1 1/2", "0", "4", "3/16", ".25", "2/3"]
+        series = pd.Series(values + [None])
+        for style in ("mixed", "improper", "html", "unicode"):
+            result = series.frac.format(style, limit_denominator=16)
+            expected = [format_fraction(quantity_to_fraction(value), style, 16) for value in values]
+            self.assertEqual(expected, result.iloc[:-1].tolist())
+            self.assertTrue(pd.isna(result.iloc[-1]))
+
+    def test_format_invalid_style(self):
+        with self.assertRaises(ValueError):
+            pd.Series(["1/2"]).frac.format("roman")
+
+    def test_index_is_preserved(self):
+        series = pd.Series(["1/2", "1/2", "3/4"], index=["a", "b", "c"])
+        self.assertEqual(["a", "b", "c"], series.frac.parse().index.tolist())
+        self.assertEqual(["a", "b", "c"], series.frac.format().index.tolist())
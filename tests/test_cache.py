@@ -0,0 +1,82 @@
+import threading
+from decimal import Decimal
+
+from django.test import TestCase
+
+from djfractions import fraction_parts_cache, get_fraction_parts
+from djfractions.cache import ShardedCache
+
+
+class ShardedCacheTest(TestCase):
+    def test_get_and_set(self):
+        cache = ShardedCache(maxsize=64)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual("default", cache.get("b", "default"))
+
+    def test_get_or_set(self):
+        cache = ShardedCache(maxsize=64)
+        self.assertEqual(2, cache.get_or_set("a", lambda: 2))
+        self.assertEqual(2, cache.get_or_set("a", lambda: 3))
+
+    def test_size_is_bounded(self):
+        cache = ShardedCache(maxsize=32, shards=4)
+        for i in range(1000):
+            cache.set(i, i)
+        self.assertLessEqual(len(cache), 32)
+        # the newest entries survive
+        self.assertEqual(999, cache.get(999))
+
+    def test_stats(self):
+        cache = ShardedCache(maxsize=64)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        stats = cache.stats()
+        self.assertEqual((1, 1, 1, 64), (stats.hits, stats.misses, stats.size, stats.maxsize))
+        self.assertEqual(0.5, stats.hit_rate)
+
+        cache.clear()
+        self.assertEqual((0, 0, 0), cache.stats()[:3])
+
+    def test_concurrent_writes(self):
+        cache = ShardedCache(maxsize=128, shards=8)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    cache.set(offset + i, i)
+                    cache.get(offset + i // 2)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 10000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(cache), 128)
+
+
+class FractionPartsCacheTest(TestCase):
+    def test_cached_results_match(self):
+        fraction_parts_cache.clear()
+        first = get_fraction_parts(Decimal("1.5"))
+        second = get_fraction_parts(Decimal("1.5"))
+        self.assertEqual((1, 1, 2), first)
+        self.assertEqual(first, second)
+        self.assertEqual(1, fraction_parts_cache.stats().hits)
+
+    def test_arguments_are_part_of_the_key(self):
+        self.assertEqual((1, 1, 2), get_fraction_parts(1.5))
+        self.assertEqual((0, 3, 2), get_fraction_parts(1.5, allow_mixed_numbers=False))
+
+    def test_invalid_values_still_raise(self):
+        with self.assertRaises(ValueError):
+            get_fraction_parts("abcd")
+        with self.assertRaises(ValueError):
+            get_fraction_parts("abcd")
@@ -0,0 +1,91 @@
+import copyreg
+import fractions
+import pickle
+from decimal import Decimal
+
+from django.test import TestCase
+
+from djfractions.codec import (
+    FractionCacheSerializer,
+    decode_fraction,
+    decode_fractions,
+    encode_fraction,
+    encode_fractions,
+    register_pickle_reducer,
+)
+
+VALUES = [
+    fractions.Fraction(0),
+    fractions.Fraction(1, 2),
+    fractions.Fraction(-3, 4),
+    fractions.Fraction(7),
+    fractions.Fraction(-64, 63),
+    fractions.Fraction(2**70 + 1, 3**50),
+    fractions.Fraction(-(2**100), 7),
+]
+
+
+class CodecTest(TestCase):
+    def test_round_trip(self):
+        for value in VALUES:
+            decoded = decode_fraction(encode_fraction(value))
+            self.assertEqual(value, decoded)
+            self.assertIs(fractions.Fraction, type(decoded))
+        self.assertEqual(VALUES, decode_fractions(encode_fractions(VALUES)))
+        self.assertEqual([], decode_fractions(encode_fractions([])))
+
+    def test_size(self):
+        self.assertEqual(3, len(encode_fraction(fractions.Fraction(1, 2))))
+        self.assertEqual(3, len(encode_fraction(fractions.Fraction(-63, 64))))
+        values = [fractions.Fraction(i, 16) for i in range(1000)]
+        self.assertLess(len(encode_fractions(values)) * 3, len(pickle.dumps(values, pickle.HIGHEST_PROTOCOL)))
+
+    def test_invalid(self):
+        for data in (b"", b"\x02\x00", b"\x01\x01", b"\x01\x01\x00", b"\x01\x81"):
+            with self.assertRaises(ValueError):
+                decode_fraction(data)
+        for data in (b"", b"\x01\x01\x02", b"\x02\x02\x01\x02", b"\x02\x01\x01\x00"):
+            with self.assertRaises(ValueError):
+                decode_fractions(data)
+
+    def test_register_pickle_reducer(self):
+        value = fractions.Fraction(3, 4)
+        self.addCleanup(copyreg.dispatch_table.pop, fractions.Fraction, None)
+        default = pickle.dumps(value)
+        register_pickle_reducer()
+        reduced = pickle.dumps(value)
+        self.assertNotIn(b"3/4", reduced)
+        self.assertNotIn(b"djfractions", reduced)
+        self.assertEqual(value, pickle.loads(reduced))
+        self.assertEqual(value, pickle.loads(default))
+
+
+class FractionCacheSerializerTest(TestCase):
+    def setUp(self):
+        self.serializer = FractionCacheSerializer()
+
+    def test_fractions(self):
+        value = fractions.Fraction(5, 8)
+        self.assertEqual(encode_fraction(value), self.serializer.dumps(value))
+        self.assertEqual(value, self.serializer.loads(self.serializer.dumps(value)))
+        self.assertEqual(VALUES, self.serializer.loads(self.serializer.dumps(VALUES)))
+
+    def test_integers(self):
+        self.assertEqual(5, self.serializer.dumps(5))
+        # redis returns integers as bytes
+        self.assertEqual(5, self.serializer.loads(b"5"))
+        self.assertIs(True, self.serializer.loads(self.serializer.dumps(True)))
+
+    def test_other_values(self):
+        value = {"quantity": fractions.Fraction(1, 3), "amounts": [fractions.Fraction(1, 2), Decimal("1.5")]}
+        data = self.serializer.dumps(value)
+        self.assertNotIn(b"1/3", data)
+        self.assertNotIn(b"djfractions", data)
+        self.assertEqual(value, self.serializer.loads(data))
+        self.assertEqual([], self.serializer.loads(self.serializer.dumps([])))
+        # the reducer is only used by the serializer
+        self.assertNotIn(fractions.Fraction, copyreg.dispatch_table)
+
+    def test_default_pickle_loads(self):
+        value = [fractions.Fraction(1, 3), "text"]
+        self.assertEqual(value, self.serializer.loads(pickle.dumps(value)))
@@ -0,0 +1,146 @@
+import fractions
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from djfractions.management.utils import get_fraction_fields, raw_values
+
+from .models import BadTestModel, TestModel
+
+
+class GetFractionFieldsTest(TestCase):
+    def test_all_fields(self):
+        fields = get_fraction_fields()
+        self.assertIn((TestModel, TestModel._meta.get_field("defaults")), fields)
+        self.assertIn((BadTestModel, BadTestModel._meta.get_field("missing_max_digits")), fields)
+
+    def test_labels(self):
+        self.assertEqual(4, len(get_fraction_fields(["tests.TestModel"])))
+        self.assertEqual(
+            [(TestModel, TestModel._meta.get_field("defaults"))], get_fraction_fields(["tests.TestModel.defaults"])
+        )
+
+    def test_bad_labels(self):
+        for label in ("nope", "tests.Nope", "tests.TestModel.id", "tests.TestModel.defaults.x"):
+            with self.assertRaises(CommandError):
+                get_fraction_fields([label])
+
+
+class FractionProfileCommandTest(TestCase):
+    def setUp(self):
+        for value in ("1/2", "1/3", "9/4", "3/16", "5"):
+            TestModel.objects.create(
+                defaults=fractions.Fraction(value),
+                denominator_limited_to_ten=fractions.Fraction(value),
+            )
+
+    def test_profile(self):
+        out, err = StringIO(), StringIO()
+        call_command("fraction_profile", "tests", sample=3, stdout=out, stderr=err)
+        output = out.getvalue()
+        self.assertIn("tests.TestModel.defaults (3 rows)", output)
+        self.assertIn("tests.TestModel.coerce_thirds_true (0 rows)", output)
+        for stage in ("from_db_value", "get_fraction_parts", "FractionField.prepare_value", "display_fraction"):
+            self.assertIn(stage, output)
+        self.assertIn("values/sec", output)
+        self.assertIn("cache hit rate", output)
+        self.assertIn("denominators:", output)
+        self.assertIn("function calls", output)
+        self.assertIn("Skipping tests.BadTestModel.missing_max_digits", err.getvalue())
+
+    def test_no_cprofile(self):
+        out = StringIO()
+        call_command("fraction_profile", "tests.TestModel.defaults", no_cprofile=True, stdout=out)
+        self.assertIn("tests.TestModel.defaults (5 rows)", out.getvalue())
+        self.assertNotIn("tests.TestModel.coerce_thirds_true", out.getvalue())
+        self.assertNotIn("function calls", out.getvalue())
+
+
+class ExportFractionsCommandTest(TestCase):
+    def setUp(self):
+        for value in ("1/2", "9/4", "5"):
+            TestModel.objects.create(defaults=fractions.Fraction(value))
+
+    def test_export(self):
+        out = StringIO()
+        call_command("export_fractions", "tests.TestModel", fields="defaults", chunk_size=2, stdout=out)
+        self.assertEqual("defaults\r\n1/2\r\n2 1/4\r\n5\r\n", out.getvalue())
+
+        out = StringIO()
+        call_command("export_fractions", "tests.TestModel", "--fields=id,defaults", "--tsv", "--no-header", stdout=out)
+        pks = TestModel.objects.order_by("pk").values_list("pk", flat=True)
+        self.assertEqual(["%d\t%s" % row for row in zip(pks, ["1/2", "2 1/4", "5"])], out.getvalue().splitlines())
+
+    def test_bad_options(self):
+        for args in (
+            ["nope"],
+            ["tests.Nope"],
+            ["tests.TestModel", "--fields=nope"],
+            ["tests.TestModel", "--chunk-size=0"],
+        ):
+            with self.assertRaises(CommandError):
+                call_command("export_fractions", *args, stdout=StringIO())
+
+
+class RenormalizeFractionsCommandTest(TestCase):
+    def setUp(self):
+        # written without limiting the denominator, as if limit_denominator=10 were added later
+        self.objs = [TestModel.objects.create(defaults=1) for i in range(5)]
+        values = [fractions.Fraction(1, 2), fractions.Fraction(13, 16), fractions.Fraction(1, 16), None, 0.3333]
+        for obj, value in zip(self.objs, values):
+            TestModel.objects.filter(pk=obj.pk).update(denominator_limited_to_ten=value)
+
+    def stored(self):
+        return list(TestModel.objects.order_by("pk").values_list("denominator_limited_to_ten", flat=True))
+
+    def test_renormalize(self):
+        out = StringIO()
+        call_command("renormalize_fractions", "tests.TestModel.denominator_limited_to_ten", chunk_size=2, stdout=out)
+        self.assertEqual(
+            [
+                fractions.Fraction(1, 2),
+                fractions.Fraction(4, 5),
+                fractions.Fraction(1, 10),
+                None,
+                fractions.Fraction(1, 3),
+            ],
+            self.stored(),
+        )
+        output = out.getvalue()
+        self.assertIn("2 rows scanned, 1 changed", output)
+        self.assertIn("checkpoint: %s" % self.objs[1].pk, output)
+        self.assertIn("Updated 3 of 4 rows", output)
+
+        # nothing left to change
+        out = StringIO()
+        call_command("renormalize_fractions", "tests.TestModel.denominator_limited_to_ten", stdout=out)
+        self.assertIn("Updated 0 of 4 rows", out.getvalue())
+
+    def test_dry_run(self):
+        before = list(TestModel.objects.order_by("pk").values_list("denominator_limited_to_ten", flat=True))
+        out = StringIO()
+        call_command("renormalize_fractions", "tests.TestModel.denominator_limited_to_ten", dry_run=True, stdout=out)
+        self.assertIn("Would update 3 of 4 rows", out.getvalue())
+        self.assertEqual(before, self.stored())
+
+    def test_resume_after(self):
+        out = StringIO()
+        call_command(
+            "renormalize_fractions",
+            "tests.TestModel.denominator_limited_to_ten",
+            resume_after=self.objs[1].pk,
+            stdout=out,
+        )
+        self.assertIn("Updated 2 of 2 rows", out.getvalue())
+        field = TestModel._meta.get_field("denominator_limited_to_ten")
+        raw = dict(raw_values(TestModel.objects.all(), field))
+        self.assertEqual(Decimal("0.8125"), raw[self.objs[1].pk])
+        self.assertEqual(Decimal("0.1"), raw[self.objs[2].pk])
+
+    def test_bad_labels(self):
+        for label in ("tests.TestModel", "tests.BadTestModel.missing_max_digits"):
+            with self.assertRaises(CommandError):
+                call_command("renormalize_fractions", label, stdout=StringIO())
@@ -5,9 +5,26 @@ from django.core.exceptions import ValidationError
 from django.template import Context, Template
 from django.test import TestCase
 
-from djfractions import get_fraction_unicode_entity, quantity_to_decimal, quantity_to_fraction
+from djfractions import (
+    ParseLimits,
+    approximate_fraction,
+    format_fraction,
+    fraction_mean,
+    fraction_pool,
+    fraction_sum,
+    get_fraction_unicode_entity,
+    intern_fraction,
+    iter_quantities,
+    quantity_to_decimal,
+    quantity_to_fraction,
+    try_parse_quantities,
+    try_parse_quantity,
+)
+from djfractions.exceptions import InvalidFractionString, ParseLimitExceeded
 from djfractions.forms import DecimalFractionField, FractionField
 
+from .models import TestModel
+
 
 class QuantityToDecimalTest(TestCase):
     """
@@ -42,6 +59,11 @@ class QuantityToDecimalTest(TestCase):
         self.assertEqual(Decimal("-1.25"), quantity_to_decimal("-1 and 1/4"))
         self.assertEqual(Decimal("-1.25"), quantity_to_decimal("-1-1/4"))
 
+    def test_words(self):
+        self.assertEqual(Decimal(325), quantity_to_decimal("three hundred twenty five"))
+        self.assertEqual(Decimal("1.5"), quantity_to_decimal("one and a half"))
+        self.assertEqual(Decimal(".67"), quantity_to_decimal("two thirds").quantize(Decimal("0.00")))
+
 
 class QuantityToFractionTest(TestCase):
     def test_single_integer(self):
@@ -68,6 +90,184 @@ class QuantityToFractionTest(TestCase):
         self.assertEqual(fractions.Fraction(-5, 4), quantity_to_fraction("-1 - 1/4"))
         self.assertEqual(fractions.Fraction(-5, 4), quantity_to_fraction("-1 and 1/4"))
 
+    def test_unicode(self):
+        for quantity, value in (
+            ("\u00bd", fractions.Fraction(1, 2)),
+            ("\u215e", fractions.Fraction(7, 8)),
+            ("1\u00bd", fractions.Fraction(3, 2)),
+            ("2 \u00be", fractions.Fraction(11, 4)),
+            ("1-\u215b", fractions.Fraction(9, 8)),
+            ("-1 and \u00bc", fractions.Fraction(-5, 4)),
+            ("\u2189", 0),
+            ("3\u20444", fractions.Fraction(3, 4)),
+            ("1 5\u204416", fractions.Fraction(21, 16)),
+        ):
+            self.assertEqual(value, quantity_to_fraction(quantity), quantity)
+            self.assertEqual(value, quantity_to_decimal(quantity), quantity)
+
+        for quantity in ("\u00bd\u00bd", "1 1 \u00bd", "\u00bd 1"):
+            with self.assertRaises(InvalidFractionString):
+                quantity_to_fraction(quantity)
+        with self.assertRaises(ParseLimitExceeded):
+            quantity_to_fraction("1\u20444", limits=ParseLimits(max_denominator=3))
+
+    def test_words(self):
+        for quantity, value in (
+            ("one hundred", 100),
+            ("three hundred twenty-five", 325),
+            ("one hundred and five", 105),
+            ("two million five thousand", 2005000),
+            ("a hundred", 100),
+            ("one and a half", fractions.Fraction(3, 2)),
+            ("Three Quarters", fractions.Fraction(3, 4)),
+            ("two thirds", fractions.Fraction(2, 3)),
+            ("a half", fractions.Fraction(1, 2)),
+            ("half", fractions.Fraction(1, 2)),
+            ("two and three-quarters", fractions.Fraction(11, 4)),
+            ("1 and a half", fractions.Fraction(3, 2)),
+            ("3 eighths", fractions.Fraction(3, 8)),
+            ("-one and a quarter", fractions.Fraction(-5, 4)),
+        ):
+            self.assertEqual(value, quantity_to_fraction(quantity), quantity)
+
+        for quantity in (
+            "five twenty",
+            "one two",
+            "five and six",
+            "one thousand two million",
+            "one hundred hundred",
+            "and a half",
+            "one and",
+            "a",
+            "one half and a quarter",
+            "one and a half cups",
+        ):
+            with self.assertRaises(InvalidFractionString):
+                quantity_to_fraction(quantity)
+            self.assertEqual("invalid", try_parse_quantity(quantity).error)
+
+    def test_parse_limits(self):
+        for quantity, code in (
+            ("1/" + "9" * 100000, "max_length"),
+            ("1/" + "9" * 40, "max_digits"),
+            ("1." + "1" * 31, "max_digits"),
+            ("1 1/1000000000001", "max_denominator"),
+            ("1/ 0000009999999999999", "max_denominator"),
+            ("1e999999999", "max_exponent"),
+            ("1.5E-1_000", "max_exponent"),
+            ("1_" * 20 + "1", "max_digits"),
+        ):
+            with self.assertRaises(ParseLimitExceeded) as cm:
+                quantity_to_fraction(quantity)
+            self.assertEqual(code, cm.exception.code)
+            # existing code catching InvalidFractionString keeps working
+            self.assertIsInstance(cm.exception, InvalidFractionString)
+            with self.assertRaises(ParseLimitExceeded):
+                quantity_to_decimal(quantity)
+
+        self.assertEqual(fractions.Fraction(1, 10**12), quantity_to_fraction("1/1000000000000"))
+        self.assertEqual(fractions.Fraction(1, 3), quantity_to_fraction("0001/003"))
+        self.assertEqual(fractions.Fraction(15, 10**6), quantity_to_fraction("1.5e-5"))
+        unlimited = ParseLimits(max_length=None, max_digits=None, max_denominator=None, max_exponent=None)
+        self.assertEqual(fractions.Fraction(1, 10**40), quantity_to_fraction("1/1" + "0" * 40, limits=unlimited))
+        with self.assertRaises(ParseLimitExceeded):
+            quantity_to_fraction("1/4", limits=ParseLimits(max_denominator=3))
+
+
+class TryParseQuantityTest(TestCase):
+    def test_matches_quantity_to_fraction(self):
+        for quantity in (
+            "1",
+            "-1.5",
+            "1_000",
+            ".5e2",
+            "1/2",
+            "1 / 2",
+            "-3/4",
+            "1 1/2",
+            "1-1/2",
+            "-1 and 1/2",
+            "1 1/2 cups",
+            "  2  ",
+            "one and a half",
+            "1\u00bd",
+            "1\u20442",
+        ):
+            result = try_parse_quantity(quantity)
+            self.assertTrue(result.ok, quantity)
+            self.assertEqual(quantity_to_fraction(quantity), result.value)
+            self.assertEqual(-1, result.position)
+
+    def test_errors(self):
+        for quantity, error, position in (
+            (None, "empty", 0),
+            ("  ", "empty", 0),
+            ("abc", "invalid", 0),
+            ("12abc", "invalid", 2),
+            ("1/2x", "invalid", 3),
+            ("1 1 1/4", "invalid", 0),
+            ("inf", "invalid", 0),
+            ("1/0", "zero_denominator", 2),
+            ("1 1/0", "zero_denominator", 4),
+            ("1/" + "9" * 40, "max_digits", 2),
+            ("1 1/1000000000001", "max_denominator", 4),
+            ("1e999", "max_exponent", 2),
+        ):
+            result = try_parse_quantity(quantity)
+            self.assertFalse(result.ok)
+            self.assertIsNone(result.value)
+            self.assertEqual((error, position), (result.error, result.position), quantity)
+            if quantity and quantity.strip():
+                with self.assertRaises((InvalidFractionString, ValueError, ZeroDivisionError)):
+                    quantity_to_fraction(quantity)
+
+    def test_numbers(self):
+        self.assertEqual(fractions.Fraction(1, 2), try_parse_quantity(0.5).value)
+        self.assertEqual(fractions.Fraction(1, 4), try_parse_quantity(Decimal("0.25")).value)
+        self.assertEqual(3, try_parse_quantity(3).value)
+        self.assertEqual("invalid", try_parse_quantity(float("nan")).error)
+        self.assertEqual("invalid", try_parse_quantity(Decimal("Infinity")).error)
+
+    def test_try_parse_quantities(self):
+        results = try_parse_quantities(["1/2", "x", "", "1 1/4"], limits=ParseLimits(max_denominator=2))
+        self.assertEqual(
+            [(fractions.Fraction(1, 2), None), (None, "invalid"), (None, "empty"), (None, "max_denominator")],
+            [(result.value, result.error) for result in results],
+        )
+
+
+class IterQuantitiesTest(TestCase):
+    def test_iter_quantities(self):
+        text = "Add 1 1/2 cups flour, then 3/4 tsp salt, 2-1/4 oz butter and 1 and 1/3 cup milk.\nBake 20 min."
+        self.assertEqual(
+            [
+                ("1 1/2", fractions.Fraction(3, 2)),
+                ("3/4", fractions.Fraction(3, 4)),
+                ("2-1/4", fractions.Fraction(9, 4)),
+                ("1 and 1/3", fractions.Fraction(4, 3)),
+                ("20", 20),
+            ],
+            [(text[start:end], value) for start, end, value in iter_quantities(text)],
+        )
+
+    def test_boundaries(self):
+        for text, expected in (
+            ("Serves 4\n1/2 cup", [4, fractions.Fraction(1, 2)]),
+            ("3-4 cups", [3, 4]),
+            ("-5 degrees, .25 tsp, 0.5 oz", [-5, fractions.Fraction(1, 4), fractions.Fraction(1, 2)]),
+            ("1 / 8 tsp", [fractions.Fraction(1, 8)]),
+            ("on 1/2/2024 with v1.2.3, 1,000 grams, 1/0, x2, 2x, 1e5", []),
+            ("1/" + "9" * 40, []),
+            ("1\u00bd cups, 2 \u00be tsp, 3\u20444 oz, \u215b tsp", [1.5, 2.75, 0.75, 0.125]),
+            ("a\u00bd, \u00bdb", []),
+        ):
+            self.assertEqual(expected, [value for start, end, value in iter_quantities(text)], text)
+
+    def test_lazy(self):
+        quantities = iter_quantities("1/2 " * 1000)
+        self.assertEqual((0, 3, fractions.Fraction(1, 2)), next(quantities))
+        self.assertEqual((4, 7, fractions.Fraction(1, 2)), next(quantities))
+
 
 class DisplayFractionTagTest(TestCase):
     """
@@ -114,6 +314,15 @@ class DisplayFractionTagTest(TestCase):
         rendered = self.all_params_template.render(c)
         self.assertEqual(rendered.strip(), "<sup>1</sup>&frasl;<sub>3</sub>")
 
+    def test_tolerance(self):
+        template = Template("{% load fractions %}{% display_fraction frac rel_tol=0.005 coerce_thirds=False %}")
+        rendered = template.render(Context({"frac": Decimal("2.333")}))
+        self.assertEqual(rendered.strip(), "2 <sup>1</sup>&frasl;<sub>3</sub>")
+
+        template = Template("{% load fractions %}{% display_improper_fraction frac abs_tol=0.01 %}")
+        rendered = template.render(Context({"frac": 1.127}))
+        self.assertEqual(rendered.strip(), "<sup>9</sup>&frasl;<sub>8</sub>")
+
     def test_allow_mixed_numbers_with_improper_fraction(self):
         c = Context({"frac": 1.5, "limit_denominator": None, "mixed_numbers": True, "coerce_thirds": True})
         rendered = self.all_params_template.render(c)
@@ -213,6 +422,45 @@ class DisplayImproperFractionTagTest(TestCase):
         self.assertEqual(rendered.strip(), "<sup>1</sup>&frasl;<sub>2</sub>")
 
 
+class DisplayFractionsTagTest(TestCase):
+    """
+    Test the display_fractions template tag
+    """
+
+    VALUES = [1, 0.5, Decimal("1.5"), fractions.Fraction(7, 3), 0, "1/4", 0.5, 1.5, -2.25]
+
+    def test_same_as_display_fraction(self):
+        single = Template("{% load fractions %}{% display_fraction frac %}")
+        expected = [single.render(Context({"frac": value})) for value in self.VALUES]
+
+        template = Template(
+            "{% load fractions %}{% display_fractions values as rendered %}{% for r in rendered %}{{ r }}|{% endfor %}"
+        )
+        rendered = template.render(Context({"values": self.VALUES}))
+        self.assertEqual("".join(html + "|" for html in expected), rendered)
+
+    def test_params(self):
+        template = Template(
+            "{% load fractions %}"
+            "{% display_fractions values allow_mixed_numbers=False limit_denominator=3 as rendered %}"
+            "{{ rendered|join:',' }}"
+        )
+        rendered = template.render(Context({"values": [1.5, 0.3]}))
+        self.assertEqual(" <sup>3</sup>&frasl;<sub>2</sub>\n, <sup>1</sup>&frasl;<sub>3</sub>\n", rendered)
+
+    def test_field(self):
+        TestModel.objects.create(defaults=fractions.Fraction(1, 2))
+        TestModel.objects.create(defaults=fractions.Fraction(3, 2))
+        template = Template(
+            "{% load fractions %}{% display_fractions values \"defaults\" as rendered %}{{ rendered|join:',' }}"
+        )
+        expected = " <sup>1</sup>&frasl;<sub>2</sub>\n,1 <sup>1</sup>&frasl;<sub>2</sub>\n"
+        queryset = TestModel.objects.order_by("pk")
+        with self.assertNumQueries(1):
+            self.assertEqual(expected, template.render(Context({"values": queryset})))
+        self.assertEqual(expected, template.render(Context({"values": list(queryset)})))
+
+
 class DecimalFractionFieldTest(TestCase):
     def test_prepare_value_int(self):
         """
@@ -261,6 +509,11 @@ class DecimalFractionFieldTest(TestCase):
         result = field.prepare_value(Decimal(1 / 3.0))
         self.assertEqual("1/3", result)
 
+    def test_prepare_value_tolerance(self):
+        field = DecimalFractionField(rel_tol=0.001, coerce_thirds=False)
+        self.assertEqual("3 1/7", field.prepare_value(Decimal("3.1428")))
+        self.assertEqual("-5/8", field.prepare_value(Decimal("-0.6251")))
+
     def test_prepare_value_coerce_thirds(self):
         """
         Test that when coerce_thirds is specified, then .66, .67, and .33, etc.
@@ -358,6 +611,10 @@ class DecimalFractionFieldTest(TestCase):
         result = field.to_python(value)
         self.assertEqual(Decimal(3 / 2.0).quantize(Decimal("0.000")), result.quantize(Decimal("0.000")))
 
+    def test_to_python_words(self):
+        field = DecimalFractionField()
+        self.assertEqual(Decimal("1.5"), field.to_python("one and a half"))
+
     def test_to_python_method_validation_errors(self):
         """
         Exceptions here are tested for and raised from within to_python()
@@ -673,6 +930,16 @@ class FractionFieldTest(TestCase):
         result = field.to_python(value)
         self.assertEqual(fractions.Fraction("3/2"), result)
 
+    def test_to_python_words(self):
+        field = FractionField()
+        self.assertEqual(fractions.Fraction(3, 4), field.to_python("three quarters"))
+
+    def test_to_python_unicode(self):
+        field = FractionField()
+        self.assertEqual(fractions.Fraction(3, 2), field.to_python("1\u00bd"))
+        self.assertEqual(fractions.Fraction(5, 16), field.to_python("5\u204416"))
+        self.assertEqual(Decimal("2.75"), DecimalFractionField().to_python("2 \u00be"))
+
     def test_to_python_validation_errors(self):
         field = FractionField()
         with self.assertRaises(ValidationError):
@@ -684,6 +951,36 @@ class FractionFieldTest(TestCase):
         with self.assertRaises(ValidationError):
             field.to_python("1 1")
 
+    def test_to_python_parse_limits(self):
+        field = FractionField()
+        with self.assertRaises(ValidationError) as cm:
+            field.to_python("1/" + "9" * 100000)
+        self.assertEqual("parse_max_length", cm.exception.code)
+        self.assertEqual(["Ensure this value has at most 100 characters."], cm.exception.messages)
+
+        field = FractionField(parse_limits=ParseLimits(max_denominator=16))
+        self.assertEqual(fractions.Fraction(3, 16), field.to_python("3/16"))
+        with self.assertRaises(ValidationError) as cm:
+            field.to_python("1 1/32")
+        self.assertEqual(["Ensure that the denominator is no larger than 16."], cm.exception.messages)
+
+        field = DecimalFractionField(parse_limits=ParseLimits(max_digits=5))
+        with self.assertRaises(ValidationError) as cm:
+            field.to_python("1.123456")
+        self.assertEqual("parse_max_digits", cm.exception.code)
+        self.assertEqual(["Ensure that no number in this value has more than 5 digits."], cm.exception.messages)
+
+        with self.assertRaises(ValidationError) as cm:
+            DecimalFractionField().clean("1." + "1" * 40)
+        self.assertEqual(["Ensure that no number in this value has more than 30 digits."], cm.exception.messages)
+
+    def test_to_python_tolerance(self):
+        field = FractionField(rel_tol=0.005)
+        self.assertEqual(fractions.Fraction(7, 16), field.to_python("0.4376"))
+        self.assertEqual("7/16", field.prepare_value(0.4376))
+        field = FractionField(abs_tol=fractions.Fraction(1, 100), limit_denominator=1000)
+        self.assertEqual(fractions.Fraction(1, 3), field.to_python("0.33"))
+
     def test_max_value_set(self):
         field = FractionField(max_value=fractions.Fraction("999/1000"))
         with self.assertRaises(ValidationError):
@@ -693,3 +990,106 @@ class FractionFieldTest(TestCase):
         field = FractionField(min_value=1)
         with self.assertRaises(ValidationError):
             field.run_validators(fractions.Fraction(999, 1000))
+
+
+class FormatFractionTest(TestCase):
+    def test_mixed(self):
+        self.assertEqual("1 1/2", format_fraction(1.5))
+        self.assertEqual("1/4", format_fraction(Decimal(".25")))
+        self.assertEqual("4", format_fraction(4))
+        self.assertEqual("0", format_fraction(0))
+
+    def test_improper(self):
+        self.assertEqual("3/2", format_fraction(1.5, "improper"))
+        self.assertEqual("4/1", format_fraction(4, "improper"))
+
+    def test_html_matches_display_fraction(self):
+        template = Template("{% load fractions %}{% display_fraction frac %}")
+        for value in (1.5, 0.5, 4, 0):
+            self.assertEqual(template.render(Context({"frac": value})).strip(), format_fraction(value, "html"))
+
+    def test_unicode(self):
+        self.assertEqual("1½", format_fraction(1.5, "unicode"))
+        self.assertEqual("⅞", format_fraction(fractions.Fraction(7, 8), "unicode"))
+        self.assertEqual("2 3⁄16", format_fraction(fractions.Fraction(35, 16), "unicode"))
+
+    def test_limit_denominator_and_coerce_thirds(self):
+        self.assertEqual("1/3", format_fraction(1 / 3.0))
+        self.assertEqual("1 2/3", format_fraction(5 / 3.0, limit_denominator=10))
+
+    def test_invalid_style(self):
+        with self.assertRaises(ValueError):
+            format_fraction(1, "roman")
+
+
+class FractionSumTest(TestCase):
+    values = [fractions.Fraction(1, 3), fractions.Fraction(3, 4), fractions.Fraction(5, 6), fractions.Fraction(-1, 8)]
+
+    def test_fraction_sum(self):
+        self.assertEqual(sum(self.values), fraction_sum(self.values))
+        self.assertEqual(sum(self.values), fraction_sum(iter(self.values)))
+        self.assertEqual(fractions.Fraction(0), fraction_sum([]))
+
+    def test_mixed_types(self):
+        self.assertEqual(
+            fractions.Fraction(23, 4),
+            fraction_sum([fractions.Fraction(1, 4), Decimal("0.5"), 0.25, 2, "1 1/2", "5/4"]),
+        )
+
+    def test_fraction_mean(self):
+        self.assertEqual(sum(self.values) / len(self.values), fraction_mean(self.values))
+        self.assertEqual(fractions.Fraction(3, 8), fraction_mean(["1/2", "1/4"]))
+        with self.assertRaises(ValueError):
+            fraction_mean([])
+
+
+class InternFractionTest(TestCase):
+    def setUp(self):
+        fraction_pool.clear()
+
+    def test_intern_fraction(self):
+        first = intern_fraction(fractions.Fraction(1, 2))
+        self.assertIs(first, intern_fraction(fractions.Fraction(2, 4)))
+        self.assertIsNot(first, intern_fraction(fractions.Fraction(1, 3)))
+        stats = fraction_pool.stats()
+        self.assertEqual((1, 2, 2), (stats.hits, stats.misses, stats.size))
+
+    def test_quantity_to_fraction(self):
+        self.assertIs(quantity_to_fraction("1/2", intern=True), quantity_to_fraction(".5", intern=True))
+        self.assertIsNot(quantity_to_fraction("1/2"), quantity_to_fraction("1/2"))
+
+    def test_pool_is_bounded(self):
+        for numerator in range(fraction_pool.maxsize * 2):
+            intern_fraction(fractions.Fraction(numerator, 7))
+        self.assertLessEqual(len(fraction_pool), fraction_pool.maxsize)
+
+
+class ApproximateFractionTest(TestCase):
+    def test_relative_tolerance(self):
+        self.assertEqual(fractions.Fraction(1, 3), approximate_fraction(Decimal("0.333"), rel_tol=0.005))
+        self.assertEqual(fractions.Fraction(303, 910), approximate_fraction(Decimal("0.333"), rel_tol=0.0001))
+        self.assertEqual(fractions.Fraction(22, 7), approximate_fraction(3.14159, rel_tol=0.001))
+        self.assertEqual(fractions.Fraction(-17, 8), approximate_fraction("-2.125", rel_tol=0.001))
+
+    def test_absolute_tolerance(self):
+        self.assertEqual(fractions.Fraction(1, 2), approximate_fraction(0.505, abs_tol=0.01))
+        self.assertEqual(fractions.Fraction(0), approximate_fraction(0.004, abs_tol=0.01))
+        self.assertEqual(fractions.Fraction(3), approximate_fraction(2.95, abs_tol=0.1))
+        # the larger of the two is used
+        self.assertEqual(fractions.Fraction(1, 2), approximate_fraction(0.505, rel_tol=0.0001, abs_tol=0.01))
+
+    def test_no_tolerance(self):
+        self.assertEqual(fractions.Fraction(333, 1000), approximate_fraction(Decimal("0.333")))
+        with self.assertRaises(ValueError):
+            approximate_fraction(1, rel_tol=-0.1)
+
+    def test_smallest_denominator(self):
+        for numerator in range(-200, 200, 7):
+            for denominator in range(1, 200, 13):
+                value = fractions.Fraction(numerator, denominator)
+                result = approximate_fraction(value, abs_tol=0.01)
+                self.assertLessEqual(abs(result - value), 0.01)
+                # no fraction with a smaller denominator is close enough
+                for smaller in range(1, result.denominator):
+                    nearest = fractions.Fraction(round(value * smaller), smaller)
+                    self.assertGreater(abs(nearest - value), 0.01)
@@ -0,0 +1,57 @@
+import csv
+import fractions
+import io
+
+from django.test import TestCase
+
+from djfractions import export
+from djfractions.export import iter_csv, iter_rows, write_csv
+
+from .models import TestModel
+
+
+class ExportTest(TestCase):
+    def setUp(self):
+        for value in ("1/2", "3/2", "1/3", "5"):
+            TestModel.objects.create(defaults=fractions.Fraction(value), denominator_limited_to_ten=None)
+        self.queryset = TestModel.objects.order_by("pk")
+
+    def test_iter_rows(self):
+        rows = list(iter_rows(self.queryset, ["defaults", "denominator_limited_to_ten"]))
+        self.assertEqual([["1/2", None], ["1 1/2", None], ["1/3", None], ["5", None]], rows)
+
+        rows = iter_rows(self.queryset, ["defaults"], style="improper")
+        self.assertEqual(["1/2", "3/2", "1/3", "5/1"], [row[0] for row in rows])
+        rows = iter_rows(self.queryset, ["defaults"], style="unicode")
+        self.assertEqual(["½", "1½", "⅓", "5"], [row[0] for row in rows])
+
+        with self.assertRaises(ValueError):
+            list(iter_rows(self.queryset, style="fancy"))
+
+    def test_iter_csv(self):
+        chunks = list(iter_csv(self.queryset, ["id", "defaults"], chunk_size=2))
+        self.assertEqual(3, len(chunks))
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+        self.assertEqual(["id", "defaults"], rows[0])
+        self.assertEqual(["1/2", "1 1/2", "1/3", "5"], [row[1] for row in rows[1:]])
+
+        lines = "".join(iter_csv(self.queryset, ["defaults"], dialect="excel-tab", header=False)).splitlines()
+        self.assertEqual(["1/2", "1 1/2", "1/3", "5"], lines)
+
+        # every field by default
+        header = next(iter_csv(self.queryset)).splitlines()[0]
+        self.assertEqual("id,defaults,denominator_limited_to_ten,coerce_thirds_true,decimal_places_limited", header)
+
+    def test_write_csv(self):
+        output = io.StringIO()
+        write_csv(output, self.queryset.filter(defaults__gt=1), ["defaults"], style="unicode")
+        self.assertEqual("defaults\r\n1½\r\n5\r\n", output.getvalue())
+
+    def test_format_cache(self):
+        original = export.FORMAT_CACHE_SIZE
+        export.FORMAT_CACHE_SIZE = 2
+        try:
+            rows = list(iter_rows(self.queryset, ["defaults"]))
+        finally:
+            export.FORMAT_CACHE_SIZE = original
+        self.assertEqual([["1/2"], ["1 1/2"], ["1/3"], ["5"]], rows)
@@ -0,0 +1,61 @@
+import fractions
+
+from django.template import Context, Template
+from django.test import TestCase
+
+from djfractions import fraction_parts_cache, instrumentation
+from djfractions.forms import DecimalFractionField, FractionField
+from djfractions.models import DecimalFractionField as DecimalFractionModelField
+
+from .models import TestModel
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        instrumentation.install()
+        self.addCleanup(instrumentation.uninstall)
+        TestModel.objects.create(defaults=fractions.Fraction(1, 2))
+
+    def test_collect(self):
+        fraction_parts_cache.clear()
+        template = Template("{% load fractions %}{% display_fraction value %}{% display_improper_fraction value %}")
+        with instrumentation.collect() as collector:
+            obj = TestModel.objects.get()
+            FractionField().clean("1 1/2")
+            DecimalFractionField().clean("1/4")
+            FractionField().prepare_value(obj.defaults)
+            template.render(Context({"value": obj.defaults}))
+
+        # one for each of the four fields on TestModel
+        self.assertEqual(4, collector.stats["DecimalFractionField.from_db_value"].count)
+        self.assertEqual(1, collector.stats["FractionField.to_python"].count)
+        self.assertEqual(1, collector.stats["DecimalFractionField.to_python (form)"].count)
+        self.assertEqual(1, collector.stats["FractionField.prepare_value"].count)
+        self.assertEqual(2, collector.stats["display_fraction"].count)
+        self.assertEqual(9, collector.count)
+        self.assertGreater(collector.total_time, 0)
+        self.assertEqual(
+            [repr("1 1/2")], [value for elapsed, value in collector.stats["FractionField.to_python"].slowest]
+        )
+        self.assertEqual(3, collector.cache_hits + collector.cache_misses)
+
+    def test_slowest(self):
+        stats = instrumentation.ConversionStats(keep=2)
+        for elapsed, value in ((0.1, "a"), (0.3, "b"), (0.2, "c"), (0.05, "d")):
+            stats.add(value, elapsed)
+        self.assertEqual([(0.3, "'b'"), (0.2, "'c'")], stats.slowest)
+        self.assertEqual(4, stats.count)
+
+    def test_not_collecting(self):
+        with instrumentation.collect() as collector:
+            pass
+        TestModel.objects.get()
+        self.assertEqual({}, collector.stats)
+
+    def test_uninstall(self):
+        instrumentation.install()
+        wrapped = DecimalFractionModelField.__dict__["from_db_value"]
+        instrumentation.uninstall()
+        self.assertIsNot(wrapped, DecimalFractionModelField.__dict__["from_db_value"])
+        self.assertEqual("from_db_value", DecimalFractionModelField.from_db_value.__name__)
+        self.assertFalse(hasattr(DecimalFractionModelField.from_db_value, "__wrapped__"))
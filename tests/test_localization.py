@@ -0,0 +1,73 @@
+import fractions
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from djfractions.forms import DecimalFractionField, FractionField
+from djfractions.localization import (
+    QuantityGrammar,
+    get_quantity_grammar,
+    localized_quantity_to_decimal,
+    localized_quantity_to_fraction,
+    normalize_quantity,
+)
+
+
+class QuantityGrammarTest(TestCase):
+    def test_normalize(self):
+        grammar = QuantityGrammar(decimal_separator=",", thousand_separator=".", conjunctions=["et"])
+        self.assertEqual("1.5", grammar.normalize("1,5"))
+        self.assertEqual("1234.5", grammar.normalize("1.234,5"))
+        self.assertEqual("1 and 1/2", grammar.normalize("1 et 1/2"))
+        self.assertEqual("1 and 1/2", grammar.normalize("1 and 1/2"))
+
+    def test_grouping_does_not_break_mixed_numbers(self):
+        grammar = QuantityGrammar(decimal_separator=",", thousand_separator="\xa0")
+        self.assertEqual("1250", grammar.normalize("1\xa0250"))
+        self.assertEqual("1 250/1000", grammar.normalize("1 250/1000"))
+
+    def test_grammar_is_cached(self):
+        self.assertIs(get_quantity_grammar("fr"), get_quantity_grammar("fr"))
+        self.assertIsNot(get_quantity_grammar("fr"), get_quantity_grammar("en"))
+
+
+class LocalizedQuantityTest(TestCase):
+    def test_active_language(self):
+        with translation.override("fr"):
+            self.assertEqual(fractions.Fraction(3, 2), localized_quantity_to_fraction("1,5"))
+            self.assertEqual(fractions.Fraction(3, 2), localized_quantity_to_fraction("1 et 1/2"))
+            self.assertEqual(Decimal("1.25"), localized_quantity_to_decimal("1 et 1/4"))
+
+        with translation.override("en"):
+            self.assertEqual(fractions.Fraction(3, 2), localized_quantity_to_fraction("1 and 1/2"))
+            self.assertEqual("1,5", normalize_quantity("1,5"))
+
+    def test_language_code(self):
+        self.assertEqual(fractions.Fraction(9, 4), localized_quantity_to_fraction("2 und 1/4", "de"))
+        self.assertEqual(Decimal("0.25"), localized_quantity_to_decimal("0,25", "es"))
+
+    @override_settings(USE_THOUSAND_SEPARATOR=True)
+    def test_thousand_separator(self):
+        self.assertEqual(Decimal("1234.5"), localized_quantity_to_decimal("1.234,5", "de"))
+        self.assertEqual(Decimal("1234.5"), localized_quantity_to_decimal("1,234.5", "en"))
+
+
+class LocalizedFormFieldTest(TestCase):
+    def test_fraction_field(self):
+        field = FractionField(localize=True)
+        with translation.override("fr"):
+            self.assertEqual(fractions.Fraction(3, 2), field.clean("1,5"))
+            self.assertEqual(fractions.Fraction(5, 4), field.clean("1 et 1/4"))
+
+    def test_decimal_fraction_field(self):
+        field = DecimalFractionField(localize=True)
+        with translation.override("fr"):
+            self.assertEqual(Decimal("1.25"), field.clean("1 et 1/4"))
+
+    def test_not_localized(self):
+        field = FractionField()
+        with translation.override("fr"):
+            with self.assertRaises(ValidationError):
+                field.clean("1 et 1/4")
@@ -1,14 +1,18 @@
+import copy
 import decimal
 import fractions
+import pickle
 
+import django
 from django.core import checks
-from django.db import models
+from django.db import connection, models
+from django.db.models import ExpressionWrapper, F, Value
 from django.test import TestCase
 
 import djfractions.forms
-from djfractions.models import DecimalFractionField
+from djfractions.models import DecimalFractionField, FloatBackedFractionField, FractionValue, LazyFraction
 
-from .models import BadTestModel, TestModel
+from .models import BadTestModel, FloatBackedTestModel, TestModel
 
 
 class DecimalFractionFieldTest(TestCase):
@@ -75,3 +79,220 @@ class DecimalFractionFieldTest(TestCase):
             ],
             errors,
         )
+
+    def test_intern(self):
+        """
+        Test that intern=True gives the same instance for equal values and is kept by deconstruct()
+        """
+        dff = DecimalFractionField(name="frac", max_digits=10, decimal_places=5, intern=True)
+        first = dff.from_db_value(decimal.Decimal("0.50000"), None, None)
+        second = dff.from_db_value(decimal.Decimal("0.5"), None, None)
+        self.assertEqual(fractions.Fraction(1, 2), first)
+        self.assertIs(first, second)
+        self.assertTrue(dff.deconstruct()[3]["intern"])
+
+        not_interned = DecimalFractionField(name="frac", max_digits=10, decimal_places=5)
+        self.assertIsNot(
+            not_interned.from_db_value(decimal.Decimal("0.5"), None, None),
+            not_interned.from_db_value(decimal.Decimal("0.5"), None, None),
+        )
+        self.assertNotIn("intern", not_interned.deconstruct()[3])
+
+    def test_db_converters(self):
+        """
+        Test that the converter used on SQLite and PostgreSQL gives the same values as from_db_value()
+        """
+        dff = DecimalFractionField(name="frac", max_digits=10, decimal_places=5)
+        sqlite = type("Connection", (), {"vendor": "sqlite"})()
+        other = type("Connection", (), {"vendor": "other"})()
+        self.assertEqual([dff.from_db_decimal], dff.get_db_converters(sqlite))
+        self.assertEqual([dff.from_db_value], dff.get_db_converters(other))
+
+        class RoundedFractionField(DecimalFractionField):
+            def from_db_value(self, value, expression, connection):
+                return round(super().from_db_value(value, expression, connection))
+
+        rounded = RoundedFractionField(name="rounded", max_digits=10, decimal_places=5)
+        self.assertEqual([rounded.from_db_value], rounded.get_db_converters(sqlite))
+
+        values = [decimal.Decimal(n).scaleb(-5) for n in range(-1000, 200000, 7)]
+        values += [decimal.Decimal("0.33333"), decimal.Decimal("2.66667"), decimal.Decimal("-0.33333")]
+        values += [decimal.Decimal("1E+3"), decimal.Decimal("123456.78901")]
+        strings = [str(value) for value in values] + ["-.5", "1e-5", "7"]
+        for limit_denominator in (None, 3, 2, 16, 100):
+            for coerce_thirds in (True, False):
+                field = DecimalFractionField(
+                    name="frac",
+                    max_digits=10,
+                    decimal_places=5,
+                    limit_denominator=limit_denominator,
+                    coerce_thirds=coerce_thirds,
+                )
+                for value in values + strings:
+                    expected = field.from_db_value(value, None, sqlite)
+                    result = field.from_db_decimal(value, None, sqlite)
+                    self.assertEqual(expected, result, (value, limit_denominator, coerce_thirds))
+                    self.assertIs(fractions.Fraction, type(result))
+        self.assertIsNone(dff.from_db_decimal(None, None, sqlite))
+        with self.assertRaises(ValueError):
+            dff.from_db_decimal(decimal.Decimal("NaN"), None, sqlite)
+
+    def test_lazy(self):
+        """
+        Test that lazy=True loads values which convert the same as from_db_value() when used
+        """
+        dff = DecimalFractionField(name="frac", max_digits=10, decimal_places=5, limit_denominator=16, lazy=True)
+        sqlite = type("Connection", (), {"vendor": "sqlite"})()
+        self.assertEqual([dff.from_db_lazy], dff.get_db_converters(sqlite))
+        self.assertTrue(dff.deconstruct()[3]["lazy"])
+        self.assertIsNone(dff.from_db_lazy(None, None, sqlite))
+
+        value = dff.from_db_lazy(decimal.Decimal("0.33333"), None, sqlite)
+        self.assertIsInstance(value, LazyFraction)
+        self.assertIsInstance(value, fractions.Fraction)
+        self.assertEqual(decimal.Decimal("0.33333"), value.db_value)
+        self.assertEqual(fractions.Fraction(1, 3), value)
+        self.assertEqual(hash(fractions.Fraction(1, 3)), hash(value))
+        self.assertEqual(fractions.Fraction(4, 3), value + 1)
+        self.assertEqual("1/3", str(value))
+        self.assertEqual("Fraction(1, 3)", repr(value))
+        self.assertIs(fractions.Fraction, type(pickle.loads(pickle.dumps(value))))
+        self.assertIs(value, copy.deepcopy(value))
+
+        value = dff.from_db_lazy(decimal.Decimal("0.4"), None, sqlite)
+        self.assertEqual(fractions.Fraction(2, 5).limit_denominator(16), fractions.Fraction(value))
+        self.assertEqual(dff.get_prep_value(fractions.Fraction(2, 5)), dff.get_prep_value(value))
+
+        TestModel.objects.create(defaults=fractions.Fraction(5, 2))
+        field = TestModel._meta.get_field("defaults")
+        field.lazy = True
+        try:
+            loaded = TestModel.objects.get().defaults
+        finally:
+            field.lazy = False
+        self.assertIsInstance(loaded, LazyFraction)
+        self.assertEqual(fractions.Fraction(5, 2), loaded)
+
+
+class FloatBackedFractionFieldTest(TestCase):
+    def test_field(self):
+        values = [fractions.Fraction(1, 3), fractions.Fraction(-7, 16), fractions.Fraction(123457, 1000), 5, None]
+        objs = [FloatBackedTestModel.objects.create(value=value) for value in values]
+        self.assertEqual(values, list(FloatBackedTestModel.objects.order_by("pk").values_list("value", flat=True)))
+        self.assertEqual(objs[0], FloatBackedTestModel.objects.get(value=fractions.Fraction(1, 3)))
+        self.assertEqual(
+            [fractions.Fraction(-7, 16), fractions.Fraction(1, 3)],
+            list(FloatBackedTestModel.objects.filter(value__lt=1).order_by("value").values_list("value", flat=True)),
+        )
+
+        FloatBackedTestModel.objects.filter(pk=objs[0].pk).update(value=F("value") * fractions.Fraction(3, 2))
+        objs[0].refresh_from_db()
+        self.assertEqual(fractions.Fraction(1, 2), objs[0].value)
+
+        field = FloatBackedTestModel._meta.get_field("value")
+        self.assertEqual("FloatField", field.get_internal_type())
+        self.assertEqual(0.75, field.get_prep_value("3/4"))
+        self.assertIsInstance(field.formfield(), djfractions.forms.FractionField)
+        self.assertEqual(1000000, field.deconstruct()[3]["limit_denominator"])
+
+    def test_from_db_value(self):
+        """
+        Test that snapping the float gives the same values as converting it with to_python()
+        """
+        for limit_denominator in (None, 3, 10, 1000000):
+            for coerce_thirds in (True, False):
+                field = FloatBackedFractionField(limit_denominator=limit_denominator, coerce_thirds=coerce_thirds)
+                for numerator in range(-100, 300, 7):
+                    for denominator in (1, 2, 3, 7, 8, 10, 16, 64, 100, 1000):
+                        value = numerator / denominator
+                        expected = field.to_python(value)
+                        if limit_denominator is not None and limit_denominator >= denominator:
+                            expected = field.to_python(fractions.Fraction(numerator, denominator))
+                        result = field.from_db_value(value, None, None)
+                        self.assertEqual(expected, result, (value, limit_denominator, coerce_thirds))
+                        self.assertIs(fractions.Fraction, type(result))
+
+        field = FloatBackedFractionField(limit_denominator=None, coerce_thirds=False)
+        self.assertEqual(fractions.Fraction(0.1), field.from_db_value(0.1, None, None))
+
+        field = FloatBackedFractionField(limit_denominator=10)
+        self.assertEqual(fractions.Fraction(1, 3), field.from_db_value(0.33, None, None))
+        self.assertEqual(fractions.Fraction(2, 7), field.from_db_value(2**0.5 - 1.13, None, None))
+        self.assertIsNone(field.from_db_value(None, None, None))
+        with self.assertRaises(ValueError):
+            field.from_db_value(float("nan"), None, None)
+
+        interned = FloatBackedFractionField(intern=True)
+        self.assertIs(interned.from_db_value(0.25, None, None), interned.from_db_value(0.25, None, None))
+
+
+class FractionValueTest(TestCase):
+    def test_update(self):
+        first = TestModel.objects.create(defaults=fractions.Fraction(1, 2))
+        second = TestModel.objects.create(defaults=fractions.Fraction(5, 4))
+        self.assertEqual(2, TestModel.objects.update(defaults=F("defaults") * fractions.Fraction(3, 2)))
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(fractions.Fraction(3, 4), first.defaults)
+        self.assertEqual(fractions.Fraction(15, 8), second.defaults)
+
+        TestModel.objects.update(
+            defaults=F("defaults") / FractionValue(fractions.Fraction(3, 4)) + fractions.Fraction(1, 8)
+        )
+        first.refresh_from_db()
+        self.assertEqual(fractions.Fraction(9, 8), first.defaults)
+
+        # rounded to the field's decimal_places, then read back with coerce_thirds
+        TestModel.objects.filter(pk=first.pk).update(defaults=F("defaults") * fractions.Fraction(8, 27))
+        first.refresh_from_db()
+        self.assertEqual(fractions.Fraction(1, 3), first.defaults)
+
+    def test_annotate(self):
+        TestModel.objects.create(defaults=fractions.Fraction(1, 2))
+        double = F("defaults") * 2
+        if django.VERSION < (4, 1):
+            # mixed types only resolve to a fraction field from Django 4.1
+            double = ExpressionWrapper(double, output_field=DecimalFractionField())
+        self.assertEqual(
+            [(fractions.Fraction(3, 8), fractions.Fraction(1, 1))],
+            list(
+                TestModel.objects.annotate(
+                    scaled=F("defaults") * FractionValue(fractions.Fraction(3, 4)), double=double
+                ).values_list("scaled", "double")
+            ),
+        )
+
+    def test_beyond_64_bit_integers(self):
+        obj = TestModel.objects.create(defaults=1)
+        TestModel.objects.update(defaults=F("defaults") + fractions.Fraction(2**70, 2**71 + 1))
+        obj.refresh_from_db()
+        self.assertEqual(fractions.Fraction(3, 2), obj.defaults)
+
+        sql, params = FractionValue(fractions.Fraction(1, 2**64)).as_sql(None, None)
+        self.assertEqual("CAST(%s AS NUMERIC)", sql)
+        self.assertEqual(["5.421010862427522170037264004349709E-20"], params)
+        self.assertEqual(
+            ("(CAST(%s AS DECIMAL(65, 30)) / %s)", [3, 2]), FractionValue(fractions.Fraction(3, 2)).as_mysql(None, None)
+        )
+
+        # bulk_update() values are prepared by the field, as before FractionValue
+        obj.defaults = fractions.Fraction(2**70 + 1, 2**70)
+        TestModel.objects.bulk_update([obj], ["defaults"])
+        obj.refresh_from_db()
+        self.assertEqual(1, obj.defaults)
+
+    def test_update_value(self):
+        obj = TestModel.objects.create(defaults=1)
+        TestModel.objects.update(defaults=Value(fractions.Fraction(1, 3)))
+        obj.refresh_from_db()
+        self.assertEqual(fractions.Fraction(1, 3), obj.defaults)
+
+    def test_get_placeholder(self):
+        field = TestModel._meta.get_field("defaults")
+        self.assertEqual("%s", field.get_placeholder(decimal.Decimal("1.5"), None, connection))
+        self.assertEqual("%s", field.get_placeholder(F("defaults") + 1, None, connection))
+        expression = F("defaults") * fractions.Fraction(3, 2)
+        self.assertEqual("ROUND(%s, 5)", field.get_placeholder(expression, None, connection))
+        self.assertIsInstance(expression.rhs, FractionValue)
+        self.assertEqual("FractionValue(Fraction(3, 2))", repr(expression.rhs))
+        self.assertEqual("FractionValue(Fraction(3, 2))", repr(FractionValue("3/2")))
@@ -0,0 +1,171 @@
+import fractions
+import random
+from decimal import Decimal
+from unittest import mock
+
+from django.apps import apps
+from django.db import NotSupportedError, connection, models
+from django.db.migrations.state import ProjectState
+from django.db.models import ExpressionWrapper, F
+from django.test import TransactionTestCase
+
+from djfractions.models import DecimalFractionField
+from djfractions.operations import VENDOR_MAX_DIGITS, ConvertFractionToIntegers
+
+from .models import FractionToIntegersModel, WideFractionToIntegersModel
+
+
+def get_stored_values(model, max_digits, decimal_places):
+    """
+    Returns the stored decimals by primary key, as Django reads them for a DecimalField, without converting
+    them with the model's DecimalFractionField.
+    """
+    stored = ExpressionWrapper(
+        F("value"), output_field=models.DecimalField(max_digits=max_digits, decimal_places=decimal_places)
+    )
+    return dict(model.objects.annotate(stored=stored).values_list("pk", "stored"))
+
+
+class ConvertFractionToIntegersTest(TransactionTestCase):
+    available_apps = ["djfractions", "tests"]
+
+    def setUp(self):
+        rand = random.Random(1)
+        values = [Decimal("0"), Decimal("0.325"), Decimal("1.335"), Decimal("-0.3333333333"), Decimal("12345.6789")]
+        # exactly half a hundredth from a third, which coerce_to_thirds() rounds up or down depending on
+        # whether the float nearest to the value is above or below it.
+        for whole in range(20):
+            for hundredths in ("295", "305", "325", "335", "595", "605", "665", "675"):
+                values.append(Decimal("%d.%s" % (whole, hundredths)))
+        # decimals which are close to, but not exactly, small fractions
+        for denominator in range(1, 41):
+            for numerator in range(0, denominator * 3):
+                values.append(Decimal(numerator / denominator).quantize(Decimal("1E-10")))
+        for i in range(200):
+            values.append(Decimal(rand.randint(-(10**10), 10**14)).scaleb(-rand.randint(0, 10)))
+        # max_digits=15 and decimal_places=10 leave five digits for the whole number
+        values = [value for value in values if abs(value) < 10**5]
+        values.append(None)
+        FractionToIntegersModel.objects.bulk_create(FractionToIntegersModel(value=value) for value in values)
+        # bulk_create() only sets the primary keys on SQLite from Django 4.0
+        self.values = get_stored_values(FractionToIntegersModel, 15, 10)
+        self.operation = ConvertFractionToIntegers(
+            "FractionToIntegersModel", "value", "numerator", "denominator", batch_size=97
+        )
+
+    def get_state(self, **kwargs):
+        state = ProjectState.from_apps(apps)
+        field = DecimalFractionField(max_digits=15, decimal_places=10, null=True, **kwargs)
+        state.models["tests", "fractiontointegersmodel"].fields["value"] = field
+        return state, field
+
+    def test_forwards_matches_to_fraction(self):
+        for limit_denominator in (None, 3, 10, 16, 1000, 1000000):
+            for coerce_thirds in (True, False):
+                FractionToIntegersModel.objects.update(numerator=None, denominator=None)
+                state, field = self.get_state(limit_denominator=limit_denominator, coerce_thirds=coerce_thirds)
+                with connection.schema_editor() as editor:
+                    self.operation.database_forwards("tests", editor, state, state)
+
+                for pk, numerator, denominator in FractionToIntegersModel.objects.values_list(
+                    "pk", "numerator", "denominator"
+                ):
+                    if self.values[pk] is None:
+                        self.assertIsNone(numerator)
+                        continue
+                    self.assertEqual(
+                        field.to_fraction(self.values[pk]),
+                        fractions.Fraction(numerator, denominator),
+                        "%s with limit_denominator=%s coerce_thirds=%s"
+                        % (self.values[pk], limit_denominator, coerce_thirds),
+                    )
+
+    def test_backwards(self):
+        state, field = self.get_state()
+        with connection.schema_editor() as editor:
+            self.operation.database_forwards("tests", editor, state, state)
+        FractionToIntegersModel.objects.update(value=None)
+        with connection.schema_editor() as editor:
+            self.operation.database_backwards("tests", editor, state, state)
+
+        for obj in FractionToIntegersModel.objects.all():
+            if obj.numerator is None:
+                self.assertIsNone(obj.value)
+            else:
+                self.assertEqual(field.to_fraction(self.values[obj.pk]), obj.value)
+
+    def test_max_digits(self):
+        state, field = self.get_state()
+        field.max_digits = 19
+        with connection.schema_editor() as editor, self.assertNumQueries(0):
+            with self.assertRaises(NotSupportedError):
+                self.operation.database_forwards("tests", editor, state, state)
+        self.assertFalse(FractionToIntegersModel.objects.filter(numerator__isnull=False).exists())
+
+    def test_deconstruct(self):
+        name, args, kwargs = self.operation.deconstruct()
+        self.assertEqual("ConvertFractionToIntegers", name)
+        self.assertEqual(97, kwargs["batch_size"])
+        self.assertEqual("fractiontointegersmodel_value_to_integers", self.operation.migration_name_fragment)
+
+
+class WideConvertFractionToIntegersTest(TransactionTestCase):
+    available_apps = ["djfractions", "tests"]
+
+    def get_values(self, max_digits, decimal_places):
+        rand = random.Random(max_digits)
+        places = Decimal(1).scaleb(-decimal_places)
+        values = [Decimal("1.2345678901234567"), Decimal("0.3333333333333333333"), Decimal("2.665"), Decimal("0")]
+        for i in range(100):
+            values.append(Decimal(rand.randint(-(10**max_digits) + 1, 10**max_digits - 1)).scaleb(-decimal_places))
+        return [value.quantize(places) for value in values]
+
+    def convert(self, max_digits, decimal_places, **kwargs):
+        state = ProjectState.from_apps(apps)
+        field = DecimalFractionField(max_digits=max_digits, decimal_places=decimal_places, null=True, **kwargs)
+        state.models["tests", "widefractiontointegersmodel"].fields["value"] = field
+        operation = ConvertFractionToIntegers("WideFractionToIntegersModel", "value", "numerator", "denominator")
+        with connection.schema_editor() as editor:
+            operation.database_forwards("tests", editor, state, state)
+        return field
+
+    def test_forwards_matches_to_fraction(self):
+        # 10 ** decimal_places * limit_denominator is beyond a BIGINT for all of these
+        for max_digits, decimal_places in ((15, 14), (16, 15), (17, 16), (18, 17)):
+            WideFractionToIntegersModel.objects.all().delete()
+            WideFractionToIntegersModel.objects.bulk_create(
+                WideFractionToIntegersModel(value=value) for value in self.get_values(max_digits, decimal_places)
+            )
+            values = get_stored_values(WideFractionToIntegersModel, max_digits, decimal_places)
+            for limit_denominator, coerce_thirds in ((10**6, True), (10**6, False), (None, False), (3, True)):
+                message = "max_digits=%s decimal_places=%s limit_denominator=%s coerce_thirds=%s" % (
+                    max_digits,
+                    decimal_places,
+                    limit_denominator,
+                    coerce_thirds,
+                )
+                if max_digits > VENDOR_MAX_DIGITS[connection.vendor]:
+                    with self.assertRaises(NotSupportedError, msg=message):
+                        self.convert(max_digits, decimal_places, limit_denominator=limit_denominator)
+                    continue
+
+                WideFractionToIntegersModel.objects.update(numerator=None, denominator=None)
+                field = self.convert(
+                    max_digits, decimal_places, limit_denominator=limit_denominator, coerce_thirds=coerce_thirds
+                )
+                for pk, numerator, denominator in WideFractionToIntegersModel.objects.values_list(
+                    "pk", "numerator", "denominator"
+                ):
+                    self.assertEqual(
+                        field.to_fraction(values[pk]),
+                        fractions.Fraction(numerator, denominator),
+                        "%s with %s" % (values[pk], message),
+                    )
+
+    def test_coerce_thirds_limit(self):
+        # without a limit_denominator the numerators could reach 10 ** 18, beyond an exact double
+        with mock.patch.dict(VENDOR_MAX_DIGITS, {connection.vendor: 18}):
+            with self.assertRaisesMessage(NotSupportedError, "can not apply coerce_thirds"):
+                self.convert(18, 17)
+            with self.assertRaisesMessage(NotSupportedError, "can not apply coerce_thirds"):
+                self.convert(16, 10, limit_denominator=10**10)
@@ -0,0 +1,115 @@
+import fractions
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from django.core import serializers
+from django.core.management import call_command
+from django.http import JsonResponse
+from django.test import TestCase, override_settings
+
+from djfractions.serializers import (
+    FractionJSONDecoder,
+    FractionJSONEncoder,
+    StructuredFractionJSONEncoder,
+    fraction_from_json,
+    fraction_to_json,
+    orjson_default,
+    orjson_structured_default,
+)
+
+from .models import IntegerFractionModel, JSONDataModel, TestModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FractionJSONTest(TestCase):
+    def test_fraction_to_json(self):
+        self.assertEqual("1/3", fraction_to_json(fractions.Fraction(1, 3)))
+        self.assertEqual("-2", fraction_to_json(fractions.Fraction(-2)))
+        self.assertEqual({"numerator": 1, "denominator": 3}, fraction_to_json(fractions.Fraction(1, 3), True))
+
+    def test_fraction_from_json(self):
+        for value in ("1/3", "-5/4", "7", "0.5", {"numerator": 6, "denominator": 8}):
+            self.assertEqual(
+                fractions.Fraction(value) if isinstance(value, str) else fractions.Fraction(3, 4),
+                fraction_from_json(value),
+            )
+        with self.assertRaises(ValueError):
+            fraction_from_json("one third")
+
+    def test_encoders(self):
+        data = {"a": fractions.Fraction(1, 3), "b": [fractions.Fraction(5, 2)], "c": Decimal("1.5")}
+        self.assertEqual('{"a": "1/3", "b": ["5/2"], "c": "1.5"}', json.dumps(data, cls=FractionJSONEncoder))
+        encoded = json.dumps(data, cls=StructuredFractionJSONEncoder)
+        self.assertEqual(
+            {"a": fractions.Fraction(1, 3), "b": [fractions.Fraction(5, 2)], "c": "1.5"},
+            json.loads(encoded, cls=FractionJSONDecoder),
+        )
+
+    def test_json_response(self):
+        response = JsonResponse({"quantity": fractions.Fraction(3, 4)}, encoder=FractionJSONEncoder)
+        self.assertEqual(b'{"quantity": "3/4"}', response.content)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        data = {"a": fractions.Fraction(1, 3), "c": Decimal("1.5")}
+        self.assertEqual(b'{"a":"1/3","c":"1.5"}', orjson.dumps(data, default=orjson_default))
+        self.assertEqual(
+            {"a": fractions.Fraction(1, 3), "c": "1.5"},
+            json.loads(orjson.dumps(data, default=orjson_structured_default), cls=FractionJSONDecoder),
+        )
+        with self.assertRaises(TypeError):
+            orjson.dumps(object(), default=orjson_default)
+
+
+@override_settings(SERIALIZATION_MODULES={"fraction_json": "djfractions.serializers"})
+class SerializerTest(TestCase):
+    def setUp(self):
+        TestModel.objects.create(defaults=fractions.Fraction(1, 2), denominator_limited_to_ten=fractions.Fraction(1, 3))
+
+    def test_round_trip(self):
+        for structured in (False, True):
+            data = serializers.serialize("fraction_json", TestModel.objects.all(), structured_fractions=structured)
+            fields = json.loads(data)[0]["fields"]
+            if structured:
+                self.assertEqual({"numerator": 1, "denominator": 2}, fields["defaults"])
+            else:
+                self.assertEqual("1/2", fields["defaults"])
+            self.assertIsNone(fields["coerce_thirds_true"])
+
+            obj = list(serializers.deserialize("fraction_json", data))[0].object
+            self.assertEqual(fractions.Fraction(1, 2), obj.defaults)
+            self.assertEqual(fractions.Fraction(1, 3), obj.denominator_limited_to_ten)
+            self.assertIsNone(obj.coerce_thirds_true)
+
+    def test_reads_django_json(self):
+        data = serializers.serialize("json", TestModel.objects.all())
+        obj = list(serializers.deserialize("fraction_json", data))[0].object
+        self.assertEqual(fractions.Fraction(1, 2), obj.defaults)
+
+    def test_loaddata_other_fields(self):
+        """
+        Test that only fraction fields are decoded, not other objects which have numerator and denominator keys
+        """
+        IntegerFractionModel.objects.create(numerator=3, denominator=4)
+        JSONDataModel.objects.create(data={"numerator": 1, "denominator": 2})
+        querysets = [TestModel.objects.all(), IntegerFractionModel.objects.all(), JSONDataModel.objects.all()]
+        objects = [obj for queryset in querysets for obj in queryset]
+        data = serializers.serialize("fraction_json", objects, structured_fractions=True)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "fixture.fraction_json")
+            with open(path, "w") as fixture:
+                fixture.write(data)
+            for model in (TestModel, IntegerFractionModel, JSONDataModel):
+                model.objects.all().delete()
+            call_command("loaddata", path, verbosity=0)
+
+        self.assertEqual(fractions.Fraction(1, 2), TestModel.objects.get().defaults)
+        self.assertEqual((3, 4), IntegerFractionModel.objects.values_list("numerator", "denominator").get())
+        self.assertEqual({"numerator": 1, "denominator": 2}, JSONDataModel.objects.get().data)
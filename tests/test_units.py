@@ -0,0 +1,58 @@
+import fractions
+import re
+
+from django.test import TestCase
+
+from djfractions import ParseLimits
+from djfractions.exceptions import InvalidFractionString, ParseLimitExceeded
+from djfractions.units import UnitQuantity, UnitRegistry, _trie_pattern, unit_registry
+
+
+class UnitRegistryTest(TestCase):
+    def test_parse(self):
+        for text, value, unit, rest in (
+            ("1 1/2 cups flour", fractions.Fraction(3, 2), "cup", "flour"),
+            ("2-1/4 tbsp. sugar", fractions.Fraction(9, 4), "tablespoon", "sugar"),
+            ("3/4 lb ground beef", fractions.Fraction(3, 4), "pound", "ground beef"),
+            ("1 and 1/2 Cups milk", fractions.Fraction(3, 2), "cup", "milk"),
+            ("  .5 TSP salt", fractions.Fraction(1, 2), "teaspoon", "salt"),
+            ("12 fl oz water", 12, "fluid ounce", "water"),
+            ("250g butter", 250, "gram", "butter"),
+            ("2 pinches salt", 2, "pinch", "salt"),
+            ("2 eggs", 2, None, "eggs"),
+            ("1 cupcake", 1, None, "cupcake"),
+            ("1\u00bd cups flour", fractions.Fraction(3, 2), "cup", "flour"),
+            ("\u00be tsp salt", fractions.Fraction(3, 4), "teaspoon", "salt"),
+        ):
+            result = unit_registry.parse(text)
+            self.assertEqual((value, unit), (result.value, result.unit), text)
+            self.assertEqual(rest, text[result.end :])
+
+    def test_invalid(self):
+        for text in ("cups of flour", "1/0 cup", "1/2/2024 cup", ""):
+            self.assertIsNone(unit_registry.try_parse(text))
+            with self.assertRaises(InvalidFractionString):
+                unit_registry.parse(text)
+
+        self.assertIsNone(unit_registry.try_parse("1/" + "9" * 40 + " cups"))
+        with self.assertRaises(ParseLimitExceeded):
+            unit_registry.parse("1/" + "9" * 40 + " cups")
+        with self.assertRaises(ParseLimitExceeded):
+            unit_registry.parse("1/32 cup", limits=ParseLimits(max_denominator=16))
+
+    def test_registry(self):
+        registry = UnitRegistry({"stick": ["stk"]})
+        self.assertEqual(UnitQuantity(fractions.Fraction(1, 2), "stick", 11), registry.parse("1/2 sticks butter"))
+        self.assertIsNone(registry.parse("1 cup").unit)
+        registry.add("cup", ["c"])
+        self.assertEqual("cup", registry.parse("1 C. sugar").unit)
+        self.assertEqual({"stick", "cup"}, set(registry.units.values()))
+
+        self.assertIsNone(UnitRegistry({"pinch": []}, plurals=False).parse("2 pinches").unit)
+
+    def test_trie_pattern(self):
+        words = ["tbsp", "tbsps", "tbs", "tsp", "t", "fl. oz"]
+        pattern = re.compile(_trie_pattern(words))
+        for word in words:
+            self.assertEqual(word, pattern.fullmatch(word).group())
+        self.assertIsNone(pattern.fullmatch("tb"))
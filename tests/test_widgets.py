@@ -0,0 +1,72 @@
+import fractions
+from decimal import Decimal
+
+from django import forms
+from django.test import TestCase
+from django.utils import translation
+
+from djfractions import ParseLimits
+from djfractions.forms import DecimalFractionField, FractionField
+from djfractions.widgets import FractionInput
+
+
+class QuantityForm(forms.Form):
+    quantity = FractionField(widget=FractionInput, required=False)
+    amount = DecimalFractionField(widget=FractionInput, required=False)
+    small = FractionField(widget=FractionInput, required=False, parse_limits=ParseLimits(max_denominator=16))
+    localized = FractionField(widget=FractionInput, required=False, localize=True)
+    price = DecimalFractionField(widget=FractionInput, required=False, max_digits=5, decimal_places=2)
+
+
+class FractionInputTest(TestCase):
+    def test_render(self):
+        html = QuantityForm(initial={"quantity": fractions.Fraction(3, 2)})["quantity"].as_widget()
+        self.assertInHTML('<input type="hidden" name="quantity_canonical" value="" disabled>', html, count=1)
+        self.assertIn('value="1 1/2"', html)
+        self.assertIn('data-djfractions-input="quantity_canonical"', html)
+        self.assertIn('data-djfractions-max-denominator="1000000000000"', html)
+        self.assertIn('data-djfractions-invalid-message="Enter a fraction such as 1 1/4 or 1/4."', html)
+        self.assertIn('data-djfractions-max-denominator="16"', QuantityForm()["small"].as_widget())
+        self.assertIn("js/djfractions.js", str(QuantityForm().media))
+
+    def test_canonical_value(self):
+        form = QuantityForm(
+            data={"quantity": "1 and 1/2", "quantity_canonical": "3/2", "amount": "1/4", "amount_canonical": "1/4"}
+        )
+        self.assertTrue(form.is_valid())
+        self.assertEqual(fractions.Fraction(3, 2), form.cleaned_data["quantity"])
+        self.assertEqual(Decimal("0.25"), form.cleaned_data["amount"])
+
+    def test_canonical_decimal_value(self):
+        # javascript would send 0.1 as 1/10, which only cleans to the decimal that was typed through a float
+        html = QuantityForm()["price"].as_widget()
+        self.assertIn('data-djfractions-input="price_canonical"', html)
+        self.assertNotIn('name="price_canonical"', html)
+        form = QuantityForm(
+            data={"amount": "0.1", "amount_canonical": "1/10", "price": "-12.35", "price_canonical": "-247/20"}
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual("0.1", str(form.cleaned_data["amount"]))
+        self.assertEqual(Decimal("-12.35"), form.cleaned_data["price"])
+
+    def test_without_canonical_value(self):
+        # the hidden input is disabled, and so not submitted, when javascript did not parse the value
+        form = QuantityForm(data={"quantity": "1 and 1/2", "amount": ".25"})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(fractions.Fraction(3, 2), form.cleaned_data["quantity"])
+        self.assertEqual(Decimal("0.25"), form.cleaned_data["amount"])
+
+    def test_invalid_canonical_value(self):
+        form = QuantityForm(data={"quantity_canonical": "1/0", "small_canonical": "1/32"})
+        self.assertFalse(form.is_valid())
+        self.assertEqual("invalid", form.errors.as_data()["quantity"][0].code)
+        self.assertEqual("parse_max_denominator", form.errors.as_data()["small"][0].code)
+
+    def test_localized(self):
+        # the browser cannot parse "1,5" in French, so the server does, and ignores any canonical value
+        self.assertIn("data-djfractions-localized", QuantityForm()["localized"].as_widget())
+        self.assertNotIn("data-djfractions-localized", QuantityForm()["quantity"].as_widget())
+        with translation.override("fr"):
+            form = QuantityForm(data={"localized": "1,5", "localized_canonical": "3/2000"})
+            self.assertTrue(form.is_valid())
+        self.assertEqual(fractions.Fraction(3, 2), form.cleaned_data["localized"])